@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Backend(object):
+    """
+    Selects the engine used by Matrix, Vector and Tensor for their heavy arithmetic. With the numpy backend the
+    operations are delegated to ndarray operations, with the python backend the pure Python implementations are used.
+    The auto backend uses numpy when it can be imported and the operands are large enough, AUTO_MINIMUM_SIZE
+    items, for the conversion to ndarrays to pay off. The initial choice is read from the
+    NLPTOOLKIT_MATH_BACKEND environment variable and can be changed later with setBackend.
+    """
+    PYTHON = "python"
+    NUMPY = "numpy"
+    AUTO = "auto"
+    ENVIRONMENT_VARIABLE = "NLPTOOLKIT_MATH_BACKEND"
+    AUTO_MINIMUM_SIZE = 32
+
+    __backend: str = os.environ.get(ENVIRONMENT_VARIABLE, AUTO).strip().lower()
+    if __backend not in (PYTHON, NUMPY, AUTO):
+        __backend = AUTO
+
+    @staticmethod
+    def setBackend(backend: str):
+        """
+        Sets the backend used for the arithmetic operations.
+
+        PARAMETERS
+        ----------
+        backend : str
+            One of Backend.PYTHON, Backend.NUMPY or Backend.AUTO.
+        """
+        backend = backend.strip().lower()
+        if backend not in (Backend.PYTHON, Backend.NUMPY, Backend.AUTO):
+            raise ValueError(f"Unknown backend {backend}, expected one of python, numpy or auto.")
+        Backend.__backend = backend
+
+    @staticmethod
+    def getBackend() -> str:
+        """
+        Getter for the selected backend.
+
+        RETURNS
+        -------
+        str
+            The selected backend, one of Backend.PYTHON, Backend.NUMPY or Backend.AUTO.
+        """
+        return Backend.__backend
+
+    @staticmethod
+    def isNumpyAvailable() -> bool:
+        """
+        Checks if numpy can be imported.
+
+        RETURNS
+        -------
+        bool
+            True if numpy is installed, false otherwise.
+        """
+        return numpy is not None
+
+    @staticmethod
+    def useNumpy(size: int = None,
+                 minimumSize: int = None) -> bool:
+        """
+        Checks if the arithmetic operations should be delegated to numpy. If numpy is selected but not installed, the
+        pure Python implementations are used. With the auto backend, operations on fewer than minimumSize items stay
+        in Python, where they are faster than converting their operands to ndarrays, and operations that give no
+        size, such as Vector.dotProduct whose conversion costs more than numpy saves at any size, always do.
+
+        PARAMETERS
+        ----------
+        size : int
+            Number of items in the operands of the operation, None if delegating it only pays off when numpy is
+            selected explicitly.
+        minimumSize : int
+            Size from which the operation is faster with numpy, if None AUTO_MINIMUM_SIZE.
+
+        RETURNS
+        -------
+        bool
+            True if numpy is installed and either Backend.NUMPY is selected, or Backend.AUTO is selected and the size
+            is at least minimumSize; false otherwise.
+        """
+        if numpy is None or Backend.__backend == Backend.PYTHON:
+            return False
+        if Backend.__backend == Backend.NUMPY:
+            return True
+        if minimumSize is None:
+            minimumSize = Backend.AUTO_MINIMUM_SIZE
+        return size is not None and size >= minimumSize
+
+    @staticmethod
+    def getNumpy():
+        """
+        Getter for the numpy module.
+
+        RETURNS
+        -------
+        module
+            The numpy module, or None if it is not installed.
+        """
+        return numpy
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import math
+import operator
+
+from Math.Matrix import Matrix
+from Math.MatrixNotPositiveDefinite import MatrixNotPositiveDefinite
+from Math.MatrixNotSquare import MatrixNotSquare
+from Math.MatrixRowMismatch import MatrixRowMismatch
+from Math.Vector import Vector
+
+
+class CholeskyDecomposition(object):
+    """
+    Cholesky factorization, A = L * L^T, of a symmetric positive definite matrix. The factor is kept as the rows of
+    R = L^T, that is, as the columns of L, since both the factorization and the rank one updates sweep the columns of
+    L. Once factorized, the decomposition can be reused to solve linear systems in O(n^2) per right hand side, to find
+    the log determinant, and it can follow rank one changes A +- v * v^T of the matrix in O(n^2) instead of a new
+    O(n^3) factorization.
+    """
+    __size: int
+    __rows: list
+
+    def __init__(self, matrix: Matrix):
+        """
+        Constructor of CholeskyDecomposition class which factorizes the given matrix. Only the upper triangle of the
+        matrix is read, so symmetry is not checked. It throws MatrixNotPositiveDefinite exception if a pivot is not
+        positive. The given matrix is not modified.
+
+        PARAMETERS
+        ----------
+        matrix : Matrix
+            Symmetric positive definite matrix to factorize.
+        """
+        if matrix.getRow() != matrix.getColumn():
+            raise MatrixNotSquare
+        n = matrix.getRow()
+        self.__size = n
+        rows = [[0.0] * i + [matrix.getValue(i, j) for j in range(i, n)] for i in range(n)]
+        for k in range(n):
+            pivot = rows[k][k]
+            if pivot <= 0.0:
+                raise MatrixNotPositiveDefinite
+            diagonal = math.sqrt(pivot)
+            row = [x / diagonal for x in rows[k][k:]]
+            rows[k][k:] = row
+            for j in range(k + 1, n):
+                factor = row[j - k]
+                if factor != 0.0:
+                    rows[j][j:] = [x - factor * y for x, y in zip(rows[j][j:], row[j - k:])]
+        self.__rows = rows
+
+    def getLower(self) -> Matrix:
+        """
+        Returns the lower triangular factor L.
+
+        RETURNS
+        -------
+        Matrix
+            Lower triangular factor.
+        """
+        n = self.__size
+        result = Matrix(n, n)
+        for j in range(n):
+            for i in range(j, n):
+                result.setValue(i, j, self.__rows[j][i])
+        return result
+
+    def logDeterminant(self) -> float:
+        """
+        Computes the natural logarithm of the determinant of the factorized matrix as twice the sum of the logarithms
+        of the diagonal of L. Unlike the determinant itself, it neither overflows nor underflows for large matrices.
+
+        RETURNS
+        -------
+        float
+            Logarithm of the determinant of the factorized matrix.
+        """
+        return 2.0 * sum(math.log(self.__rows[i][i]) for i in range(self.__size))
+
+    def __solveValues(self, values: list) -> list:
+        """
+        Solves L * L^T * x = b, forward substituting with L column by column and back substituting with L^T row by
+        row.
+
+        PARAMETERS
+        ----------
+        values : list
+            Items of b.
+
+        RETURNS
+        -------
+        list
+            Items of x.
+        """
+        n = self.__size
+        rows = self.__rows
+        y = values
+        for i in range(n):
+            y[i] /= rows[i][i]
+            if y[i] != 0.0:
+                factor = y[i]
+                y[i + 1:] = [x - factor * z for x, z in zip(y[i + 1:], rows[i][i + 1:])]
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - sum(map(operator.mul, rows[i][i + 1:], y[i + 1:]))) / rows[i][i]
+        return y
+
+    def solve(self, b: Vector) -> Vector:
+        """
+        Solves the linear system A * x = b for x, reusing the factorization.
+
+        PARAMETERS
+        ----------
+        b : Vector
+            Right hand side of the system.
+
+        RETURNS
+        -------
+        Vector
+            Solution x of the system.
+        """
+        if b.size() != self.__size:
+            raise MatrixRowMismatch
+        return Vector(self.__solveValues([b.getValue(i) for i in range(self.__size)]))
+
+    def solveMany(self, b: Matrix) -> Matrix:
+        """
+        Solves the linear systems A * X = B for X, each column of B being a separate right hand side.
+
+        PARAMETERS
+        ----------
+        b : Matrix
+            Right hand sides of the systems as columns.
+
+        RETURNS
+        -------
+        Matrix
+            Solutions of the systems as columns.
+        """
+        n = self.__size
+        if b.getRow() != n:
+            raise MatrixRowMismatch
+        result = Matrix(n, b.getColumn())
+        for j in range(b.getColumn()):
+            x = self.__solveValues([b.getValue(i, j) for i in range(n)])
+            for i in range(n):
+                result.setValue(i, j, x[i])
+        return result
+
+    def __rankOne(self,
+                  v: Vector,
+                  sign: float):
+        """
+        Changes the factorization to the one of A + sign * v * v^T. Column k of L and the remaining items of v are
+        combined with a rotation (hyperbolic for a downdate) that keeps the k'th diagonal item positive, so every
+        column costs one list operation over its items below the diagonal. The new columns are built aside and only
+        stored once all of them are found, so a failed downdate leaves the factorization unchanged.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector of the rank one change.
+        sign : float
+            1 for an update, -1 for a downdate.
+        """
+        n = self.__size
+        if v.size() != n:
+            raise MatrixRowMismatch
+        x = [v.getValue(i) for i in range(n)]
+        rows = []
+        for k in range(n):
+            row = self.__rows[k]
+            diagonal = row[k]
+            square = diagonal * diagonal + sign * x[k] * x[k]
+            if square <= 0.0:
+                raise MatrixNotPositiveDefinite
+            r = math.sqrt(square)
+            c = r / diagonal
+            s = x[k] / diagonal
+            column = [(a + sign * s * b) / c for a, b in zip(row[k + 1:], x[k + 1:])]
+            x[k + 1:] = [c * b - s * a for a, b in zip(column, x[k + 1:])]
+            rows.append(row[:k] + [r] + column)
+        self.__rows = rows
+
+    def update(self, v: Vector):
+        """
+        The update method changes the factorization to the one of A + v * v^T in O(n^2), for example when a sample is
+        added to a scatter matrix. To add a weighted sample w * v * v^T, update with sqrt(w) * v.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector of the rank one update.
+        """
+        self.__rankOne(v, 1.0)
+
+    def downdate(self, v: Vector):
+        """
+        The downdate method changes the factorization to the one of A - v * v^T in O(n^2), for example when a sample
+        is removed from a scatter matrix. It throws MatrixNotPositiveDefinite exception if A - v * v^T is not positive
+        definite, in which case the factorization is not changed.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector of the rank one downdate.
+        """
+        self.__rankOne(v, -1.0)
@@ -1,18 +1,151 @@
 from __future__ import annotations
 import collections
+import collections.abc
+import heapq
 import math
 
 
 class DiscreteDistribution(collections.OrderedDict):
-
+    """
+    Counts of items, kept in insertion order. The positions of the items are kept in an index (a list of the items
+    and a map from items to their positions), built on the first index based access and then updated as new items
+    are added, so getIndex, getItem and getValue are O(1). Removing an item shifts the positions of the items after
+    it, so a removal marks the index stale and it is rebuilt on the next index based access.
+
+    Optionally (see enableMaximumTracking), the counts are also kept in a max heap, so getMaxItem and topK do not scan
+    every item after each update.
+    """
     __sum: float
+    __items: list
+    __indexes: dict
+    __heap: list
+    __serials: dict
+    __serial: int
 
-    def __init__(self, **kwargs):
+    def __init__(self, items=None, **kwargs):
         """
-        A constructor of DiscreteDistribution class which calls its super class.
+        A constructor of DiscreteDistribution class which calls its super class. If items are given, they are counted
+        in bulk: a mapping is added with addCounts, any other iterable with addItems.
+
+        PARAMETERS
+        ----------
+        items
+            Iterable of items to count, or a mapping from items to counts.
         """
         super().__init__(**kwargs)
         self.__sum = 0.0
+        self.__items = None
+        self.__indexes = None
+        self.__heap = None
+        self.__serials = None
+        self.__serial = 0
+        if items is not None:
+            if isinstance(items, collections.abc.Mapping):
+                self.addCounts(items)
+            else:
+                self.addItems(items)
+
+    def __positionIndex(self) -> list:
+        """
+        Returns the list of items in insertion order, rebuilding the position index if it is stale.
+
+        RETURNS
+        -------
+        list
+            the items in insertion order.
+        """
+        if self.__items is None or len(self.__items) != len(self):
+            self.__items = list(self.keys())
+            self.__indexes = {item: index for index, item in enumerate(self.__items)}
+        return self.__items
+
+    def __newItem(self, item):
+        """
+        Appends a newly inserted item to the position index, if the index is built, and gives it the next insertion
+        serial, if the maximum is tracked.
+        """
+        if self.__items is not None:
+            self.__indexes[item] = len(self.__items)
+            self.__items.append(item)
+        if self.__heap is not None:
+            self.__serials[item] = self.__serial
+            self.__serial = self.__serial + 1
+
+    def __buildHeap(self):
+        """
+        Rebuilds the heap from the current counts, dropping the outdated entries and the serials of removed items.
+        Items set directly, without a serial, get the next serials.
+        """
+        serials = {}
+        for item in self:
+            if item in self.__serials:
+                serials[item] = self.__serials[item]
+            else:
+                serials[item] = self.__serial
+                self.__serial = self.__serial + 1
+        self.__serials = serials
+        self.__heap = [(-count, self.__serials[item], item) for item, count in self.items()]
+        heapq.heapify(self.__heap)
+
+    def __track(self, item):
+        """
+        Pushes the current count of the given item to the heap. The entries pushed for its older counts stay in the
+        heap and are skipped when they reach the top; once most of the heap is outdated it is rebuilt.
+        """
+        heapq.heappush(self.__heap, (-self[item], self.__serials[item], item))
+        if len(self.__heap) > 2 * len(self) + 64:
+            self.__buildHeap()
+
+    def __isCurrent(self, entry: tuple) -> bool:
+        """
+        Checks if the given heap entry holds the current count of its item.
+        """
+        count, serial, item = entry
+        return item in self and self[item] == -count and self.__serials[item] == serial
+
+    def enableMaximumTracking(self, enabled: bool = True):
+        """
+        Enables or disables tracking the maximum. When enabled, every count change made by addItem, removeItem,
+        addDistribution and removeDistribution is pushed to a max heap ordered by count and then by insertion order,
+        so getMaxItem is amortized O(log n) and topK(k) is O(k log k) instead of a scan over all items. Counts set
+        directly, not through these methods, are not tracked.
+
+        PARAMETERS
+        ----------
+        enabled : bool
+            True to keep the heap up to date, False to drop it.
+        """
+        if enabled:
+            self.__serials = {}
+            self.__serial = 0
+            self.__buildHeap()
+        else:
+            self.__heap = None
+            self.__serials = None
+
+    def __delitem__(self, item):
+        super().__delitem__(item)
+        self.__items = None
+
+    def pop(self, item, *default):
+        self.__items = None
+        return super().pop(item, *default)
+
+    def popitem(self, last: bool = True):
+        self.__items = None
+        return super().popitem(last)
+
+    def move_to_end(self, item, last: bool = True):
+        self.__items = None
+        super().move_to_end(item, last)
+        if self.__heap is not None:
+            self.enableMaximumTracking()
+
+    def clear(self):
+        self.__items = None
+        super().clear()
+        if self.__heap is not None:
+            self.enableMaximumTracking()
 
     def addItem(self, item: str):
         """
@@ -28,8 +161,60 @@ class DiscreteDistribution(collections.OrderedDict):
             self[item] = self[item] + 1
         else:
             self[item] = 1
+            self.__newItem(item)
+        if self.__heap is not None:
+            self.__track(item)
         self.__sum = self.__sum + 1
 
+    def addItems(self, items):
+        """
+        The addItems method counts every item of the given iterable, as if addItem were called for each of them, in
+        the order they come. The items are first counted with collections.Counter, whose counting loop runs in C, and
+        the counts are then added with addCounts, so the distribution is updated once per distinct item.
+
+        PARAMETERS
+        ----------
+        items
+            Iterable of items, consumed once.
+        """
+        self.addCounts(collections.Counter(items))
+
+    def addCounts(self, counts):
+        """
+        The addCounts method takes a mapping from items to counts and adds each count to the count of its item, new
+        items being inserted in the order of the mapping. The sum is updated once at the end.
+
+        PARAMETERS
+        ----------
+        counts
+            Mapping from items to counts.
+        """
+        if self.__items is None and self.__heap is None:
+            get = self.get
+            for item, count in counts.items():
+                self[item] = get(item, 0) + count
+        else:
+            for item, count in counts.items():
+                if item in self:
+                    self[item] = self[item] + count
+                else:
+                    self[item] = count
+                    self.__newItem(item)
+                if self.__heap is not None:
+                    self.__track(item)
+        self.__sum += sum(counts.values())
+
+    def copy(self) -> DiscreteDistribution:
+        """
+        Returns a copy of the distribution, with the same counts in the same order and the same sum.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            copy of the distribution.
+        """
+        return self.__class__(self)
+
     def removeItem(self, item: str):
         """
         The removeItem method takes a String item as an input and if this map contains a mapping for the item it puts
@@ -44,6 +229,8 @@ class DiscreteDistribution(collections.OrderedDict):
             self[item] = self[item] - 1
             if self[item] == 0:
                 self.pop(item)
+            elif self.__heap is not None:
+                self.__track(item)
             self.__sum = self.__sum - 1
 
     def addDistribution(self, distribution: DiscreteDistribution):
@@ -57,12 +244,7 @@ class DiscreteDistribution(collections.OrderedDict):
         distribution : DiscreteDistribution
             DiscreteDistribution type input.
         """
-        for entry in distribution:
-            if entry in self:
-                self[entry] = self[entry] + distribution[entry]
-            else:
-                self[entry] = distribution[entry]
-            self.__sum += distribution[entry]
+        self.addCounts(distribution)
 
     def removeDistribution(self, distribution: DiscreteDistribution):
         """
@@ -78,6 +260,8 @@ class DiscreteDistribution(collections.OrderedDict):
         for entry in distribution:
             if self[entry] - distribution[entry] != 0:
                 self[entry] -= distribution[entry]
+                if self.__heap is not None:
+                    self.__track(entry)
             else:
                 self.pop(entry)
             self.__sum -= distribution[entry]
@@ -95,7 +279,8 @@ class DiscreteDistribution(collections.OrderedDict):
 
     def getIndex(self, item: str) -> int:
         """
-        The getIndex method takes an item as an input and returns the index of given item.
+        The getIndex method takes an item as an input and returns the index of given item. If the item is not in the
+        distribution, it throws ValueError.
 
         PARAMETERS
         ----------
@@ -107,7 +292,11 @@ class DiscreteDistribution(collections.OrderedDict):
         int
             index of given item.
         """
-        return list(self.keys()).index(item)
+        self.__positionIndex()
+        index = self.__indexes.get(item)
+        if index is None:
+            raise ValueError(f"{item} is not in the distribution")
+        return index
 
     def containsItem(self, item: str) -> bool:
         """
@@ -140,7 +329,7 @@ class DiscreteDistribution(collections.OrderedDict):
         string
             the item at given index.
         """
-        return list(self.keys())[index]
+        return self.__positionIndex()[index]
 
     def getValue(self, index: int) -> int:
         """
@@ -156,7 +345,7 @@ class DiscreteDistribution(collections.OrderedDict):
         int
             the value at given index.
         """
-        return list(self.values())[index]
+        return self[self.__positionIndex()[index]]
 
     def getCount(self, item: str) -> int:
         """
@@ -176,13 +365,18 @@ class DiscreteDistribution(collections.OrderedDict):
 
     def getMaxItem(self) -> str:
         """
-        The getMaxItem method loops through the entries and gets the entry with maximum value.
+        The getMaxItem method loops through the entries and gets the entry with maximum value. If the maximum is
+        tracked, the outdated entries on top of the heap are popped and the entry left on top is returned instead.
 
         RETURNS
         -------
         string
             the entry with maximum value.
         """
+        if self.__heap is not None:
+            while len(self.__heap) > 0 and not self.__isCurrent(self.__heap[0]):
+                heapq.heappop(self.__heap)
+            return self.__heap[0][2] if len(self.__heap) > 0 else ""
         maxValue = -1
         maxItem = ""
         for item in self:
@@ -191,6 +385,40 @@ class DiscreteDistribution(collections.OrderedDict):
                 maxItem = item
         return maxItem
 
+    def topK(self, k: int) -> list:
+        """
+        The topK method returns the k items with the largest counts, ties broken by insertion order. If the maximum
+        is tracked, the heap is walked from its top, otherwise the k largest are selected from all entries.
+
+        PARAMETERS
+        ----------
+        k : int
+            number of items to return.
+
+        RETURNS
+        -------
+        list
+            list of at most k (item, count) tuples, the largest count first.
+        """
+        if k <= 0:
+            return []
+        if self.__heap is None:
+            best = heapq.nsmallest(k, ((-count, serial, item) for serial, (item, count) in enumerate(self.items())))
+            return [(item, -count) for count, _, item in best]
+        heap = self.__heap
+        result = []
+        found = set()
+        frontier = [(heap[0], 0)] if len(heap) > 0 else []
+        while len(frontier) > 0 and len(result) < k:
+            entry, position = heapq.heappop(frontier)
+            if entry[2] not in found and self.__isCurrent(entry):
+                found.add(entry[2])
+                result.append((entry[2], -entry[0]))
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
     def getMaxItemIncludeTheseOnly(self, includeTheseOnly: list) -> str:
         """
         Another getMaxItem method which takes a list of Strings. It loops through the items in this list
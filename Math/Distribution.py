@@ -1,4 +1,9 @@
 import math
+import numbers
+from collections import OrderedDict
+
+from Math.Backend import Backend
+from Math.Vector import Vector
 
 
 class Distribution(object):
@@ -12,6 +17,18 @@ class Distribution(object):
     I_PI = 0.3183098861837906715377675
     F_EPSILON = 0.000001
     F_MAX = 9999.0
+    MAX_ITERATIONS = 100
+    CACHE_SIZE = 4096
+    NUMPY_MINIMUM_SIZE = 256
+    TABLE_PROBABILITIES = (0.1, 0.05, 0.025, 0.01, 0.005, 0.001)
+    TABLE_MAX_FREEDOM = 1000
+    __iterations: int = 0
+    __cache: OrderedDict = OrderedDict()
+    __hits: int = 0
+    __misses: int = 0
+    __tableHits: int = 0
+    __tablesEnabled: bool = False
+    __tables: dict = {}
 
     @staticmethod
     def __ex(x: float) -> float:
@@ -127,9 +144,112 @@ class Distribution(object):
             return (1.0 - x) * 0.5
 
     @staticmethod
-    def zInverse(p: float) -> float:
+    def __cached(key: tuple, compute):
+        """
+        Returns the value of an inverse function call. The key starts with the name of the inverse function, followed
+        by its arguments. If critical value tables are enabled and the call asks for a tabulated probability and an
+        integral degree of freedom with the default tolerance, the value is read from the table, which is computed on
+        first use. Otherwise the value is looked up in a least recently used cache of CACHE_SIZE entries, and computed
+        and stored on a miss.
+        """
+        if Distribution.__tablesEnabled and key[0] in ("chiSquare", "t") and \
+                key[1] in Distribution.TABLE_PROBABILITIES and 1 <= key[2] <= Distribution.TABLE_MAX_FREEDOM and \
+                float(key[2]).is_integer() and \
+                key[3] == (Distribution.CHI_EPSILON if key[0] == "chiSquare" else Distribution.F_EPSILON):
+            table = Distribution.__tables.get(key[:2])
+            if table is None:
+                table = Distribution.__criticalValues(key[0], key[1], key[3])
+                Distribution.__tables[key[:2]] = table
+            Distribution.__tableHits += 1
+            Distribution.__iterations = 0
+            return table[int(key[2]) - 1]
+        cache = Distribution.__cache
+        if key in cache:
+            cache.move_to_end(key)
+            Distribution.__hits += 1
+            Distribution.__iterations = 0
+            return cache[key]
+        Distribution.__misses += 1
+        value = compute()
+        cache[key] = value
+        if len(cache) > Distribution.CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def __criticalValues(name: str,
+                         p: float,
+                         tolerance: float) -> list:
+        """
+        Computes the critical values of chiSquareInverse or tDistributionInverse at the given probability for the
+        degrees of freedom 1 to TABLE_MAX_FREEDOM.
+        """
+        if name == "chiSquare":
+            return [Distribution.__chiSquareInverse(p, freedom, tolerance)
+                    for freedom in range(1, Distribution.TABLE_MAX_FREEDOM + 1)]
+        return [Distribution.__tDistributionInverse(p, freedom, tolerance)
+                for freedom in range(1, Distribution.TABLE_MAX_FREEDOM + 1)]
+
+    @staticmethod
+    def enableCriticalValueTables(enabled: bool = True):
+        """
+        Enables or disables the critical value tables of chiSquareInverse and tDistributionInverse. When enabled, the
+        first call at one of the TABLE_PROBABILITIES computes the critical values for all degrees of freedom from 1 to
+        TABLE_MAX_FREEDOM at that probability, and later calls at that probability are table lookups.
+
+        PARAMETERS
+        ----------
+        enabled : bool
+            True to use the tables, false to use only the cache.
+        """
+        Distribution.__tablesEnabled = enabled
+
+    @staticmethod
+    def getCacheStatistics() -> dict:
+        """
+        Returns the counters of the inverse function cache.
+
+        RETURNS
+        -------
+        dict
+            Map with the number of cache hits (hits), cache misses (misses), critical value table lookups
+            (tableHits), cached values (size) and computed critical value tables (tables).
+        """
+        return {"hits": Distribution.__hits,
+                "misses": Distribution.__misses,
+                "tableHits": Distribution.__tableHits,
+                "size": len(Distribution.__cache),
+                "tables": len(Distribution.__tables)}
+
+    @staticmethod
+    def clearCache():
+        """
+        Empties the inverse function cache and the critical value tables, and resets the counters.
+        """
+        Distribution.__cache.clear()
+        Distribution.__tables.clear()
+        Distribution.__hits = 0
+        Distribution.__misses = 0
+        Distribution.__tableHits = 0
+
+    @staticmethod
+    def getIterationCount() -> int:
         """
-        The zInverse method returns the Z-Inverse of given probability value.
+        Returns the number of iterations, each one evaluating the forward distribution function once, made by the last
+        call to zInverse, chiSquareInverse, fDistributionInverse or tDistributionInverse.
+
+        RETURNS
+        -------
+        int
+            number of iterations of the last inverse call.
+        """
+        return Distribution.__iterations
+
+    @staticmethod
+    def __acklam(p: float) -> float:
+        """
+        The acklam method returns Acklam's rational approximation of the standard normal quantile, with a relative
+        error below 1.15e-9 for 0 < p < 1.
 
         PARAMETERS
         ----------
@@ -139,21 +259,120 @@ class Distribution(object):
         RETURNS
         -------
         double
-            the Z-Inverse of given probability.
+            approximate z such that the standard normal distribution function at z is p.
+        """
+        if 0.02425 <= p <= 0.97575:
+            q = p - 0.5
+            r = q * q
+            return (((((-3.969683028665376e+01 * r + 2.209460984245205e+02) * r - 2.759285104469687e+02) * r
+                      + 1.383577518672690e+02) * r - 3.066479806614716e+01) * r + 2.506628277459239e+00) * q / \
+                (((((-5.447609879822406e+01 * r + 1.615858368580409e+02) * r - 1.556989798598866e+02) * r
+                   + 6.680131188771972e+01) * r - 1.328068155288572e+01) * r + 1.0)
+        if p < 0.02425:
+            q = math.sqrt(-2.0 * math.log(p))
+            sign = 1.0
+        else:
+            q = math.sqrt(-2.0 * math.log(1.0 - p))
+            sign = -1.0
+        return sign * (((((-7.784894002430293e-03 * q - 3.223964580411365e-01) * q - 2.400758277161838e+00) * q
+                         - 2.549732539343734e+00) * q + 4.374664141464968e+00) * q + 2.938163982698783e+00) / \
+            ((((7.784695709041462e-03 * q + 3.224671290700398e-01) * q + 2.445134137142996e+00) * q
+              + 3.754408661907416e+00) * q + 1.0)
+
+    @staticmethod
+    def __newton(upperTail,
+                 density,
+                 p: float,
+                 x: float,
+                 lower: float,
+                 upper: float,
+                 tolerance: float) -> float:
+        """
+        Solves upperTail(x) = p for a decreasing upperTail with Newton's method, the derivative of upperTail being
+        -density(x). The root is kept bracketed in [lower, upper]; a Newton step leaving the bracket is replaced by
+        halving the distance to the violated bound, or by doubling x if that is a smaller move upwards. The number of
+        iterations is stored for getIterationCount.
+
+        PARAMETERS
+        ----------
+        upperTail : function
+            decreasing function of x.
+        density : function
+            negative derivative of upperTail.
+        p : double
+            target value of upperTail.
+        x : double
+            initial guess.
+        lower : double
+            lower bound of the root.
+        upper : double
+            upper bound of the root.
+        tolerance : double
+            iteration stops when a step is not larger than tolerance.
+
+        RETURNS
+        -------
+        double
+            x such that upperTail(x) is p.
+        """
+        iterations = 0
+        while iterations < Distribution.MAX_ITERATIONS:
+            iterations += 1
+            difference = upperTail(x) - p
+            if difference > 0.0:
+                lower = x
+            else:
+                upper = x
+            slope = density(x)
+            following = x + difference / slope if slope > 0.0 else math.inf
+            if following <= lower:
+                following = 0.5 * (x + lower)
+            elif following >= upper:
+                following = 0.5 * (x + upper)
+                if 0.0 < x < following:
+                    following = min(following, 2.0 * x)
+            converged = abs(following - x) <= tolerance
+            x = following
+            if converged or difference == 0.0:
+                break
+        Distribution.__iterations = iterations
+        return x
+
+    @staticmethod
+    def __zInverse(p: float,
+                   tolerance: float) -> float:
+        """
+        Computes zInverse without the cache.
         """
-        minz = -Distribution.Z_MAX
-        maxz = Distribution.Z_MAX
-        zval = 0.0
+        Distribution.__iterations = 0
         if p <= 0.0 or p >= 1.0:
             return 0.0
-        while maxz - minz > Distribution.Z_EPSILON:
-            pval = Distribution.zNormal(zval)
-            if pval > p:
-                maxz = zval
-            else:
-                minz = zval
-            zval = (maxz + minz) * 0.5
-        return zval
+        x = min(max(Distribution.__acklam(p), -Distribution.Z_MAX), Distribution.Z_MAX)
+        # zNormal(-z) is the decreasing upper tail, so its root is -x.
+        return -Distribution.__newton(lambda z: Distribution.zNormal(-z),
+                                      lambda z: math.exp(-0.5 * z * z) * Distribution.I_SQRT_PI / math.sqrt(2.0),
+                                      p, -x, -Distribution.Z_MAX, Distribution.Z_MAX, tolerance)
+
+    @staticmethod
+    def zInverse(p: float,
+                 tolerance: float = Z_EPSILON) -> float:
+        """
+        The zInverse method returns the Z-Inverse of given probability value. Acklam's rational approximation is used
+        as the initial guess, which is then refined with Newton's method on zNormal.
+
+        PARAMETERS
+        ----------
+        p : double
+            probability input.
+        tolerance : double
+            iteration stops when a Newton step is not larger than tolerance.
+
+        RETURNS
+        -------
+        double
+            the Z-Inverse of given probability.
+        """
+        return Distribution.__cached(("z", p, tolerance), lambda: Distribution.__zInverse(p, tolerance))
 
     @staticmethod
     def chiSquare(x: float,
@@ -217,12 +436,39 @@ class Distribution(object):
         else:
             return s
 
+    @staticmethod
+    def __chiSquareInverse(p: float,
+                           freedom: int,
+                           tolerance: float) -> float:
+        """
+        Computes chiSquareInverse without the cache.
+        """
+        Distribution.__iterations = 0
+        if p <= 0.0:
+            return Distribution.CHI_MAX
+        else:
+            if p >= 1.0:
+                return 0.0
+        k = 0.5 * freedom
+        logNormalizer = k * math.log(2.0) + Distribution.gammaLn(k)
+        h = 2.0 / (9.0 * freedom)
+        x = freedom * (1.0 - h + Distribution.__acklam(1.0 - p) * math.sqrt(h)) ** 3
+        if x <= 0.0:
+            x = math.exp((math.log(1.0 - p) + logNormalizer + math.log(k)) / k)
+        x = min(x, Distribution.CHI_MAX)
+        return Distribution.__newton(lambda y: Distribution.chiSquare(y, freedom),
+                                     lambda y: math.exp((k - 1.0) * math.log(y) - 0.5 * y - logNormalizer)
+                                     if y > 0.0 else 0.0,
+                                     p, x, 0.0, Distribution.CHI_MAX, tolerance)
+
     @staticmethod
     def chiSquareInverse(p: float,
-                         freedom: int) -> float:
+                         freedom: int,
+                         tolerance: float = CHI_EPSILON) -> float:
         """
         The chiSquareInverse method returns the Chi Square-Inverse of given probability value with given degree of
-        freedom.
+        freedom. The Wilson-Hilferty approximation (or the small x expansion of the distribution when it fails) is used
+        as the initial guess, which is then refined with Newton's method on chiSquare.
 
         PARAMETERS
         ----------
@@ -230,27 +476,16 @@ class Distribution(object):
             probability input.
         freedom : int
             integer input for degrees of freedom.
+        tolerance : double
+            iteration stops when a Newton step is not larger than tolerance.
 
         RETURNS
         -------
         double
             the chiSquare-Inverse of given probability.
         """
-        minchisq = 0.0
-        maxchisq = Distribution.CHI_MAX
-        if p <= 0.0:
-            return maxchisq
-        else:
-            if p >= 1.0:
-                return 0.0
-        chisqval = freedom / math.sqrt(p)
-        while maxchisq - minchisq > Distribution.CHI_EPSILON:
-            if Distribution.chiSquare(chisqval, freedom) < p:
-                maxchisq = chisqval
-            else:
-                minchisq = chisqval
-            chisqval = (maxchisq + minchisq) * 0.5
-        return chisqval
+        return Distribution.__cached(("chiSquare", p, freedom, tolerance),
+                                     lambda: Distribution.__chiSquareInverse(p, freedom, tolerance))
 
     @staticmethod
     def fDistribution(F: float,
@@ -324,12 +559,47 @@ class Distribution(object):
                 p = 1.0
         return 1.0 - p
 
+    @staticmethod
+    def __fDistributionInverse(p: float,
+                               freedom1: int,
+                               freedom2: int,
+                               tolerance: float) -> float:
+        """
+        Computes fDistributionInverse without the cache.
+        """
+        Distribution.__iterations = 0
+        if p <= 0.0 or p >= 1.0:
+            return 0.0
+        if freedom1 == freedom2 and freedom1 > 2500:
+            return 1 + 4.0 / freedom1
+        a = 2.0 / (9.0 * freedom1)
+        b = 2.0 / (9.0 * freedom2)
+        z = Distribution.__acklam(1.0 - p)
+        denominator = (1.0 - b) ** 2 - z * z * b
+        discriminant = (1.0 - a) ** 2 * b + (1.0 - b) ** 2 * a - a * b * z * z
+        x = 1.0 / p
+        if denominator > 0.0 and discriminant >= 0.0:
+            u = ((1.0 - a) * (1.0 - b) + z * math.sqrt(discriminant)) / denominator
+            if u > 0.0:
+                x = u ** 3
+        x = min(x, Distribution.F_MAX)
+        logNormalizer = Distribution.beta([0.5 * freedom1, 0.5 * freedom2]) - \
+            0.5 * freedom1 * math.log(freedom1 / freedom2)
+        return Distribution.__newton(lambda y: Distribution.fDistribution(y, freedom1, freedom2),
+                                     lambda y: math.exp((0.5 * freedom1 - 1.0) * math.log(y)
+                                                        - 0.5 * (freedom1 + freedom2)
+                                                        * math.log1p(freedom1 * y / freedom2) - logNormalizer)
+                                     if y > 0.0 else 0.0,
+                                     p, x, 0.0, Distribution.F_MAX, tolerance)
+
     @staticmethod
     def fDistributionInverse(p: float,
                              freedom1: int,
-                             freedom2: int) -> float:
+                             freedom2: int,
+                             tolerance: float = F_EPSILON) -> float:
         """
-        The fDistributionInverse method returns the F-Distribution Inverse of given probability value.
+        The fDistributionInverse method returns the F-Distribution Inverse of given probability value. Paulson's normal
+        approximation is used as the initial guess, which is then refined with Newton's method on fDistribution.
 
         PARAMETERS
         ----------
@@ -339,26 +609,16 @@ class Distribution(object):
             integer input for degrees of freedom.
         freedom2 : int
             integer input for degrees of freedom.
+        tolerance : double
+            iteration stops when a Newton step is not larger than tolerance.
 
         RETURNS
         -------
         double
             the F-Distribution Inverse of given probability.
         """
-        maxf = Distribution.F_MAX
-        minf = 0.0
-        if p <= 0.0 or p >= 1.0:
-            return 0.0
-        if freedom1 == freedom2 and freedom1 > 2500:
-            return 1 + 4.0 / freedom1
-        fval = 1.0 / p
-        while abs(maxf - minf) > Distribution.F_EPSILON:
-            if Distribution.fDistribution(fval, freedom1, freedom2) < p:
-                maxf = fval
-            else:
-                minf = fval
-            fval = (maxf + minf) * 0.5
-        return fval
+        return Distribution.__cached(("f", p, freedom1, freedom2, tolerance),
+                                     lambda: Distribution.__fDistributionInverse(p, freedom1, freedom2, tolerance))
 
     @staticmethod
     def tDistribution(T: float,
@@ -385,9 +645,22 @@ class Distribution(object):
         else:
             return 1 - Distribution.fDistribution(T * T, 1, freedom) / 2
 
+    @staticmethod
+    def __tDistributionInverse(p: float,
+                               freedom: int,
+                               tolerance: float) -> float:
+        """
+        Computes tDistributionInverse without the cache.
+        """
+        if p < 0.5:
+            return math.sqrt(Distribution.__fDistributionInverse(p * 2, 1, freedom, tolerance))
+        else:
+            return -math.sqrt(Distribution.__fDistributionInverse((1 - p) * 2, 1, freedom, tolerance))
+
     @staticmethod
     def tDistributionInverse(p: float,
-                             freedom: int) -> float:
+                             freedom: int,
+                             tolerance: float = F_EPSILON) -> float:
         """
         The tDistributionInverse method returns the T-Distribution Inverse of given probability value.
 
@@ -397,13 +670,327 @@ class Distribution(object):
             double probability.
         freedom : int
             integer input for degrees of freedom.
+        tolerance : double
+            tolerance of the underlying fDistributionInverse.
 
         RETURNS
         -------
         double
             the T-Distribution Inverse of given probability.
         """
-        if p < 0.5:
-            return math.sqrt(Distribution.fDistributionInverse(p * 2, 1, freedom))
+        return Distribution.__cached(("t", p, freedom, tolerance),
+                                     lambda: Distribution.__tDistributionInverse(p, freedom, tolerance))
+
+    @staticmethod
+    def __toList(values) -> list:
+        """
+        Returns the items of the given list, Vector or buffer (array, memoryview, numpy array) as a list of floats.
+        """
+        if isinstance(values, Vector):
+            return [values.getValue(i) for i in range(values.size())]
+        return [float(value) for value in values]
+
+    @staticmethod
+    def __result(values, result: list):
+        """
+        Returns the result list as a Vector if the inputs were given as a Vector, as a list otherwise.
+        """
+        if isinstance(values, Vector):
+            return Vector(result)
+        return result
+
+    @staticmethod
+    def __groups(freedoms,
+                 size: int,
+                 integral: bool = False) -> dict:
+        """
+        Groups the positions of the inputs by their degrees of freedom. The degrees of freedom are either a single
+        real number shared by all inputs, or a list or Vector with one item for each input. Integral degrees of
+        freedom, such as 10.0, are grouped as ints; other values are kept as they are, or rejected with ValueError if
+        integral is true, for the functions defined only for integer degrees of freedom.
+        """
+        if isinstance(freedoms, numbers.Real):
+            freedoms = [freedoms] * size
+        else:
+            freedoms = Distribution.__toList(freedoms)
+        if len(freedoms) != size:
+            raise ValueError(f"Expected {size} degrees of freedom, got {len(freedoms)}.")
+        groups = {}
+        for i, freedom in enumerate(freedoms):
+            if float(freedom).is_integer():
+                freedom = int(freedom)
+            elif integral:
+                raise ValueError(f"Degrees of freedom should be integers, got {freedom}.")
+            groups.setdefault(freedom, []).append(i)
+        return groups
+
+    @staticmethod
+    def __zNormalNumpy(z):
+        """
+        Computes zNormal for every item of the given numpy array, with the same polynomials as zNormal.
+        """
+        numpy = Backend.getNumpy()
+        y = 0.5 * numpy.abs(z)
+        w = y * y
+        small = ((((((((0.000124818987 * w - 0.001075204047) * w + 0.005198775019) * w - 0.019198292004) * w
+                     + 0.059054035642) * w - 0.151968751364) * w + 0.319152932694) * w - 0.531923007300) * w
+                 + 0.797884560593) * y * 2.0
+        y2 = y - 2.0
+        large = (((((((((((((-0.000045255659 * y2 + 0.000152529290) * y2 - 0.000019538132) * y2
+                           - 0.000676904986) * y2 + 0.001390604284) * y2 - 0.000794620820) * y2
+                        - 0.002034254874) * y2 + 0.006549791214) * y2 - 0.010557625006) * y2 + 0.011630447319) * y2
+                    - 0.009279453341) * y2 + 0.005353579108) * y2 - 0.002141268741) * y2 + 0.000535310849) * y2 \
+            + 0.999936657524
+        x = numpy.where(y >= Distribution.Z_MAX * 0.5, 1.0, numpy.where(y < 1.0, small, large))
+        x = numpy.where(z == 0.0, 0.0, x)
+        return numpy.where(z > 0.0, (x + 1.0) * 0.5, (1.0 - x) * 0.5)
+
+    @staticmethod
+    def __chiSquareNumpy(x, freedom: int):
+        """
+        Computes chiSquare for every item of the given numpy array with the same degrees of freedom, running the
+        series of chiSquare on all items at once.
+        """
+        numpy = Backend.getNumpy()
+        if freedom < 1:
+            return numpy.ones_like(x)
+        valid = x > 0.0
+        x = numpy.where(valid, x, 1.0)
+        a = 0.5 * x
+        even = (freedom % 2 == 0)
+        if freedom > 1:
+            y = numpy.where(-a < -Distribution.BIGX, 0.0, numpy.exp(-a))
+        else:
+            y = numpy.zeros_like(x)
+        if even:
+            s = y
+        else:
+            s = 2.0 * Distribution.__zNormalNumpy(-numpy.sqrt(x))
+        if freedom > 2:
+            limit = 0.5 * (freedom - 1.0)
+            big = a > Distribution.BIGX
+            sBig = s.copy()
+            logA = numpy.log(a)
+            e = 0.0 if even else Distribution.LOG_SQRT_PI
+            z = 1.0 if even else 0.5
+            while z <= limit:
+                e = math.log(z) + e
+                exponent = logA * z - a - e
+                sBig += numpy.where(exponent < -Distribution.BIGX, 0.0, numpy.exp(numpy.maximum(exponent,
+                                                                                                -Distribution.BIGX)))
+                z += 1.0
+            e = numpy.ones_like(x) if even else Distribution.I_SQRT_PI / numpy.sqrt(a)
+            c = numpy.zeros_like(x)
+            z = 1.0 if even else 0.5
+            while z <= limit:
+                e = e * (a / z)
+                c = c + e
+                z += 1.0
+            with numpy.errstate(over='ignore', invalid='ignore'):
+                s = numpy.where(big, sBig, c * y + s)
+        return numpy.where(valid, s, 1.0)
+
+    @staticmethod
+    def __fDistributionNumpy(F,
+                             freedom1: int,
+                             freedom2: int):
+        """
+        Computes fDistribution for every item of the given numpy array with the same degrees of freedom, running the
+        series of fDistribution on all items at once.
+        """
+        numpy = Backend.getNumpy()
+        if freedom1 < 1 or freedom2 < 1:
+            return numpy.ones_like(F)
+        valid = F >= Distribution.F_EPSILON
+        F = numpy.where(valid, F, 1.0)
+        a = 1 if freedom1 % 2 != 0 else 2
+        b = 1 if freedom2 % 2 != 0 else 2
+        w = (F * freedom1) / freedom2
+        z = 1.0 / (1.0 + w)
+        if a == 1:
+            if b == 1:
+                p = numpy.sqrt(w)
+                y = Distribution.I_PI
+                d = y * z / p
+                p = 2.0 * y * numpy.arctan(p)
+            else:
+                p = numpy.sqrt(w * z)
+                d = 0.5 * p * z / w
         else:
-            return -math.sqrt(Distribution.fDistributionInverse((1 - p) * 2, 1, freedom))
+            if b == 1:
+                p = numpy.sqrt(z)
+                d = 0.5 * z * p
+                p = 1.0 - p
+            else:
+                d = z * z
+                p = w * z
+        y = 2.0 * w / z
+        for j in range(b + 2, freedom2 + 1, 2):
+            d = d * ((1.0 + a / (j - 2.0)) * z)
+            if a == 1:
+                p = p + d * y / (j - 1.0)
+            else:
+                p = (p + w) * z
+        y = w * z
+        z = 2.0 / z
+        b = freedom2 - 2
+        for i in range(a + 2, freedom1 + 1, 2):
+            j = i + b
+            d = d * (y * j / (i - 2.0))
+            p = p - z * d / j
+        p = numpy.clip(p, 0.0, 1.0)
+        return numpy.where(valid, 1.0 - p, 1.0)
+
+    @staticmethod
+    def gammaLns(values):
+        """
+        The gammaLns method computes gammaLn for every item of the given list, Vector or buffer in one call.
+
+        PARAMETERS
+        ----------
+        values : list, Vector or buffer
+            double inputs.
+
+        RETURNS
+        -------
+        list or Vector
+            gammaLn of every input, a Vector if the inputs are given as a Vector, a list otherwise.
+        """
+        x = Distribution.__toList(values)
+        if Backend.useNumpy(len(x)) and len(x) > 0:
+            numpy = Backend.getNumpy()
+            x = numpy.array(x, dtype=float)
+            tmp = x + 5.5
+            tmp -= (x + 0.5) * numpy.log(tmp)
+            ser = 1.000000000190015
+            y = x
+            for cof in (76.18009172947146, -86.50532032941677, 24.01409824083091, -1.231739572450155,
+                        0.1208650973866179e-2, -0.5395239384953e-5):
+                y = y + 1
+                ser = ser + cof / y
+            return Distribution.__result(values, (-tmp + numpy.log(2.5066282746310005 * ser / x)).tolist())
+        return Distribution.__result(values, [Distribution.gammaLn(item) for item in x])
+
+    @staticmethod
+    def zNormals(values):
+        """
+        The zNormals method computes zNormal for every item of the given list, Vector or buffer in one call. With the
+        auto backend, numpy is used from NUMPY_MINIMUM_SIZE inputs.
+
+        PARAMETERS
+        ----------
+        values : list, Vector or buffer
+            double inputs.
+
+        RETURNS
+        -------
+        list or Vector
+            zNormal of every input, a Vector if the inputs are given as a Vector, a list otherwise.
+        """
+        z = Distribution.__toList(values)
+        if Backend.useNumpy(len(z), Distribution.NUMPY_MINIMUM_SIZE) and len(z) > 0:
+            numpy = Backend.getNumpy()
+            return Distribution.__result(values, Distribution.__zNormalNumpy(numpy.array(z, dtype=float)).tolist())
+        return Distribution.__result(values, [Distribution.zNormal(item) for item in z])
+
+    @staticmethod
+    def chiSquares(values,
+                   freedom):
+        """
+        The chiSquares method computes chiSquare for every item of the given list, Vector or buffer in one call. The
+        inputs sharing the same degrees of freedom are computed together, with numpy from NUMPY_MINIMUM_SIZE inputs
+        under the auto backend.
+
+        PARAMETERS
+        ----------
+        values : list, Vector or buffer
+            double inputs.
+        freedom : float, list or Vector
+            degrees of freedom shared by all inputs, or one for each input.
+
+        RETURNS
+        -------
+        list or Vector
+            chiSquare of every input, a Vector if the inputs are given as a Vector, a list otherwise.
+        """
+        x = Distribution.__toList(values)
+        result = [0.0] * len(x)
+        for df, indexes in Distribution.__groups(freedom, len(x)).items():
+            group = [x[i] for i in indexes]
+            if Backend.useNumpy(len(group), Distribution.NUMPY_MINIMUM_SIZE):
+                numpy = Backend.getNumpy()
+                group = Distribution.__chiSquareNumpy(numpy.array(group, dtype=float), df).tolist()
+            else:
+                group = [Distribution.chiSquare(item, df) for item in group]
+            for i, item in zip(indexes, group):
+                result[i] = item
+        return Distribution.__result(values, result)
+
+    @staticmethod
+    def fDistributions(values,
+                       freedom1,
+                       freedom2):
+        """
+        The fDistributions method computes fDistribution for every item of the given list, Vector or buffer in one
+        call. The inputs sharing the same degrees of freedom are computed together. It throws ValueError if a degree
+        of freedom is not an integer.
+
+        PARAMETERS
+        ----------
+        values : list, Vector or buffer
+            double inputs.
+        freedom1 : int, list or Vector
+            first degrees of freedom shared by all inputs, or one for each input.
+        freedom2 : int, list or Vector
+            second degrees of freedom shared by all inputs, or one for each input.
+
+        RETURNS
+        -------
+        list or Vector
+            fDistribution of every input, a Vector if the inputs are given as a Vector, a list otherwise.
+        """
+        F = Distribution.__toList(values)
+        result = [0.0] * len(F)
+        groups1 = Distribution.__groups(freedom1, len(F), True)
+        groups2 = Distribution.__groups(freedom2, len(F), True)
+        freedoms2 = [0] * len(F)
+        for df2, indexes in groups2.items():
+            for i in indexes:
+                freedoms2[i] = df2
+        for df1, indexes1 in groups1.items():
+            groups = {}
+            for i in indexes1:
+                groups.setdefault(freedoms2[i], []).append(i)
+            for df2, indexes in groups.items():
+                group = [F[i] for i in indexes]
+                if Backend.useNumpy(len(group)):
+                    numpy = Backend.getNumpy()
+                    group = Distribution.__fDistributionNumpy(numpy.array(group, dtype=float), df1, df2).tolist()
+                else:
+                    group = [Distribution.fDistribution(item, df1, df2) for item in group]
+                for i, item in zip(indexes, group):
+                    result[i] = item
+        return Distribution.__result(values, result)
+
+    @staticmethod
+    def tDistributions(values,
+                       freedom):
+        """
+        The tDistributions method computes tDistribution for every item of the given list, Vector or buffer in one
+        call, using fDistributions. It throws ValueError if a degree of freedom is not an integer.
+
+        PARAMETERS
+        ----------
+        values : list, Vector or buffer
+            double inputs.
+        freedom : int, list or Vector
+            degrees of freedom shared by all inputs, or one for each input.
+
+        RETURNS
+        -------
+        list or Vector
+            tDistribution of every input, a Vector if the inputs are given as a Vector, a list otherwise.
+        """
+        T = Distribution.__toList(values)
+        f = Distribution.fDistributions([t * t for t in T], 1, freedom)
+        return Distribution.__result(values, [p / 2 if t >= 0 else 1 - p / 2 for t, p in zip(T, f)])
@@ -0,0 +1,4 @@
+class EigenvalueNotConverged(Exception):
+
+    def __init__(self):
+        self.message = "The QL iterations did not converge to the eigenvalues of the matrix."
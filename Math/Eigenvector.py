@@ -2,6 +2,7 @@ from Math.Vector import Vector
 
 
 class Eigenvector(Vector):
+    __slots__ = ('eigenvalue',)
 
     eigenvalue: float
 
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import operator
+from array import array
+
+from Math.DeterminantZero import DeterminantZero
+from Math.Matrix import Matrix
+from Math.MatrixNotSquare import MatrixNotSquare
+from Math.MatrixRowMismatch import MatrixRowMismatch
+from Math.Vector import Vector
+
+
+class LUDecomposition(object):
+    """
+    LU factorization with partial pivoting, P * A = L * U, of a square matrix. L (unit lower triangular, diagonal not
+    stored) and U (upper triangular) share one row-major array('d') buffer, and the row permutation P is stored as a
+    list of original row indexes. Once factorized, the decomposition can be reused to solve any number of linear
+    systems, and to compute the determinant and the inverse of the matrix in O(n^2) per right hand side.
+    """
+    __size: int
+    __lu: array
+    __pivot: list[int]
+    __sign: float
+    __singular: bool
+
+    def __init__(self, matrix: Matrix):
+        """
+        Constructor of LUDecomposition class which factorizes the given square matrix with partial pivoting. The given
+        matrix is not modified.
+
+        PARAMETERS
+        ----------
+        matrix : Matrix
+            Square matrix to factorize.
+        """
+        if matrix.getRow() != matrix.getColumn():
+            raise MatrixNotSquare
+        n = matrix.getRow()
+        self.__size = n
+        self.__lu = array('d', [matrix.getValue(i, j) for i in range(n) for j in range(n)])
+        self.__pivot = list(range(n))
+        self.__sign = 1.0
+        self.__singular = False
+        lu = self.__lu
+        for k in range(n):
+            pivotRow = k
+            big = abs(lu[k * n + k])
+            for i in range(k + 1, n):
+                if abs(lu[i * n + k]) > big:
+                    big = abs(lu[i * n + k])
+                    pivotRow = i
+            if big == 0.0:
+                self.__singular = True
+                continue
+            if pivotRow != k:
+                lu[k * n:(k + 1) * n], lu[pivotRow * n:(pivotRow + 1) * n] = \
+                    lu[pivotRow * n:(pivotRow + 1) * n], lu[k * n:(k + 1) * n]
+                self.__pivot[k], self.__pivot[pivotRow] = self.__pivot[pivotRow], self.__pivot[k]
+                self.__sign = -self.__sign
+            pivot = lu[k * n + k]
+            upperRow = lu[k * n + k + 1:(k + 1) * n].tolist()
+            for i in range(k + 1, n):
+                factor = lu[i * n + k] / pivot
+                lu[i * n + k] = factor
+                if factor != 0.0:
+                    start = i * n + k + 1
+                    lu[start:(i + 1) * n] = array('d', [x - factor * y for x, y in
+                                                        zip(lu[start:(i + 1) * n], upperRow)])
+
+    def isSingular(self) -> bool:
+        """
+        Checks if the factorized matrix is singular, that is, if a zero pivot was met during the factorization.
+
+        RETURNS
+        -------
+        bool
+            True if the matrix is singular, false otherwise.
+        """
+        return self.__singular
+
+    def getPivot(self) -> list:
+        """
+        Getter for the row permutation. The i'th row of P * A is the getPivot()[i]'th row of A.
+
+        RETURNS
+        -------
+        list
+            Row permutation of the factorization.
+        """
+        return self.__pivot.copy()
+
+    def getLower(self) -> Matrix:
+        """
+        Returns the unit lower triangular factor L.
+
+        RETURNS
+        -------
+        Matrix
+            Unit lower triangular factor.
+        """
+        n = self.__size
+        result = Matrix(n)
+        for i in range(n):
+            for j in range(i):
+                result.setValue(i, j, self.__lu[i * n + j])
+        return result
+
+    def getUpper(self) -> Matrix:
+        """
+        Returns the upper triangular factor U.
+
+        RETURNS
+        -------
+        Matrix
+            Upper triangular factor.
+        """
+        n = self.__size
+        result = Matrix(n, n)
+        for i in range(n):
+            for j in range(i, n):
+                result.setValue(i, j, self.__lu[i * n + j])
+        return result
+
+    def determinant(self) -> float:
+        """
+        Computes the determinant of the factorized matrix as the signed product of the diagonal of U.
+
+        RETURNS
+        -------
+        float
+            Determinant of the factorized matrix.
+        """
+        if self.__singular:
+            return 0.0
+        det = self.__sign
+        n = self.__size
+        for i in range(n):
+            det *= self.__lu[i * n + i]
+        return det
+
+    def __solveRows(self, rows: list) -> list:
+        """
+        Solves L * U * X = P * B in place, where B is given as a list of rows, each row being a list of the same
+        length.
+
+        PARAMETERS
+        ----------
+        rows : list
+            Rows of the right hand side B, in the original row order.
+
+        RETURNS
+        -------
+        list
+            Rows of the solution X.
+        """
+        if self.__singular:
+            raise DeterminantZero
+        n = self.__size
+        lu = self.__lu
+        x = [rows[self.__pivot[i]] for i in range(n)]
+        for i in range(n):
+            row = x[i]
+            for j in range(i):
+                factor = lu[i * n + j]
+                if factor != 0.0:
+                    row = [a - factor * b for a, b in zip(row, x[j])]
+            x[i] = row
+        for i in range(n - 1, -1, -1):
+            row = x[i]
+            for j in range(i + 1, n):
+                factor = lu[i * n + j]
+                if factor != 0.0:
+                    row = [a - factor * b for a, b in zip(row, x[j])]
+            diagonal = lu[i * n + i]
+            x[i] = [a / diagonal for a in row]
+        return x
+
+    def solve(self, b: Vector) -> Vector:
+        """
+        Solves the linear system A * x = b for x, reusing the factorization.
+
+        PARAMETERS
+        ----------
+        b : Vector
+            Right hand side of the system.
+
+        RETURNS
+        -------
+        Vector
+            Solution x of the system.
+        """
+        n = self.__size
+        if b.size() != n:
+            raise MatrixRowMismatch
+        if self.__singular:
+            raise DeterminantZero
+        lu = self.__lu
+        x = [b.getValue(self.__pivot[i]) for i in range(n)]
+        for i in range(1, n):
+            x[i] -= sum(map(operator.mul, lu[i * n:i * n + i], x[:i]))
+        for i in range(n - 1, -1, -1):
+            x[i] = (x[i] - sum(map(operator.mul, lu[i * n + i + 1:(i + 1) * n], x[i + 1:]))) / lu[i * n + i]
+        return Vector(x)
+
+    def solveMany(self, b: Matrix) -> Matrix:
+        """
+        Solves the linear systems A * X = B for X, each column of B being a separate right hand side.
+
+        PARAMETERS
+        ----------
+        b : Matrix
+            Right hand sides of the systems as columns.
+
+        RETURNS
+        -------
+        Matrix
+            Solutions of the systems as columns.
+        """
+        n = self.__size
+        if b.getRow() != n:
+            raise MatrixRowMismatch
+        m = b.getColumn()
+        rows = [[b.getValue(i, j) for j in range(m)] for i in range(n)]
+        x = self.__solveRows(rows)
+        result = Matrix(n, m)
+        for i in range(n):
+            for j in range(m):
+                result.setValue(i, j, x[i][j])
+        return result
+
+    def inverse(self) -> Matrix:
+        """
+        Computes the inverse of the factorized matrix by solving against the columns of the identity matrix.
+
+        RETURNS
+        -------
+        Matrix
+            Inverse of the factorized matrix.
+        """
+        return self.solveMany(Matrix(self.__size))
@@ -3,29 +3,41 @@ from __future__ import annotations
 import copy
 import random
 import math
-from Math.MatrixNotPositiveDefinite import MatrixNotPositiveDefinite
+import sys
+import operator
+from array import array
+from Math.Backend import Backend
 from Math.MatrixNotSquare import MatrixNotSquare
 from Math.Eigenvector import Eigenvector
 from Math.MatrixDimensionMismatch import MatrixDimensionMismatch
 from Math.Vector import Vector
 from Math.MatrixRowMismatch import MatrixRowMismatch
 from Math.DeterminantZero import DeterminantZero
+from Math.EigenvalueNotConverged import EigenvalueNotConverged
 from Math.MatrixRowColumnMismatch import MatrixRowColumnMismatch
 from Math.MatrixColumnMismatch import MatrixColumnMismatch
 from Math.MatrixNotSymmetric import MatrixNotSymmetric
 
 
 class Matrix(object):
+    """
+    A dense row x col matrix. The entries are kept in a single row-major array('d') buffer, so the item at (i, j)
+    lives at index i * col + j, the rows are contiguous slices of length col and the columns are slices with step col.
+    """
+    JACOBI = "jacobi"
+    HOUSEHOLDER = "householder"
+    JACOBI_SIZE_LIMIT = 100
+    QL_MAX_ITERATIONS = 60
+
     __row: int
     __col: int
-    __values: list[list[float]]
+    __values: array
 
     def constructor1(self, row: int):
         self.__row = row
         self.__col = row
         self.initZeros()
-        for i in range(self.__row):
-            self.__values[i][i] = 1.0
+        self.__values[::self.__col + 1] = array('d', [1.0]) * self.__row
 
     def constructor2(self, row: int, col: int):
         self.__row = row
@@ -36,23 +48,23 @@ class Matrix(object):
         self.__row = row
         self.__col = col
         self.initZeros()
-        for i in range(self.__row):
-            self.__values[i][i] = minValue
+        diagonal = min(self.__row, self.__col)
+        self.__values[:diagonal * (self.__col + 1):self.__col + 1] = array('d', [minValue]) * diagonal
 
     def constructor4(self, row: int, col: int, minValue: float, maxValue: float, seed: int):
         self.__row = row
         self.__col = col
         random.seed(seed)
-        self.__values = [[random.uniform(minValue, maxValue) for _ in range(self.__col)] for _ in
-                         range(self.__row)]
+        self.__values = array('d', [random.uniform(minValue, maxValue) for _ in range(self.__row * self.__col)])
 
     def constructor5(self, row: Vector, col: Vector):
         self.__row = row.size()
         self.__col = col.size()
-        self.initZeros()
-        for i in range(row.size()):
-            for j in range(col.size()):
-                self.__values[i][j] = row.getValue(i) * col.getValue(j)
+        colValues = [col.getValue(j) for j in range(self.__col)]
+        self.__values = array('d')
+        for i in range(self.__row):
+            x = row.getValue(i)
+            self.__values.extend([x * y for y in colValues])
 
     def __init__(self,
                  row,
@@ -94,7 +106,38 @@ class Matrix(object):
         Initializes the matrix values with 0.
         :return: Initialized matrix.
         """
-        self.__values = [[0 for _ in range(self.__col)] for _ in range(self.__row)]
+        self.__values = array('d', [0.0]) * (self.__row * self.__col)
+
+    def __toNumpy(self):
+        """
+        Wraps values list into a row x col numpy array without copying it.
+
+        RETURNS
+        -------
+        numpy.ndarray
+            numpy view of values list.
+        """
+        return Backend.getNumpy().frombuffer(self.__values, dtype=float).reshape(self.__row, self.__col)
+
+    @staticmethod
+    def __fromNumpy(values) -> Matrix:
+        """
+        Creates a new Matrix from a two dimensional numpy array.
+
+        PARAMETERS
+        ----------
+        values : numpy.ndarray
+            Two dimensional numpy array.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix holding a copy of the given numpy array.
+        """
+        result = Matrix(values.shape[0], values.shape[1])
+        result.__values = array('d')
+        result.__values.frombytes(Backend.getNumpy().ascontiguousarray(values, dtype=float).tobytes())
+        return result
 
     def clone(self) -> Matrix:
         """
@@ -121,7 +164,7 @@ class Matrix(object):
         double
             item at given index of values list.
         """
-        return self.__values[rowNo][colNo]
+        return self.__values[rowNo * self.__col + colNo]
 
     def setValue(self,
                  rowNo: int,
@@ -139,7 +182,22 @@ class Matrix(object):
         value : double
             is used to set at given index.
         """
-        self.__values[rowNo][colNo] = value
+        self.__values[rowNo * self.__col + colNo] = value
+
+    def setValues(self, values):
+        """
+        The setValues method replaces all items of the matrix with the given row-major items in one copy, the item at
+        (i, j) being values[i * col + j]. If the number of items is not row * col, it throws MatrixDimensionMismatch
+        exception.
+
+        PARAMETERS
+        ----------
+        values : list
+            List or array('d') of row * col items.
+        """
+        if len(values) != self.__row * self.__col:
+            raise MatrixDimensionMismatch
+        self.__values = array('d', values)
 
     def addValue(self,
                  rowNo: int,
@@ -157,7 +215,7 @@ class Matrix(object):
         value : double
             is used to add to given item at given index.
         """
-        self.__values[rowNo][colNo] += value
+        self.__values[rowNo * self.__col + colNo] += value
 
     def increment(self,
                   rowNo: int,
@@ -172,7 +230,7 @@ class Matrix(object):
         colNo : int
             integer input for column number.
         """
-        self.__values[rowNo][colNo] += 1
+        self.__values[rowNo * self.__col + colNo] += 1
 
     def getRow(self) -> int:
         """
@@ -199,7 +257,7 @@ class Matrix(object):
         Vector
             Vector of values list at given row input.
         """
-        rowList = self.__values[row]
+        rowList = self.__values[row * self.__col:(row + 1) * self.__col].tolist()
         rowVector = Vector(rowList)
         return rowVector
 
@@ -229,10 +287,7 @@ class Matrix(object):
         Vector
             Vector of given column number.
         """
-        columnVector = []
-        for i in range(self.__row):
-            columnVector.append(self.__values[i][column])
-        return columnVector
+        return self.__values[column::self.__col].tolist()
 
     def columnWiseNormalize(self):
         """
@@ -240,8 +295,10 @@ class Matrix(object):
         by the summation.
         """
         for i in range(self.__row):
-            total = sum(self.__values[i])
-            self.__values[i][:] = [x / total for x in self.__values[i]]
+            start = i * self.__col
+            rowValues = self.__values[start:start + self.__col]
+            total = sum(rowValues)
+            self.__values[start:start + self.__col] = array('d', [x / total for x in rowValues])
 
     def multiplyWithConstant(self, constant: float):
         """
@@ -253,8 +310,7 @@ class Matrix(object):
         constant : double
             constant value to multiply items of values list.
         """
-        for i in range(self.__row):
-            self.__values[i][:] = [x * constant for x in self.__values[i]]
+        self.__values[:] = array('d', [x * constant for x in self.__values])
 
     def divideByConstant(self, constant: float):
         """
@@ -266,8 +322,7 @@ class Matrix(object):
         constant : double
             constant value to divide items of values list.
         """
-        for i in range(self.__row):
-            self.__values[i][:] = [x / constant for x in self.__values[i]]
+        self.__values[:] = array('d', [x / constant for x in self.__values])
 
     def add(self, m: Matrix):
         """
@@ -282,9 +337,7 @@ class Matrix(object):
         """
         if self.__row != m.__row or self.__col != m.__col:
             raise MatrixDimensionMismatch
-        for i in range(self.__row):
-            for j in range(self.__col):
-                self.__values[i][j] += m.__values[i][j]
+        self.__values[:] = array('d', [x + y for x, y in zip(self.__values, m.__values)])
 
     def addRowVector(self,
                      rowNo: int,
@@ -303,8 +356,9 @@ class Matrix(object):
         """
         if self.__col != v.size():
             raise MatrixColumnMismatch
+        start = rowNo * self.__col
         for i in range(self.__col):
-            self.__values[rowNo][i] += v.getValue(i)
+            self.__values[start + i] += v.getValue(i)
 
     def subtract(self, m: Matrix):
         """
@@ -319,9 +373,7 @@ class Matrix(object):
         """
         if self.__row != m.__row or self.__col != m.__col:
             raise MatrixDimensionMismatch
-        for i in range(self.__row):
-            for j in range(self.__col):
-                self.__values[i][j] -= m.__values[i][j]
+        self.__values[:] = array('d', [x - y for x, y in zip(self.__values, m.__values)])
 
     def multiplyWithVectorFromLeft(self, v: Vector) -> Vector:
         """
@@ -342,11 +394,14 @@ class Matrix(object):
         """
         if self.__row != v.size():
             raise MatrixRowMismatch
+        if Backend.useNumpy(self.__row * self.__col):
+            vector = Backend.getNumpy().array([v.getValue(i) for i in range(v.size())], dtype=float)
+            return Vector((vector @ self.__toNumpy()).tolist())
         result = Vector()
         for i in range(self.__col):
             total = 0.0
             for j in range(self.__row):
-                total += v.getValue(j) * self.__values[j][i]
+                total += v.getValue(j) * self.__values[j * self.__col + i]
             result.add(total)
         return result
 
@@ -369,11 +424,15 @@ class Matrix(object):
         """
         if self.__col != v.size():
             raise MatrixColumnMismatch
+        if Backend.useNumpy(self.__row * self.__col):
+            vector = Backend.getNumpy().array([v.getValue(i) for i in range(v.size())], dtype=float)
+            return Vector((self.__toNumpy() @ vector).tolist())
         result = Vector()
         for i in range(self.__row):
             total = 0.0
+            start = i * self.__col
             for j in range(self.__col):
-                total += v.getValue(j) * self.__values[i][j]
+                total += v.getValue(j) * self.__values[start + j]
             result.add(total)
         return result
 
@@ -392,10 +451,7 @@ class Matrix(object):
         double
             summation of given column of values list.
         """
-        total = 0
-        for i in range(self.__row):
-            total += self.__values[i][columnNo]
-        return total
+        return sum(self.__values[columnNo::self.__col])
 
     def sumOfRows(self) -> Vector:
         """
@@ -419,7 +475,7 @@ class Matrix(object):
          * @param rowNo Row number input.
          * @return summation of given row of values {@link java.lang.reflect.Array}.
         """
-        return sum(self.__values[rowNo])
+        return sum(self.__values[rowNo * self.__col:(rowNo + 1) * self.__col])
 
     def multiply(self, m: Matrix) -> Matrix:
         """
@@ -428,6 +484,9 @@ class Matrix(object):
         Matrix. If the size of Matrix's row size and values list's column size do not match,
         it throws MatrixRowColumnMismatch exception.
 
+        The rows of this matrix and the columns of m are sliced once into contiguous lists, and the result is filled
+        row by row, each item being the inner product of a hoisted row and a hoisted column.
+
         PARAMETERS
         ----------
         m : Matrix
@@ -440,13 +499,15 @@ class Matrix(object):
         """
         if self.__col != m.__row:
             raise MatrixRowColumnMismatch
-        result = Matrix(self.__row, m.__col)
+        if Backend.useNumpy(self.__row * self.__col + m.__row * m.__col):
+            return Matrix.__fromNumpy(self.__toNumpy() @ m.__toNumpy())
+        n = self.__col
+        q = m.__col
+        result = Matrix(self.__row, q)
+        columns = [m.__values[j::q].tolist() for j in range(q)]
         for i in range(self.__row):
-            for j in range(m.__col):
-                total = 0.0
-                for k in range(self.__col):
-                    total += self.__values[i][k] * m.__values[k][j]
-                result.__values[i][j] = total
+            row = self.__values[i * n:(i + 1) * n].tolist()
+            result.__values[i * q:(i + 1) * q] = array('d', [sum(map(operator.mul, row, column)) for column in columns])
         return result
 
     def elementProduct(self, m: Matrix) -> Matrix:
@@ -468,9 +529,7 @@ class Matrix(object):
         if self.__row != m.__row or self.__col != m.__col:
             raise MatrixDimensionMismatch
         result = Matrix(self.__row, self.__col)
-        for i in range(self.__row):
-            for j in range(self.__col):
-                result.__values[i][j] = self.__values[i][j] * m.__values[i][j]
+        result.__values = array('d', [x * y for x, y in zip(self.__values, m.__values)])
         return result
 
     def sumOfElements(self) -> float:
@@ -485,7 +544,7 @@ class Matrix(object):
         """
         total = 0.0
         for i in range(self.__row):
-            total += sum(self.__values[i])
+            total += sum(self.__values[i * self.__col:(i + 1) * self.__col])
         return total
 
     def trace(self) -> float:
@@ -499,10 +558,7 @@ class Matrix(object):
         """
         if self.__row != self.__col:
             raise MatrixNotSquare
-        total = 0.0
-        for i in range(self.__row):
-            total += self.__values[i][i]
-        return total
+        return sum(self.__values[::self.__col + 1], 0.0)
 
     def transpose(self) -> Matrix:
         """
@@ -515,9 +571,8 @@ class Matrix(object):
             Matrix type output.
         """
         result = Matrix(self.__col, self.__row)
-        for i in range(self.__row):
-            for j in range(self.__col):
-                result.__values[j][i] = self.__values[i][j]
+        for j in range(self.__col):
+            result.__values[j * self.__row:(j + 1) * self.__row] = self.__values[j::self.__col]
         return result
 
     def partial(self,
@@ -547,9 +602,9 @@ class Matrix(object):
             result Matrix.
         """
         result = Matrix(rowEnd - rowStart + 1, colEnd - colStart + 1)
+        result.__values = array('d')
         for i in range(rowStart, rowEnd + 1):
-            for j in range(colStart, colEnd + 1):
-                result.__values[i - rowStart][j - colStart] = self.__values[i][j]
+            result.__values.extend(self.__values[i * self.__col + colStart:i * self.__col + colEnd + 1])
         return result
 
     def isSymmetric(self) -> bool:
@@ -566,7 +621,7 @@ class Matrix(object):
             raise MatrixNotSquare
         for i in range(self.__row - 1):
             for j in range(self.__row):
-                if self.__values[i][j] != self.__values[j][i]:
+                if self.__values[i * self.__col + j] != self.__values[j * self.__col + i]:
                     return False
         return True
 
@@ -584,78 +639,130 @@ class Matrix(object):
         if self.__row != self.__col:
             raise MatrixNotSquare
         det = 1.0
-        copyOfMatrix = copy.deepcopy(self)
-        for i in range(self.__row):
-            det *= copyOfMatrix.__values[i][i]
+        n = self.__row
+        copyOfMatrix = array('d', self.__values)
+        for i in range(n):
+            det *= copyOfMatrix[i * n + i]
             if det == 0.0:
                 break
-            for j in range(i + 1, self.__row):
-                ratio = copyOfMatrix.__values[j][i] / copyOfMatrix.__values[i][i]
-                for k in range(i, self.__col):
-                    copyOfMatrix.__values[j][k] = copyOfMatrix.__values[j][k] - copyOfMatrix.__values[i][k] * ratio
+            pivotRow = copyOfMatrix[i * n + i:(i + 1) * n]
+            for j in range(i + 1, n):
+                ratio = copyOfMatrix[j * n + i] / copyOfMatrix[i * n + i]
+                start = j * n + i
+                copyOfMatrix[start:(j + 1) * n] = array('d', [x - y * ratio for x, y in
+                                                              zip(copyOfMatrix[start:(j + 1) * n], pivotRow)])
         return det
 
+    def lu(self):
+        """
+        The lu method factorizes the matrix as P * A = L * U with partial pivoting. The returned LUDecomposition can
+        be reused to solve linear systems, and to find the determinant and the inverse without factorizing again.
+
+        RETURNS
+        -------
+        LUDecomposition
+            LU factorization of the matrix.
+        """
+        from Math.LUDecomposition import LUDecomposition
+        return LUDecomposition(self)
+
+    def qr(self):
+        """
+        The qr method factorizes the matrix as A = Q * R with Householder reflections, Q having orthonormal columns and
+        R being upper triangular (economical mode, for matrices with at least as many rows as columns). The returned
+        QRDecomposition can be reused to solve least squares problems for any number of right hand sides.
+
+        RETURNS
+        -------
+        QRDecomposition
+            QR factorization of the matrix.
+        """
+        from Math.QRDecomposition import QRDecomposition
+        return QRDecomposition(self)
+
+    def leastSquares(self, b):
+        """
+        The leastSquares method finds x minimizing ||A * x - b|| through the QR factorization of the matrix, without
+        forming A^T * A or an inverse. If b is a Matrix, each of its columns is a separate right hand side and the
+        factorization is shared. It throws MatrixRankDeficient exception if the columns of the matrix are linearly
+        dependent.
+
+        PARAMETERS
+        ----------
+        b : Vector (or Matrix)
+            Right hand side, or right hand sides as columns.
+
+        RETURNS
+        -------
+        Vector (or Matrix)
+            Least squares solution, or solutions as columns.
+        """
+        if isinstance(b, Matrix):
+            return self.qr().solveMany(b)
+        return self.qr().solve(b)
+
     def inverse(self):
         """
         The inverse method finds the inverse of values list.
         """
         if self.__row != self.__col:
             raise MatrixNotSquare
-        b = Matrix(self.__row, self.__row)
+        n = self.__row
+        a = self.__values
         indxc = []
         indxr = []
-        ipiv = []
-        for j in range(self.__row):
-            ipiv.append(0)
-        for i in range(1, self.__row + 1):
+        ipiv = [0] * n
+        for i in range(n):
             big = 0.0
             irow = -1
             icol = -1
-            for j in range(1, self.__row + 1):
-                if ipiv[j - 1] != 1:
-                    for k in range(1, self.__row + 1):
-                        if ipiv[k - 1] == 0:
-                            if abs(self.__values[j - 1][k - 1]) >= big:
-                                big = abs(self.__values[j - 1][k - 1])
+            for j in range(n):
+                if ipiv[j] != 1:
+                    for k in range(n):
+                        if ipiv[k] == 0:
+                            if abs(a[j * n + k]) >= big:
+                                big = abs(a[j * n + k])
                                 irow = j
                                 icol = k
             if irow == -1 or icol == -1:
                 raise DeterminantZero
-            ipiv[icol - 1] = ipiv[icol - 1] + 1
+            ipiv[icol] = ipiv[icol] + 1
             if irow != icol:
-                for l in range(1, self.__row + 1):
-                    dum = self.__values[irow - 1][l - 1]
-                    self.__values[irow - 1][l - 1] = self.__values[icol - 1][l - 1]
-                    self.__values[icol - 1][l - 1] = dum
-                for l in range(1, self.__row + 1):
-                    dum = b.__values[irow - 1][l - 1]
-                    b.__values[irow - 1][l - 1] = b.__values[icol - 1][l - 1]
-                    b.__values[icol - 1][l - 1] = dum
+                a[irow * n:(irow + 1) * n], a[icol * n:(icol + 1) * n] = \
+                    a[icol * n:(icol + 1) * n], a[irow * n:(irow + 1) * n]
             indxr.append(irow)
             indxc.append(icol)
-            if self.__values[icol - 1][icol - 1] == 0:
+            pivot = icol * n
+            if a[pivot + icol] == 0:
                 raise DeterminantZero
-            pivinv = 1.0 / self.__values[icol - 1][icol - 1]
-            self.__values[icol - 1][icol - 1] = 1.0
-            for l in range(1, self.__row + 1):
-                self.__values[icol - 1][l - 1] = self.__values[icol - 1][l - 1] * pivinv
-            for l in range(1, self.__row + 1):
-                b.__values[icol - 1][l - 1] = b.__values[icol - 1][l - 1] * pivinv
-            for ll in range(1, self.__row + 1):
+            pivinv = 1.0 / a[pivot + icol]
+            a[pivot + icol] = 1.0
+            a[pivot:pivot + n] = array('d', [x * pivinv for x in a[pivot:pivot + n]])
+            pivotRow = a[pivot:pivot + n]
+            for ll in range(n):
                 if ll != icol:
-                    dum = self.__values[ll - 1][icol - 1]
-                    self.__values[ll - 1][icol - 1] = 0.0
-                    for l in range(1, self.__row + 1):
-                        self.__values[ll - 1][l - 1] = self.__values[ll - 1][l - 1] - self.__values[icol - 1][
-                            l - 1] * dum
-                    for l in range(1, self.__row + 1):
-                        b.__values[ll - 1][l - 1] = b.__values[ll - 1][l - 1] - b.__values[icol - 1][l - 1] * dum
-        for l in range(self.__row, 0, -1):
-            if indxr[l - 1] != indxc[l - 1]:
-                for k in range(1, self.__row + 1):
-                    dum = self.__values[k - 1][indxr[l - 1] - 1]
-                    self.__values[k - 1][indxr[l - 1] - 1] = self.__values[k - 1][indxc[l - 1] - 1]
-                    self.__values[k - 1][indxc[l - 1] - 1] = dum
+                    start = ll * n
+                    dum = a[start + icol]
+                    a[start + icol] = 0.0
+                    a[start:start + n] = array('d', [x - y * dum for x, y in zip(a[start:start + n], pivotRow)])
+        for l in range(n - 1, -1, -1):
+            if indxr[l] != indxc[l]:
+                a[indxr[l]::n], a[indxc[l]::n] = a[indxc[l]::n], a[indxr[l]::n]
+
+    def cholesky(self):
+        """
+        The cholesky method factorizes the symmetric positive definite matrix as A = L * L^T. The returned
+        CholeskyDecomposition can be reused to solve linear systems, to find the log determinant and to follow rank one
+        updates of the matrix. Only the upper triangle of the matrix is read. It throws MatrixNotPositiveDefinite
+        exception if the matrix is not positive definite.
+
+        RETURNS
+        -------
+        CholeskyDecomposition
+            Cholesky factorization of the matrix.
+        """
+        from Math.CholeskyDecomposition import CholeskyDecomposition
+        return CholeskyDecomposition(self)
 
     def choleskyDecomposition(self) -> Matrix:
         """
@@ -670,29 +777,16 @@ class Matrix(object):
         """
         if not self.isSymmetric():
             raise MatrixNotSymmetric
-        b = Matrix(self.__row, self.__col)
-        for i in range(self.__row):
-            for j in range(i, self.__row):
-                total = self.__values[i][j]
-                for k in range(i - 1, -1, -1):
-                    total -= self.__values[i][k] * self.__values[j][k]
-                if i == j:
-                    if total <= 0.0:
-                        raise MatrixNotPositiveDefinite
-                    b.__values[i][i] = math.sqrt(total)
-                else:
-                    b.__values[j][i] = total / b.__values[i][i]
-        return b
+        return self.cholesky().getLower()
 
     def __rotate(self,
                  s: float,
                  tau: float,
-                 i: int,
-                 j: int,
-                 k: int,
-                 l: int):
+                 first: slice,
+                 second: slice):
         """
-        The rotate method rotates values list according to given inputs.
+        The rotate method rotates the items of values list at the given two slices of equal length according to given
+        inputs.
 
         PARAMETERS
         ----------
@@ -700,32 +794,26 @@ class Matrix(object):
             double input.
         tau : double
             double input.
-        i : int
-            integer input.
-        j : int
-            integer input.
-        k : int
-            integer input.
-        l : int
-            integer input.
+        first : slice
+            positions of the first items of the rotated pairs in values list.
+        second : slice
+            positions of the second items of the rotated pairs in values list.
         """
-        g = self.__values[i][j]
-        h = self.__values[k][l]
-        self.__values[i][j] = g - s * (h + g * tau)
-        self.__values[k][l] = h + s * (g - h * tau)
+        g = self.__values[first]
+        h = self.__values[second]
+        self.__values[first] = array('d', [x - s * (y + x * tau) for x, y in zip(g, h)])
+        self.__values[second] = array('d', [y + s * (x - y * tau) for x, y in zip(g, h)])
 
-    def characteristics(self) -> list:
+    def __jacobi(self) -> tuple:
         """
-        The characteristics method finds and returns a sorted list of Eigenvecto}s. And it throws
-        MatrixNotSymmetric exception if it is not symmetric.
+        Finds the eigenvalues and eigenvectors of the symmetric matrix with cyclic Jacobi rotations.
 
         RETURNS
         -------
-        list
-            A sorted list of Eigenvectors.
+        tuple
+            List of eigenvalues and list of eigenvectors, each eigenvector being a list.
         """
-        if not self.isSymmetric():
-            raise MatrixNotSymmetric
+        n = self.__row
         matrix1 = copy.deepcopy(self)
         v = Matrix(self.__row, self.__row, 1.0)
         d = []
@@ -733,14 +821,14 @@ class Matrix(object):
         z = []
         EPS = 0.000000000000000001
         for ip in range(self.__row):
-            b.append(matrix1.__values[ip][ip])
-            d.append(matrix1.__values[ip][ip])
+            b.append(matrix1.__values[ip * n + ip])
+            d.append(matrix1.__values[ip * n + ip])
             z.append(0.0)
         for i in range(1, 51):
             sm = 0.0
             for ip in range(self.__row - 1):
-                for iq in range(ip + 1, self.__row):
-                    sm += abs(matrix1.__values[ip][iq])
+                for x in matrix1.__values[ip * n + ip + 1:(ip + 1) * n]:
+                    sm += abs(x)
             if sm == 0.0:
                 break
             if i < 4:
@@ -749,46 +837,558 @@ class Matrix(object):
                 threshold = 0.0
             for ip in range(self.__row - 1):
                 for iq in range(ip + 1, self.__row):
-                    g = 100.0 * abs(matrix1.__values[ip][iq])
+                    g = 100.0 * abs(matrix1.__values[ip * n + iq])
                     if i > 4 and g <= EPS * abs(d[ip]) and g <= EPS * abs(d[iq]):
-                        matrix1.__values[ip][iq] = 0.0
+                        matrix1.__values[ip * n + iq] = 0.0
                     else:
-                        if abs(matrix1.__values[ip][iq]) > threshold:
+                        if abs(matrix1.__values[ip * n + iq]) > threshold:
                             h = d[iq] - d[ip]
                             if g <= EPS * abs(h):
-                                t = matrix1.__values[ip][iq] / h
+                                t = matrix1.__values[ip * n + iq] / h
                             else:
-                                theta = 0.5 * h / matrix1.__values[ip][iq]
+                                theta = 0.5 * h / matrix1.__values[ip * n + iq]
                                 t = 1.0 / (abs(theta) + math.sqrt(1.0 + theta ** 2))
                                 if theta < 0.0:
                                     t = -t
                             c = 1.0 / math.sqrt(1 + t ** 2)
                             s = t * c
                             tau = s / (1.0 + c)
-                            h = t * matrix1.__values[ip][iq]
+                            h = t * matrix1.__values[ip * n + iq]
                             z[ip] -= h
                             z[iq] += h
                             d[ip] -= h
                             d[iq] += h
-                            matrix1.__values[ip][iq] = 0.0
-                            for j in range(ip):
-                                matrix1.__rotate(s, tau, j, ip, j, iq)
-                            for j in range(ip + 1, iq):
-                                matrix1.__rotate(s, tau, ip, j, j, iq)
-                            for j in range(iq + 1, self.__row):
-                                matrix1.__rotate(s, tau, ip, j, iq, j)
-                            for j in range(self.__row):
-                                v.__rotate(s, tau, j, ip, j, iq)
+                            matrix1.__values[ip * n + iq] = 0.0
+                            matrix1.__rotate(s, tau, slice(ip, ip * n, n), slice(iq, ip * n, n))
+                            matrix1.__rotate(s, tau, slice(ip * n + ip + 1, ip * n + iq),
+                                             slice((ip + 1) * n + iq, iq * n, n))
+                            matrix1.__rotate(s, tau, slice(ip * n + iq + 1, (ip + 1) * n),
+                                             slice(iq * n + iq + 1, (iq + 1) * n))
+                            v.__rotate(s, tau, slice(ip, n * n, n), slice(iq, n * n, n))
             for ip in range(self.__row):
                 b[ip] = b[ip] + z[ip]
                 d[ip] = b[ip]
                 z[ip] = 0.0
+        return d, [v.__values[i::n].tolist() for i in range(n)]
+
+    def __tridiagonalize(self) -> tuple:
+        """
+        Reduces the symmetric matrix to a tridiagonal matrix T = Q^T A Q with Householder reflections. Reflection i
+        zeroes the items of row i left of the subdiagonal; since it only changes the upper left i x i block, rows and
+        columns are updated with whole list operations on that block. Q^T is accumulated as the product of the
+        reflections, only the block of the current reflection being non trivial.
+
+        RETURNS
+        -------
+        tuple
+            Diagonal of T, subdiagonal of T (e[i] being T[i][i - 1], e[0] is 0) and the rows of Q^T.
+        """
+        n = self.__row
+        a = [self.__values[i * n:(i + 1) * n].tolist() for i in range(n)]
+        e = [0.0] * n
+        reflections = []
+        for i in range(n - 1, 0, -1):
+            x = a[i][:i]
+            scale = sum(map(abs, x))
+            if i == 1 or scale == 0.0:
+                e[i] = a[i][i - 1]
+                continue
+            u = [item / scale for item in x]
+            h = sum(map(operator.mul, u, u))
+            f = u[i - 1]
+            g = -math.sqrt(h) if f >= 0 else math.sqrt(h)
+            e[i] = scale * g
+            h = h - f * g
+            u[i - 1] = f - g
+            p = [sum(map(operator.mul, a[j], u)) / h for j in range(i)]
+            k = sum(map(operator.mul, u, p)) / (h + h)
+            q = [x - k * y for x, y in zip(p, u)]
+            for j in range(i):
+                uj = u[j]
+                qj = q[j]
+                row = a[j]
+                row[:i] = [x - uj * y - qj * z for x, y, z in zip(row, q, u)]
+            reflections.append((i, u, h))
+        d = [a[i][i] for i in range(n)]
+        v = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            v[i][i] = 1.0
+        for i, u, h in reversed(reflections):
+            for r in range(i):
+                row = v[r]
+                factor = sum(map(operator.mul, row, u)) / h
+                row[:i] = [x - factor * y for x, y in zip(row, u)]
+        return d, e, v
+
+    @staticmethod
+    def __tridiagonalQL(d: list,
+                        e: list,
+                        v: list):
+        """
+        Finds the eigenvalues of a symmetric tridiagonal matrix with the QL algorithm with implicit shifts. The
+        rotations of the QL steps are applied to the rows of v, so every rotation is two whole list operations. On
+        return d holds the eigenvalues and the i'th row of v is the eigenvector of d[i], expressed in the basis the rows
+        of v were given in. It throws EigenvalueNotConverged exception if an eigenvalue is not found in
+        QL_MAX_ITERATIONS iterations.
+
+        PARAMETERS
+        ----------
+        d : list
+            Diagonal of the matrix, overwritten with the eigenvalues.
+        e : list
+            Subdiagonal of the matrix, e[i] being the item at (i + 1, i) and the last item being 0. It is destroyed.
+        v : list
+            Rows of the basis the tridiagonal matrix is expressed in, an identity matrix for the eigenvectors of the
+            tridiagonal matrix itself. Overwritten with the eigenvectors.
+        """
+        n = len(d)
+        for l in range(n):
+            for _ in range(Matrix.QL_MAX_ITERATIONS):
+                m = l
+                while m < n - 1:
+                    if abs(e[m]) <= sys.float_info.epsilon * (abs(d[m]) + abs(d[m + 1])):
+                        break
+                    m = m + 1
+                if m == l:
+                    break
+                g = (d[l + 1] - d[l]) / (2.0 * e[l])
+                r = math.hypot(g, 1.0)
+                g = d[m] - d[l] + e[l] / (g + math.copysign(r, g))
+                s = 1.0
+                c = 1.0
+                p = 0.0
+                i = m - 1
+                while i >= l:
+                    f = s * e[i]
+                    b = c * e[i]
+                    r = math.hypot(f, g)
+                    e[i + 1] = r
+                    if r == 0.0:
+                        d[i + 1] -= p
+                        e[m] = 0.0
+                        break
+                    s = f / r
+                    c = g / r
+                    g = d[i + 1] - p
+                    r = (d[i] - g) * s + 2.0 * c * b
+                    p = s * r
+                    d[i + 1] = g + p
+                    g = c * r - b
+                    first = v[i]
+                    second = v[i + 1]
+                    v[i + 1] = [s * x + c * y for x, y in zip(first, second)]
+                    v[i] = [c * x - s * y for x, y in zip(first, second)]
+                    i = i - 1
+                if r == 0.0 and i >= l:
+                    continue
+                d[l] -= p
+                e[l] = g
+                e[m] = 0.0
+            else:
+                raise EigenvalueNotConverged
+
+    def __householder(self) -> tuple:
+        """
+        Finds the eigenvalues and eigenvectors of the symmetric matrix by reducing it to tridiagonal form and solving
+        the tridiagonal problem with the QL algorithm with implicit shifts, applied to the rows of Q^T.
+
+        RETURNS
+        -------
+        tuple
+            List of eigenvalues and list of eigenvectors, each eigenvector being a list.
+        """
+        if Backend.useNumpy(self.__row * self.__col):
+            eigenvalues, eigenvectors = Backend.getNumpy().linalg.eigh(self.__toNumpy())
+            return eigenvalues.tolist(), eigenvectors.T.tolist()
+        d, e, v = self.__tridiagonalize()
+        Matrix.__tridiagonalQL(d, e[1:] + [0.0], v)
+        return d, v
+
+    def characteristics(self, method: str = None) -> list:
+        """
+        The characteristics method finds and returns a sorted list of Eigenvectors. And it throws
+        MatrixNotSymmetric exception if it is not symmetric. Two solvers are available: cyclic Jacobi rotations, which
+        are accurate for small eigenvalues but cost O(n^2) rotations per sweep, and Householder tridiagonalization
+        followed by the implicit QL algorithm, which costs O(n^3) once and is much faster for larger matrices. With
+        the numpy backend, the Householder solver is numpy.linalg.eigh.
+
+        PARAMETERS
+        ----------
+        method : str
+            Matrix.JACOBI or Matrix.HOUSEHOLDER. If None, Jacobi is used up to JACOBI_SIZE_LIMIT rows, Householder
+            above it.
+
+        RETURNS
+        -------
+        list
+            A sorted list of Eigenvectors.
+        """
+        if not self.isSymmetric():
+            raise MatrixNotSymmetric
+        if method is None:
+            method = Matrix.JACOBI if self.__row <= Matrix.JACOBI_SIZE_LIMIT else Matrix.HOUSEHOLDER
+        if method == Matrix.JACOBI:
+            d, vectors = self.__jacobi()
+        elif method == Matrix.HOUSEHOLDER:
+            d, vectors = self.__householder()
+        else:
+            raise ValueError(f"Unknown method {method}, expected one of jacobi or householder.")
         result = []
         for i in range(self.__row):
             if d[i] > 0:
-                result.append(Eigenvector(d[i], v.getColumnVector(i)))
+                result.append(Eigenvector(d[i], vectors[i]))
         result.sort(key=lambda eigenvector: eigenvector.eigenvalue, reverse=True)
         return result
 
+    @staticmethod
+    def __orthogonalize(w: list,
+                        basis: list) -> list:
+        """
+        Removes the components of w along the given orthonormal vectors. Gram-Schmidt is run twice, which keeps w
+        orthogonal to the basis to working precision.
+
+        RETURNS
+        -------
+        list
+            w minus its projection on the basis.
+        """
+        if Backend.useNumpy(len(w) * len(basis)):
+            numpy = Backend.getNumpy()
+            q = numpy.array(basis, dtype=float)
+            result = numpy.array(w, dtype=float)
+            for _ in range(2):
+                result -= (q @ result) @ q
+            return result.tolist()
+        for _ in range(2):
+            for q in basis:
+                c = sum(map(operator.mul, w, q))
+                w = [x - c * y for x, y in zip(w, q)]
+        return w
+
+    @staticmethod
+    def __lanczosMatrix(alphas: list,
+                        betas: list):
+        """
+        Returns the tridiagonal Lanczos matrix with the given diagonal and subdiagonal as a numpy array.
+        """
+        numpy = Backend.getNumpy()
+        j = len(alphas)
+        t = numpy.diag(numpy.array(alphas, dtype=float))
+        for i in range(j - 1):
+            t[i + 1, i] = betas[i]
+            t[i, i + 1] = betas[i]
+        return t
+
+    @staticmethod
+    def __ritzValues(alphas: list,
+                     betas: list) -> tuple:
+        """
+        Finds the eigenvalues of the tridiagonal Lanczos matrix and the last components of their eigenvectors, which
+        give the residual norms of the Ritz pairs. Without numpy, the QL rotations are applied to the last column of
+        the identity matrix only, so the cost is O(m^2) instead of O(m^3).
+
+        RETURNS
+        -------
+        tuple
+            List of eigenvalues and list of the last components of their eigenvectors.
+        """
+        if Backend.useNumpy(len(alphas) * len(alphas)):
+            eigenvalues, eigenvectors = Backend.getNumpy().linalg.eigh(Matrix.__lanczosMatrix(alphas, betas))
+            return eigenvalues.tolist(), eigenvectors[-1].tolist()
+        eigenvalues = alphas[:]
+        lastComponents = [[0.0] for _ in range(len(alphas))]
+        lastComponents[-1][0] = 1.0
+        Matrix.__tridiagonalQL(eigenvalues, betas[:len(alphas) - 1] + [0.0], lastComponents)
+        return eigenvalues, [component[0] for component in lastComponents]
+
+    @staticmethod
+    def __ritzVectors(alphas: list,
+                      betas: list,
+                      basis: list,
+                      k: int) -> list:
+        """
+        Finds the k largest eigenvalues of the tridiagonal Lanczos matrix and maps their eigenvectors back through the
+        Lanczos basis.
+
+        PARAMETERS
+        ----------
+        alphas : list
+            Diagonal of the Lanczos matrix.
+        betas : list
+            Subdiagonal of the Lanczos matrix.
+        basis : list
+            Lanczos vectors.
+        k : int
+            Number of eigenvectors.
+
+        RETURNS
+        -------
+        list
+            A list of k Eigenvectors, sorted by eigenvalue, largest first.
+        """
+        j = len(alphas)
+        if Backend.useNumpy(j * len(basis[0])):
+            numpy = Backend.getNumpy()
+            eigenvalues, eigenvectors = numpy.linalg.eigh(Matrix.__lanczosMatrix(alphas, betas))
+            order = numpy.argsort(-eigenvalues)[:k]
+            vectors = (eigenvectors[:, order].T @ numpy.array(basis, dtype=float)).tolist()
+            return [Eigenvector(float(eigenvalues[i]), vector) for i, vector in zip(order, vectors)]
+        eigenvalues = alphas[:]
+        eigenvectors = [[0.0] * j for _ in range(j)]
+        for i in range(j):
+            eigenvectors[i][i] = 1.0
+        Matrix.__tridiagonalQL(eigenvalues, betas[:j - 1] + [0.0], eigenvectors)
+        columns = list(zip(*basis))
+        result = []
+        for i in sorted(range(j), key=lambda index: -eigenvalues[index])[:k]:
+            coefficients = eigenvectors[i]
+            result.append(Eigenvector(eigenvalues[i], [sum(map(operator.mul, coefficients, column))
+                                                       for column in columns]))
+        return result
+
+    @staticmethod
+    def topEigenvectorsOf(matrix,
+                          k: int,
+                          tolerance: float = 1e-10,
+                          maxIterations: int = None) -> list:
+        """
+        The topEigenvectorsOf method finds the k largest eigenvalues, and their eigenvectors, of a symmetric operator
+        with the Lanczos algorithm. The operator is only used through its getRow and multiplyWithVectorFromRight
+        methods, so a Matrix, a SparseMatrix or any other object with these methods can be given. Every Lanczos step
+        costs one multiplication with a vector and a full reorthogonalization against the previous steps, so m steps
+        cost O(m n^2) for a dense matrix, m being a small multiple of k for a well separated spectrum. Every few steps
+        the eigenpairs of the tridiagonal Lanczos matrix (Ritz pairs) are found with the QL algorithm; the iteration
+        stops when the residual norm of each of the top k Ritz pairs is below tolerance times the largest Ritz value in
+        absolute value. The Ritz vectors are formed once, at the end. A single Lanczos sequence finds one copy of a
+        repeated eigenvalue; when its Krylov space becomes invariant, the sequence is restarted with a random vector
+        orthogonal to the basis, which finds the other copies. The convergence test is skipped at such a breakdown,
+        where every residual would read as zero.
+
+        PARAMETERS
+        ----------
+        matrix
+            Symmetric operator with getRow and multiplyWithVectorFromRight methods.
+        k : int
+            Number of eigenvectors to find.
+        tolerance : float
+            Relative residual norm at which a Ritz pair is accepted.
+        maxIterations : int
+            Maximum number of Lanczos steps, if None the size of the operator.
+
+        RETURNS
+        -------
+        list
+            A list of at most k Eigenvectors, sorted by eigenvalue, largest first.
+        """
+        n = matrix.getRow()
+        limit = n if maxIterations is None else min(n, maxIterations)
+        k = min(k, n)
+        if k <= 0 or limit <= 0:
+            return []
+        generator = random.Random(1)
+        basis = []
+        alphas = []
+        betas = []
+        w = [generator.uniform(-1.0, 1.0) for _ in range(n)]
+        beta = math.sqrt(sum(map(operator.mul, w, w)))
+        nextCheck = k
+        while len(basis) < limit:
+            q = [x / beta for x in w]
+            basis.append(q)
+            product = matrix.multiplyWithVectorFromRight(Vector(q))
+            w = [product.getValue(i) for i in range(n)]
+            alphas.append(sum(map(operator.mul, w, q)))
+            w = Matrix.__orthogonalize(w, basis)
+            beta = math.sqrt(sum(map(operator.mul, w, w)))
+            j = len(basis)
+            if beta <= sys.float_info.epsilon * max(map(abs, alphas)) * n and j < limit:
+                w = Matrix.__orthogonalize([generator.uniform(-1.0, 1.0) for _ in range(n)], basis)
+                beta = 0.0
+                restart = math.sqrt(sum(map(operator.mul, w, w)))
+            else:
+                restart = None
+            if restart is None and (j >= nextCheck or j == limit):
+                ritzValues, lastComponents = Matrix.__ritzValues(alphas, betas)
+                order = sorted(range(j), key=lambda index: -ritzValues[index])[:k]
+                scale = max(map(abs, ritzValues))
+                if len(order) == k and all(beta * abs(lastComponents[i]) <= tolerance * scale for i in order):
+                    break
+                nextCheck = j + max(1, j // 8)
+            betas.append(beta)
+            if restart is not None:
+                if restart == 0.0:
+                    break
+                beta = restart
+        return Matrix.__ritzVectors(alphas, betas, basis, k)
+
+    def topEigenvectors(self,
+                        k: int,
+                        tolerance: float = 1e-10,
+                        maxIterations: int = None) -> list:
+        """
+        The topEigenvectors method finds the k largest eigenvalues of the matrix and their eigenvectors with the
+        Lanczos algorithm, see topEigenvectorsOf. Unlike characteristics, only the leading part of the spectrum is
+        found, and negative eigenvalues are not dropped. It throws MatrixNotSymmetric exception if the matrix is not
+        symmetric.
+
+        PARAMETERS
+        ----------
+        k : int
+            Number of eigenvectors to find.
+        tolerance : float
+            Relative residual norm at which an eigenpair is accepted.
+        maxIterations : int
+            Maximum number of Lanczos steps, if None the size of the matrix.
+
+        RETURNS
+        -------
+        list
+            A list of at most k Eigenvectors, sorted by eigenvalue, largest first.
+        """
+        if not self.isSymmetric():
+            raise MatrixNotSymmetric
+        return Matrix.topEigenvectorsOf(self, k, tolerance, maxIterations)
+
+    @staticmethod
+    def __fromRows(rows: list,
+                   col: int) -> Matrix:
+        """
+        Creates a new Matrix whose rows are the given lists.
+
+        PARAMETERS
+        ----------
+        rows : list
+            List of rows, each a list of col items.
+        col : int
+            Number of columns, needed when there are no rows.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix holding a copy of the rows.
+        """
+        result = Matrix(len(rows), col)
+        for i, row in enumerate(rows):
+            result.__values[i * col:(i + 1) * col] = array('d', row)
+        return result
+
+    def __orthonormalRows(self) -> Matrix:
+        """
+        Returns a Matrix whose rows are an orthonormal basis of the row space of this matrix, found with modified
+        Gram-Schmidt run twice. Rows that are linearly dependent on the previous rows become zero rows.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix with orthonormal (or zero) rows, of the same size as this matrix.
+        """
+        if Backend.useNumpy(self.__row * self.__col):
+            q, _ = Backend.getNumpy().linalg.qr(self.__toNumpy().T)
+            return Matrix.__fromNumpy(q.T)
+        n = self.__col
+        rows = []
+        for i in range(self.__row):
+            w = self.__values[i * n:(i + 1) * n].tolist()
+            norm = math.sqrt(sum(map(operator.mul, w, w)))
+            for _ in range(2):
+                for q in rows:
+                    c = sum(map(operator.mul, w, q))
+                    w = [x - c * y for x, y in zip(w, q)]
+            length = math.sqrt(sum(map(operator.mul, w, w)))
+            if length <= 1e-12 * norm or length == 0.0:
+                rows.append([0.0] * n)
+            else:
+                rows.append([x / length for x in w])
+        return Matrix.__fromRows(rows, n)
+
+    def __rowSvd(self) -> tuple:
+        """
+        Finds the singular value decomposition B = U S V^T of this (short and wide) matrix with one sided Jacobi
+        rotations on its rows: pairs of rows are rotated until all rows are orthogonal, the row lengths being the
+        singular values, the normalized rows the rows of V^T and the accumulated rotations the columns of U.
+
+        RETURNS
+        -------
+        tuple
+            Rows of U^T, list of singular values and rows of V^T, sorted by singular value, largest first.
+        """
+        r = self.__row
+        n = self.__col
+        if Backend.useNumpy(r * n):
+            u, singularValues, vt = Backend.getNumpy().linalg.svd(self.__toNumpy(), full_matrices=False)
+            return u.T.tolist(), singularValues.tolist(), vt.tolist()
+        rows = [self.__values[i * n:(i + 1) * n].tolist() for i in range(r)]
+        rotations = [[1.0 if i == j else 0.0 for j in range(r)] for i in range(r)]
+        for _ in range(30):
+            rotated = False
+            for i in range(r - 1):
+                for j in range(i + 1, r):
+                    a = rows[i]
+                    b = rows[j]
+                    alpha = sum(map(operator.mul, a, a))
+                    beta = sum(map(operator.mul, b, b))
+                    gamma = sum(map(operator.mul, a, b))
+                    if abs(gamma) <= sys.float_info.epsilon * math.sqrt(alpha * beta):
+                        continue
+                    rotated = True
+                    zeta = (beta - alpha) / (2.0 * gamma)
+                    t = math.copysign(1.0, zeta) / (abs(zeta) + math.sqrt(1.0 + zeta * zeta))
+                    c = 1.0 / math.sqrt(1.0 + t * t)
+                    s = c * t
+                    rows[i] = [c * x - s * y for x, y in zip(a, b)]
+                    rows[j] = [s * x + c * y for x, y in zip(a, b)]
+                    a = rotations[i]
+                    b = rotations[j]
+                    rotations[i] = [c * x - s * y for x, y in zip(a, b)]
+                    rotations[j] = [s * x + c * y for x, y in zip(a, b)]
+            if not rotated:
+                break
+        singularValues = [math.sqrt(sum(map(operator.mul, row, row))) for row in rows]
+        order = sorted(range(r), key=lambda index: -singularValues[index])
+        vt = [[x / singularValues[i] for x in rows[i]] if singularValues[i] > 0.0 else [0.0] * n for i in order]
+        return [rotations[i] for i in order], [singularValues[i] for i in order], vt
+
+    def randomizedSvd(self,
+                      k: int,
+                      oversampling: int = 10,
+                      powerIterations: int = 2,
+                      seed: int = 1) -> tuple:
+        """
+        The randomizedSvd method finds a rank k approximation A ~ U S V^T of the matrix with the randomized range
+        finder of Halko, Martinsson and Tropp. The matrix is multiplied with a random n x (k + oversampling) matrix,
+        created with the random Matrix constructor and the given seed, and the columns of the product are
+        orthonormalized into Q, a basis approximating the range of the matrix. Each power iteration replaces Q with an
+        orthonormal basis of A A^T Q, which sharpens the basis when the singular values decay slowly. The small matrix
+        B = Q^T A is then decomposed exactly and U is recovered as Q times the left singular vectors of B. The matrix
+        is only used in products with tall and thin matrices, so the cost is O(m n (k + oversampling)) per pass.
+
+        PARAMETERS
+        ----------
+        k : int
+            Rank of the approximation.
+        oversampling : int
+            Number of extra random vectors, which make the basis capture the top k singular vectors more reliably.
+        powerIterations : int
+            Number of power iterations.
+        seed : int
+            Seed of the random matrix.
+
+        RETURNS
+        -------
+        tuple
+            U, an m x k Matrix with orthonormal columns, the k singular values as a Vector, largest first, and V^T, a
+            k x n Matrix with orthonormal rows.
+        """
+        size = min(k + oversampling, self.__row, self.__col)
+        k = min(k, size)
+        omega = Matrix(self.__col, size, -1.0, 1.0, seed)
+        qt = self.multiply(omega).transpose().__orthonormalRows()
+        for _ in range(powerIterations):
+            zt = qt.multiply(self).__orthonormalRows()
+            qt = self.multiply(zt.transpose()).transpose().__orthonormalRows()
+        ut, singularValues, vt = qt.multiply(self).__rowSvd()
+        u = Matrix.__fromRows(ut[:k], size).multiply(qt).transpose()
+        return u, Vector(singularValues[:k]), Matrix.__fromRows(vt[:k], self.__col)
+
     def __repr__(self):
-        return f"{self.__values}"
+        return f"{[self.__values[i * self.__col:(i + 1) * self.__col].tolist() for i in range(self.__row)]}"
@@ -1,4 +1,4 @@
-class MatrixNotPositiveDefinite:
+class MatrixNotPositiveDefinite(Exception):
 
     def __init__(self):
         self.message = "Matrix should be positive definite."
@@ -0,0 +1,4 @@
+class MatrixRankDeficient(Exception):
+
+    def __init__(self):
+        self.message = "Columns of the matrix should be linearly independent."
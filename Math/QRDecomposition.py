@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import math
+import operator
+import sys
+
+from Math.Matrix import Matrix
+from Math.MatrixRankDeficient import MatrixRankDeficient
+from Math.MatrixRowMismatch import MatrixRowMismatch
+from Math.Vector import Vector
+
+
+class QRDecomposition(object):
+    """
+    Economical QR factorization, A = Q * R, of an m x n matrix with m >= n, found with Householder reflections. Q is
+    m x n with orthonormal columns and R is n x n upper triangular. Q is not formed: the reflections are kept as their
+    Householder vectors and applied to the right hand sides when needed. The matrix is kept column by column, since
+    every reflection updates whole columns. Once factorized, the decomposition can be reused to solve any number of
+    least squares problems min ||A * x - b|| in O(m * n) per right hand side, without forming A^T * A, which would
+    square the condition number.
+    """
+    __row: int
+    __col: int
+    __reflections: list
+    __r: list
+    __rank: int
+
+    def __init__(self, matrix: Matrix):
+        """
+        Constructor of QRDecomposition class which factorizes the given matrix. The given matrix is not modified. It
+        throws MatrixRankDeficient exception if the matrix has more columns than rows.
+
+        PARAMETERS
+        ----------
+        matrix : Matrix
+            Matrix to factorize, with at least as many rows as columns.
+        """
+        m = matrix.getRow()
+        n = matrix.getColumn()
+        if m < n:
+            raise MatrixRankDeficient
+        self.__row = m
+        self.__col = n
+        columns = [[matrix.getValue(i, j) for i in range(m)] for j in range(n)]
+        self.__reflections = []
+        for k in range(n):
+            x = columns[k][k:]
+            norm = math.sqrt(sum(map(operator.mul, x, x)))
+            if norm == 0.0:
+                self.__reflections.append(None)
+                continue
+            alpha = -math.copysign(norm, x[0])
+            x[0] -= alpha
+            scale = 2.0 / sum(map(operator.mul, x, x))
+            columns[k][k:] = [alpha] + [0.0] * (m - k - 1)
+            for j in range(k + 1, n):
+                tail = columns[j][k:]
+                factor = scale * sum(map(operator.mul, x, tail))
+                columns[j][k:] = [a - factor * b for a, b in zip(tail, x)]
+            self.__reflections.append((x, scale))
+        self.__r = [[columns[j][i] if j >= i else 0.0 for j in range(n)] for i in range(n)]
+        largest = max([abs(self.__r[i][i]) for i in range(n)], default=0.0)
+        tolerance = sys.float_info.epsilon * m * largest
+        self.__rank = sum(1 for i in range(n) if abs(self.__r[i][i]) > tolerance)
+
+    def isFullRank(self) -> bool:
+        """
+        Checks if the columns of the factorized matrix are linearly independent, that is, if no diagonal item of R
+        is zero up to rounding.
+
+        RETURNS
+        -------
+        bool
+            True if the matrix has full column rank, false otherwise.
+        """
+        return self.__rank == self.__col
+
+    def __applyTranspose(self, values: list) -> list:
+        """
+        Computes Q^T * b for all m items of b, applying the reflections in order.
+
+        PARAMETERS
+        ----------
+        values : list
+            Items of b.
+
+        RETURNS
+        -------
+        list
+            Items of the reflected vector; the first n are Q^T * b, the rest the residual in the orthogonal complement.
+        """
+        for k, reflection in enumerate(self.__reflections):
+            if reflection is not None:
+                v, scale = reflection
+                tail = values[k:]
+                factor = scale * sum(map(operator.mul, v, tail))
+                values[k:] = [a - factor * b for a, b in zip(tail, v)]
+        return values
+
+    def getQ(self) -> Matrix:
+        """
+        Returns the m x n factor Q with orthonormal columns, applying the reflections to the first n columns of the
+        identity matrix.
+
+        RETURNS
+        -------
+        Matrix
+            Orthonormal factor Q.
+        """
+        m = self.__row
+        n = self.__col
+        result = Matrix(m, n)
+        for j in range(n):
+            values = [0.0] * m
+            values[j] = 1.0
+            for k in range(n - 1, -1, -1):
+                reflection = self.__reflections[k]
+                if reflection is not None:
+                    v, scale = reflection
+                    tail = values[k:]
+                    factor = scale * sum(map(operator.mul, v, tail))
+                    values[k:] = [a - factor * b for a, b in zip(tail, v)]
+            for i in range(m):
+                result.setValue(i, j, values[i])
+        return result
+
+    def getR(self) -> Matrix:
+        """
+        Returns the n x n upper triangular factor R.
+
+        RETURNS
+        -------
+        Matrix
+            Upper triangular factor.
+        """
+        n = self.__col
+        result = Matrix(n, n)
+        for i in range(n):
+            for j in range(i, n):
+                result.setValue(i, j, self.__r[i][j])
+        return result
+
+    def __backSubstitute(self, y: list) -> list:
+        """
+        Solves R * x = y for x.
+        """
+        if self.__rank < self.__col:
+            raise MatrixRankDeficient
+        n = self.__col
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            row = self.__r[i]
+            x[i] = (y[i] - sum(map(operator.mul, row[i + 1:], x[i + 1:]))) / row[i]
+        return x
+
+    def solve(self, b: Vector) -> Vector:
+        """
+        Solves the least squares problem min ||A * x - b|| for x, reusing the factorization, as R * x = Q^T * b. If
+        the matrix is square and non singular, x is the solution of A * x = b. It throws MatrixRankDeficient exception
+        if the columns of the matrix are linearly dependent.
+
+        PARAMETERS
+        ----------
+        b : Vector
+            Right hand side, of size m.
+
+        RETURNS
+        -------
+        Vector
+            Least squares solution x, of size n.
+        """
+        if b.size() != self.__row:
+            raise MatrixRowMismatch
+        y = self.__applyTranspose([b.getValue(i) for i in range(self.__row)])
+        return Vector(self.__backSubstitute(y))
+
+    def solveMany(self, b: Matrix) -> Matrix:
+        """
+        Solves the least squares problems min ||A * x - b|| for each column b of the given matrix.
+
+        PARAMETERS
+        ----------
+        b : Matrix
+            Right hand sides as columns, with m rows.
+
+        RETURNS
+        -------
+        Matrix
+            n x k Matrix of least squares solutions as columns.
+        """
+        if b.getRow() != self.__row:
+            raise MatrixRowMismatch
+        result = Matrix(self.__col, b.getColumn())
+        for j in range(b.getColumn()):
+            y = self.__applyTranspose([b.getValue(i, j) for i in range(self.__row)])
+            x = self.__backSubstitute(y)
+            for i in range(self.__col):
+                result.setValue(i, j, x[i])
+        return result
+
+    def residualNorm(self, b: Vector) -> float:
+        """
+        Computes the norm of the least squares residual, min ||A * x - b||, from the last m - n items of Q^T * b,
+        without solving for x.
+
+        PARAMETERS
+        ----------
+        b : Vector
+            Right hand side, of size m.
+
+        RETURNS
+        -------
+        float
+            Norm of the least squares residual.
+        """
+        if b.size() != self.__row:
+            raise MatrixRowMismatch
+        y = self.__applyTranspose([b.getValue(i) for i in range(self.__row)])[self.__col:]
+        return math.sqrt(sum(map(operator.mul, y, y)))
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import os
+import time
+
+from Math.DiscreteDistribution import DiscreteDistribution
+
+
+class ShardedCounter(object):
+    """
+    Builds a DiscreteDistribution from a large input on several processes. The input is cut into shards (chunks of
+    an iterable, or whole files), every shard is counted into its own DiscreteDistribution in a process pool, and the
+    shard distributions are merged with addDistribution in a tree: two distributions of the same level are merged
+    into one of the next level, like the carries of a binary counter. Merging in shard order keeps the items in the
+    order they are first seen, so the result is the same as counting the whole input sequentially. The input is
+    streamed: at most two shards per process are in flight, and at most one distribution per level is kept waiting.
+    """
+    __numberOfProcesses: int
+    __shardSize: int
+    __shardTimings: list
+
+    def __init__(self,
+                 numberOfProcesses: int = None,
+                 shardSize: int = 1000000):
+        """
+        Constructor of ShardedCounter class.
+
+        PARAMETERS
+        ----------
+        numberOfProcesses : int
+            Number of worker processes, if None the number of CPUs. With one process the shards are counted in the
+            calling process, without a pool.
+        shardSize : int
+            Number of items in a shard when counting an iterable.
+        """
+        self.__numberOfProcesses = numberOfProcesses if numberOfProcesses is not None else (os.cpu_count() or 1)
+        self.__shardSize = shardSize
+        self.__shardTimings = []
+
+    @staticmethod
+    def _countShard(items: list) -> tuple:
+        """
+        Counts a shard of items. Runs in a worker process, so it is not name mangled, which would keep pickle from
+        finding it.
+
+        PARAMETERS
+        ----------
+        items : list
+            Items of the shard.
+
+        RETURNS
+        -------
+        tuple
+            The distribution of the shard and the seconds spent counting it.
+        """
+        start = time.perf_counter()
+        distribution = DiscreteDistribution(items)
+        return distribution, time.perf_counter() - start
+
+    @staticmethod
+    def _countFile(fileName: str, encoding: str) -> tuple:
+        """
+        Counts the whitespace separated tokens of a file, reading it line by line. Runs in a worker process.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file.
+        encoding : str
+            Encoding of the file.
+
+        RETURNS
+        -------
+        tuple
+            The distribution of the file and the seconds spent reading and counting it.
+        """
+        start = time.perf_counter()
+        with open(fileName, "r", encoding=encoding) as inputFile:
+            distribution = DiscreteDistribution(itertools.chain.from_iterable(map(str.split, inputFile)))
+        return distribution, time.perf_counter() - start
+
+    @staticmethod
+    def __push(levels: list, distribution: DiscreteDistribution):
+        """
+        Adds the distribution of the next shard to the tree. levels holds (level, distribution) pairs with strictly
+        decreasing levels; while the last two have the same level, they are merged into one of the next level.
+        """
+        levels.append((0, distribution))
+        while len(levels) > 1 and levels[-1][0] == levels[-2][0]:
+            level, right = levels.pop()
+            _, left = levels.pop()
+            left.addDistribution(right)
+            levels.append((level + 1, left))
+
+    @staticmethod
+    def __merge(levels: list) -> DiscreteDistribution:
+        """
+        Merges the distributions left in the tree, in shard order.
+        """
+        if len(levels) == 0:
+            return DiscreteDistribution()
+        result = levels[0][1]
+        for _, distribution in levels[1:]:
+            result.addDistribution(distribution)
+        return result
+
+    def __run(self,
+              function,
+              shards) -> DiscreteDistribution:
+        """
+        Counts the shards with the given function and merges the results in shard order. The shards are submitted
+        lazily, so the input is consumed only as fast as the workers count it; results that arrive ahead of an
+        earlier shard wait until that shard is merged, and count against the shards in flight until then.
+
+        PARAMETERS
+        ----------
+        function
+            Function counting one shard, returning its distribution and timing.
+        shards
+            Iterable of argument tuples of the function, one for each shard.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            The merged distribution.
+        """
+        self.__shardTimings = []
+        levels = []
+        if self.__numberOfProcesses <= 1:
+            for index, arguments in enumerate(shards):
+                distribution, seconds = function(*arguments)
+                self.__shardTimings.append((index, int(distribution.getSum()), seconds))
+                ShardedCounter.__push(levels, distribution)
+            return ShardedCounter.__merge(levels)
+        with concurrent.futures.ProcessPoolExecutor(self.__numberOfProcesses) as executor:
+            pending = {}
+            finished = {}
+            nextShard = 0
+            shards = enumerate(shards)
+            exhausted = False
+            while not exhausted or len(pending) > 0:
+                while not exhausted and len(pending) + len(finished) < 2 * self.__numberOfProcesses:
+                    shard = next(shards, None)
+                    if shard is None:
+                        exhausted = True
+                    else:
+                        index, arguments = shard
+                        pending[executor.submit(function, *arguments)] = index
+                if len(pending) == 0:
+                    break
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    finished[pending.pop(future)] = future.result()
+                while nextShard in finished:
+                    distribution, seconds = finished.pop(nextShard)
+                    self.__shardTimings.append((nextShard, int(distribution.getSum()), seconds))
+                    ShardedCounter.__push(levels, distribution)
+                    nextShard = nextShard + 1
+        return ShardedCounter.__merge(levels)
+
+    def countItems(self, items) -> DiscreteDistribution:
+        """
+        The countItems method counts the given iterable in shards of shardSize items and returns the same
+        distribution as counting it sequentially with addItems.
+
+        PARAMETERS
+        ----------
+        items
+            Iterable of picklable items, consumed once.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the items.
+        """
+        iterator = iter(items)
+        chunks = iter(lambda: list(itertools.islice(iterator, self.__shardSize)), [])
+        return self.__run(ShardedCounter._countShard, ((chunk,) for chunk in chunks))
+
+    def countFiles(self,
+                   fileNames: list,
+                   encoding: str = "utf8") -> DiscreteDistribution:
+        """
+        The countFiles method counts the whitespace separated tokens of the given files, one file per shard, and
+        returns the same distribution as counting the files sequentially in the given order.
+
+        PARAMETERS
+        ----------
+        fileNames : list
+            Names of the files.
+        encoding : str
+            Encoding of the files.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the tokens.
+        """
+        return self.__run(ShardedCounter._countFile, ((fileName, encoding) for fileName in fileNames))
+
+    def getShardTimings(self) -> list:
+        """
+        Getter for the timings of the shards counted by the last countItems or countFiles call.
+
+        RETURNS
+        -------
+        list
+            List of (shard index, number of items, seconds) tuples in shard order, the seconds being the time spent
+            counting the shard in its worker.
+        """
+        return self.__shardTimings
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import bisect
+from array import array
+
+from Math.Matrix import Matrix
+from Math.MatrixColumnMismatch import MatrixColumnMismatch
+from Math.MatrixNotSquare import MatrixNotSquare
+from Math.MatrixRowColumnMismatch import MatrixRowColumnMismatch
+from Math.MatrixRowMismatch import MatrixRowMismatch
+from Math.Vector import Vector
+
+
+class SparseMatrix(object):
+    """
+    A row x col matrix stored in compressed sparse row (CSR) format. The nonzero items of row i are kept in
+    values[rowPointers[i]:rowPointers[i + 1]], sorted by their column indexes in columnIndexes. Memory and the cost of
+    every operation grow with the number of nonzero items, not with row x col. The transpose of a CSR matrix is the
+    compressed sparse column (CSC) form of the same matrix.
+    """
+    __row: int
+    __col: int
+    __rowPointers: array
+    __columnIndexes: array
+    __values: array
+
+    def __init__(self,
+                 row: int,
+                 col: int,
+                 triplets: list = None):
+        """
+        Constructor of SparseMatrix class which takes the dimensions and the nonzero items as (row, column, value)
+        triplets (COO format). Items given more than once are summed up, items summing up to zero are not stored.
+
+        PARAMETERS
+        ----------
+        row : int
+            Number of rows.
+        col : int
+            Number of columns.
+        triplets : list
+            List of (row, column, value) tuples. If None, the matrix is all zeros.
+        """
+        self.__row = row
+        self.__col = col
+        self.__rowPointers = array('q', [0]) * (row + 1)
+        self.__columnIndexes = array('q')
+        self.__values = array('d')
+        if triplets is None:
+            return
+        for i, j, value in triplets:
+            if not (0 <= i < row and 0 <= j < col):
+                raise IndexError(f"Index ({i}, {j}) is out of bounds for a {row} x {col} matrix.")
+        lastRow = -1
+        lastColumn = -1
+        for i, j, value in sorted(triplets, key=lambda triplet: (triplet[0], triplet[1])):
+            if i == lastRow and j == lastColumn:
+                self.__values[-1] += value
+            else:
+                self.__columnIndexes.append(j)
+                self.__values.append(value)
+                self.__rowPointers[i + 1] += 1
+                lastRow = i
+                lastColumn = j
+        for i in range(row):
+            self.__rowPointers[i + 1] += self.__rowPointers[i]
+        if 0.0 in self.__values:
+            self.__removeZeros()
+
+    @staticmethod
+    def __fromArrays(row: int,
+                     col: int,
+                     rowPointers: array,
+                     columnIndexes: array,
+                     values: array) -> SparseMatrix:
+        """
+        Creates a SparseMatrix directly from its CSR arrays.
+        """
+        result = SparseMatrix(row, col)
+        result.__rowPointers = rowPointers
+        result.__columnIndexes = columnIndexes
+        result.__values = values
+        return result
+
+    @staticmethod
+    def fromDiscreteDistributions(distributions: list, columnIndexes: dict) -> SparseMatrix:
+        """
+        Creates a SparseMatrix whose i'th row holds the counts of the i'th DiscreteDistribution. The column of each
+        item is given by the columnIndexes map, items missing from the map are skipped.
+
+        PARAMETERS
+        ----------
+        distributions : list
+            List of DiscreteDistributions, one for each row.
+        columnIndexes : dict
+            Map from items to column indexes.
+
+        RETURNS
+        -------
+        SparseMatrix
+            len(distributions) x len(columnIndexes) sparse matrix of counts.
+        """
+        rowPointers = array('q', [0])
+        columns = array('q')
+        values = array('d')
+        for distribution in distributions:
+            entries = sorted((columnIndexes[item], count) for item, count in distribution.items()
+                             if item in columnIndexes and count != 0)
+            columns.extend([column for column, _ in entries])
+            values.extend([count for _, count in entries])
+            rowPointers.append(len(values))
+        return SparseMatrix.__fromArrays(len(distributions), len(columnIndexes), rowPointers, columns, values)
+
+    def __removeZeros(self):
+        """
+        Removes the explicitly stored zero items.
+        """
+        rowPointers = array('q', [0])
+        columns = array('q')
+        values = array('d')
+        for i in range(self.__row):
+            for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                if self.__values[k] != 0.0:
+                    columns.append(self.__columnIndexes[k])
+                    values.append(self.__values[k])
+            rowPointers.append(len(values))
+        self.__rowPointers = rowPointers
+        self.__columnIndexes = columns
+        self.__values = values
+
+    def getRow(self) -> int:
+        """
+        The getter for the row variable.
+
+        RETURNS
+        -------
+        int
+            row number.
+        """
+        return self.__row
+
+    def getColumn(self) -> int:
+        """
+        The getter for the col variable.
+
+        RETURNS
+        -------
+        int
+            column number.
+        """
+        return self.__col
+
+    def numberOfNonZeros(self) -> int:
+        """
+        Returns the number of stored nonzero items.
+
+        RETURNS
+        -------
+        int
+            number of nonzero items.
+        """
+        return len(self.__values)
+
+    def getValue(self,
+                 rowNo: int,
+                 colNo: int) -> float:
+        """
+        The getter for the item at given rowNo and colNo. The column is searched with binary search in the row.
+
+        PARAMETERS
+        ----------
+        rowNo : int
+            integer input for row number.
+        colNo : int
+            integer input for column number.
+
+        RETURNS
+        -------
+        double
+            item at given position, 0 if it is not stored.
+        """
+        start = self.__rowPointers[rowNo]
+        end = self.__rowPointers[rowNo + 1]
+        index = bisect.bisect_left(self.__columnIndexes, colNo, start, end)
+        if index < end and self.__columnIndexes[index] == colNo:
+            return self.__values[index]
+        return 0.0
+
+    def multiplyWithVectorFromRight(self, v: Vector) -> Vector:
+        """
+        The multiplyWithVectorFromRight method multiplies the matrix with the given column vector from the right. If
+        the size of the vector and the column number do not match, it throws MatrixColumnMismatch exception.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector type input.
+
+        RETURNS
+        -------
+        Vector
+            Vector that holds the result.
+        """
+        if self.__col != v.size():
+            raise MatrixColumnMismatch
+        result = []
+        for i in range(self.__row):
+            total = 0.0
+            for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                total += self.__values[k] * v.getValue(self.__columnIndexes[k])
+            result.append(total)
+        return Vector(result)
+
+    def multiplyWithVectorFromLeft(self, v: Vector) -> Vector:
+        """
+        The multiplyWithVectorFromLeft method multiplies the given row vector with the matrix from the left. If the
+        size of the vector and the row number do not match, it throws MatrixRowMismatch exception.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector type input.
+
+        RETURNS
+        -------
+        Vector
+            Vector that holds the result.
+        """
+        if self.__row != v.size():
+            raise MatrixRowMismatch
+        result = [0.0] * self.__col
+        for i in range(self.__row):
+            x = v.getValue(i)
+            if x != 0.0:
+                for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                    result[self.__columnIndexes[k]] += x * self.__values[k]
+        return Vector(result)
+
+    def multiply(self, m):
+        """
+        The multiply method multiplies the matrix with the given dense Matrix or SparseMatrix. Multiplying with a
+        Matrix returns a dense Matrix, multiplying with a SparseMatrix returns a SparseMatrix. If the column number of
+        this matrix and the row number of m do not match, it throws MatrixRowColumnMismatch exception.
+
+        PARAMETERS
+        ----------
+        m : Matrix or SparseMatrix
+            Right operand of the multiplication.
+
+        RETURNS
+        -------
+        Matrix or SparseMatrix
+            result of the multiplication.
+        """
+        if self.__col != m.getRow():
+            raise MatrixRowColumnMismatch
+        if isinstance(m, SparseMatrix):
+            return self.__multiplySparse(m)
+        q = m.getColumn()
+        rows = {}
+        result = Matrix(self.__row, q)
+        for i in range(self.__row):
+            start = self.__rowPointers[i]
+            end = self.__rowPointers[i + 1]
+            if start == end:
+                continue
+            total = [0.0] * q
+            for k in range(start, end):
+                column = self.__columnIndexes[k]
+                if column not in rows:
+                    rows[column] = [m.getValue(column, j) for j in range(q)]
+                x = self.__values[k]
+                total = [a + x * b for a, b in zip(total, rows[column])]
+            for j in range(q):
+                result.setValue(i, j, total[j])
+        return result
+
+    def __multiplySparse(self, m: SparseMatrix) -> SparseMatrix:
+        """
+        Multiplies two sparse matrices row by row, accumulating each result row in a dictionary (Gustavson's
+        algorithm).
+        """
+        rowPointers = array('q', [0])
+        columns = array('q')
+        values = array('d')
+        for i in range(self.__row):
+            accumulator = {}
+            for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                x = self.__values[k]
+                row = self.__columnIndexes[k]
+                for l in range(m.__rowPointers[row], m.__rowPointers[row + 1]):
+                    column = m.__columnIndexes[l]
+                    accumulator[column] = accumulator.get(column, 0.0) + x * m.__values[l]
+            for column in sorted(accumulator):
+                if accumulator[column] != 0.0:
+                    columns.append(column)
+                    values.append(accumulator[column])
+            rowPointers.append(len(values))
+        return SparseMatrix.__fromArrays(self.__row, m.__col, rowPointers, columns, values)
+
+    def transpose(self) -> SparseMatrix:
+        """
+        The transpose method returns the transpose of the matrix, computed with a counting sort over the column
+        indexes in O(number of nonzeros + row + col) time.
+
+        RETURNS
+        -------
+        SparseMatrix
+            Transpose of the matrix.
+        """
+        rowPointers = array('q', [0]) * (self.__col + 1)
+        for column in self.__columnIndexes:
+            rowPointers[column + 1] += 1
+        for j in range(self.__col):
+            rowPointers[j + 1] += rowPointers[j]
+        nextPosition = rowPointers[:-1]
+        columns = array('q', [0]) * len(self.__values)
+        values = array('d', [0.0]) * len(self.__values)
+        for i in range(self.__row):
+            for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                column = self.__columnIndexes[k]
+                position = nextPosition[column]
+                columns[position] = i
+                values[position] = self.__values[k]
+                nextPosition[column] = position + 1
+        return SparseMatrix.__fromArrays(self.__col, self.__row, rowPointers, columns, values)
+
+    def rowSum(self, rowNo: int) -> float:
+        """
+        The rowSum method takes a row number as an input and accumulates the items at given row.
+
+        PARAMETERS
+        ----------
+        rowNo : int
+            Row number input.
+
+        RETURNS
+        -------
+        double
+            summation of given row.
+        """
+        return sum(self.__values[self.__rowPointers[rowNo]:self.__rowPointers[rowNo + 1]], 0.0)
+
+    def sumOfRows(self) -> Vector:
+        """
+        The sumOfRows method sums up the rows of the matrix, that is, returns a Vector holding the sum of each column.
+
+        RETURNS
+        -------
+        Vector
+            Vector that holds column sums.
+        """
+        result = [0.0] * self.__col
+        for column, value in zip(self.__columnIndexes, self.__values):
+            result[column] += value
+        return Vector(result)
+
+    def topEigenvectors(self,
+                        k: int,
+                        tolerance: float = 1e-10,
+                        maxIterations: int = None) -> list:
+        """
+        The topEigenvectors method finds the k largest eigenvalues of the matrix and their eigenvectors with the
+        Lanczos algorithm, see Matrix.topEigenvectorsOf. Each step multiplies the matrix with a vector, so the cost of
+        a step is proportional to the number of nonzeros. The matrix is assumed to be symmetric; it throws
+        MatrixNotSquare exception if it is not square.
+
+        PARAMETERS
+        ----------
+        k : int
+            Number of eigenvectors to find.
+        tolerance : float
+            Relative residual norm at which an eigenpair is accepted.
+        maxIterations : int
+            Maximum number of Lanczos steps, if None the size of the matrix.
+
+        RETURNS
+        -------
+        list
+            A list of at most k Eigenvectors, sorted by eigenvalue, largest first.
+        """
+        if self.__row != self.__col:
+            raise MatrixNotSquare
+        return Matrix.topEigenvectorsOf(self, k, tolerance, maxIterations)
+
+    def toMatrix(self) -> Matrix:
+        """
+        Converts the sparse matrix to a dense Matrix.
+
+        RETURNS
+        -------
+        Matrix
+            Dense copy of the matrix.
+        """
+        result = Matrix(self.__row, self.__col)
+        for i in range(self.__row):
+            for k in range(self.__rowPointers[i], self.__rowPointers[i + 1]):
+                result.setValue(i, self.__columnIndexes[k], self.__values[k])
+        return result
+
+    def __repr__(self):
+        return f"SparseMatrix(row={self.__row}, col={self.__col}, nonzeros={len(self.__values)})"
@@ -1,14 +1,39 @@
 from __future__ import annotations
-from typing import Tuple, List, Union
+import concurrent.futures
+import itertools
+import math
+import operator
+from typing import Tuple, List, Union, Callable
+
+from Math.Backend import Backend
+
+
+def _multiply_batch(batch: Tuple[List[List[float]], List[List[float]]]) -> List[float]:
+    """
+    Multiplies one matrix of a batch, given as the rows of the left operand and the columns of the right operand. It
+    is a module level function, so that it can be sent to worker processes.
+
+    :param batch: Tuple of the rows of the left matrix and the columns of the right matrix.
+    :return: Items of the product matrix in row-major order.
+    """
+    rows, columns = batch
+    return [sum(map(operator.mul, row, column)) for row in rows for column in columns]
 
 
 class Tensor:
     """
     A class representing a multidimensional tensor that supports basic operations and broadcasting.
+
+    The items are kept in a flat data list, and the item at indices (i_0, ..., i_n) is found at
+    offset + i_0 * strides[0] + ... + i_n * strides[n]. reshape, transpose, get, partial and broadcast_to return views
+    sharing the data list of the original tensor; only the shape, the strides and the offset are new. Writing to a
+    view with setValue also changes the tensor it was taken from. contiguous returns a tensor with its own row-major
+    copy of the data.
     """
     __data: list[float]
     __shape: Tuple[int, ...]
     __strides: Tuple[int, ...]
+    __offset: int
 
     def __init__(self, data: Union[List, List[List], List[List[List]]], shape: Tuple[int, ...] = None):
         """
@@ -25,14 +50,92 @@ class Tensor:
             raise ValueError("Shape does not match the number of elements in data.")
         self.__shape = shape
         self.__strides = self.__compute_strides(shape)
+        self.__offset = 0
         self.__data = flattened_data
 
+    @staticmethod
+    def __view(data: List[float], shape: Tuple[int, ...], strides: Tuple[int, ...], offset: int) -> Tensor:
+        """
+        Creates a tensor sharing the given data list without copying it.
+
+        :param data: Flat data list to share.
+        :param shape: The shape of the view.
+        :param strides: The strides of the view in the data list.
+        :param offset: Position of the first item of the view in the data list.
+        :return: Tensor view over the data list.
+        """
+        result = Tensor.__new__(Tensor)
+        result.__data = data
+        result.__shape = tuple(shape)
+        result.__strides = tuple(strides)
+        result.__offset = offset
+        return result
+
     def getData(self) -> List[float]:
-        return self.__data
+        """
+        Returns the items of the tensor in row-major order. For a tensor owning a contiguous data list the list itself
+        is returned, for other views the items are copied into a new list.
+
+        :return: Flat list of tensor elements.
+        """
+        if self.__offset == 0 and len(self.__data) == self.__compute_num_elements(self.__shape) \
+                and self.isContiguous():
+            return self.__data
+        return self.__materialize()
 
     def getShape(self) -> Tuple[int, ...]:
         return self.__shape
 
+    def getStrides(self) -> Tuple[int, ...]:
+        return self.__strides
+
+    def isContiguous(self) -> bool:
+        """
+        Checks if the items of the tensor are stored consecutively in row-major order in its data list.
+
+        :return: True if the tensor is contiguous, false otherwise.
+        """
+        expected = 1
+        for dim, stride in zip(reversed(self.__shape), reversed(self.__strides)):
+            if dim != 1 and stride != expected:
+                return False
+            expected *= dim
+        return True
+
+    def contiguous(self) -> Tensor:
+        """
+        Returns a tensor with the same items stored consecutively in row-major order. A contiguous tensor is returned
+        as it is, otherwise the items are copied.
+
+        :return: Contiguous tensor.
+        """
+        if self.isContiguous():
+            return self
+        return Tensor.__view(self.__materialize(), self.__shape, self.__compute_strides(self.__shape), 0)
+
+    def __materialize(self) -> List[float]:
+        """
+        Copies the items of the tensor into a new list in row-major order. The innermost dimension is copied with a
+        single slice of the data list.
+
+        :return: Flat list of tensor elements.
+        """
+        total = self.__compute_num_elements(self.__shape)
+        if self.isContiguous():
+            return self.__data[self.__offset:self.__offset + total]
+        starts = [self.__offset]
+        for dim, stride in zip(self.__shape[:-1], self.__strides[:-1]):
+            starts = [start + i * stride for start in starts for i in range(dim)]
+        last = self.__shape[-1]
+        last_stride = self.__strides[-1]
+        result = []
+        for start in starts:
+            if last_stride == 0:
+                result.extend([self.__data[start]] * last)
+            else:
+                result.extend(self.__data[start:start + last * last_stride:last_stride])
+        return result
+
     def __infer_shape(self, data: Union[List, List[List], List[List[List]]]) -> Tuple[int, ...]:
         """
         Infers the shape of the tensor from nested lists.
@@ -116,13 +219,13 @@ class Tensor:
                 new_shape.append(self.__shape[i] + tensor.__shape[i])
             else:
                 new_shape.append(self.__shape[i])
+        data1 = self.__materialize()
+        data2 = tensor.__materialize()
         new_list = []
         for i in range(start_index):
-            for j in range(end_index1):
-                new_list.append(self.__data[i * end_index1 + j])
-            for j in range(end_index2):
-                new_list.append(tensor.__data[i * end_index2 + j])
-        return Tensor(new_list, tuple(new_shape))
+            new_list.extend(data1[i * end_index1:(i + 1) * end_index1])
+            new_list.extend(data2[i * end_index2:(i + 1) * end_index2])
+        return Tensor.__view(new_list, tuple(new_shape), self.__compute_strides(tuple(new_shape)), 0)
 
     def get(self, dimensions: Tuple[int, ...]) -> Tensor:
         """
@@ -130,16 +233,14 @@ class Tensor:
         :param dimensions: Given dimensions
         :return: a subTensor
         """
-        new_shape = self.__shape[len(dimensions):len(self.__shape)]
-        i = 0
-        start = 0
-        end = len(self.__data)
-        while i < len(dimensions):
-            parts = (end - start) // self.__shape[i]
-            start += parts * dimensions[i]
-            end = start + parts
-            i = i + 1
-        return Tensor(self.__data[start:end], tuple(new_shape))
+        if len(dimensions) > len(self.__shape):
+            raise IndexError(f"Expected at most {len(self.__shape)} indices but got {len(dimensions)}.")
+        offset = self.__offset
+        for i, index in enumerate(dimensions):
+            if not (0 <= index < self.__shape[i]):
+                raise IndexError(f"Index {dimensions} is out of bounds for shape {self.__shape}.")
+            offset += index * self.__strides[i]
+        return Tensor.__view(self.__data, self.__shape[len(dimensions):], self.__strides[len(dimensions):], offset)
 
     def getValue(self, indices: Tuple[int, ...]) -> float:
         """
@@ -149,7 +250,7 @@ class Tensor:
         :return: Value at the specified position.
         """
         self.__validate_indices(indices)  # Ensure indices are valid
-        flat_index = sum(i * stride for i, stride in zip(indices, self.__strides))
+        flat_index = self.__offset + sum(i * stride for i, stride in zip(indices, self.__strides))
         return self.__data[flat_index]
 
     def setValue(self, indices: Tuple[int, ...], value: float):
@@ -160,23 +261,27 @@ class Tensor:
         :param value: Value to set at the specified position.
         """
         self.__validate_indices(indices)  # Ensure indices are valid
-        flat_index = sum(i * stride for i, stride in zip(indices, self.__strides))
+        flat_index = self.__offset + sum(i * stride for i, stride in zip(indices, self.__strides))
         self.__data[flat_index] = value
 
     def reshape(self, new_shape: Tuple[int, ...]) -> Tensor:
         """
-        Reshapes the tensor to the specified new shape.
+        Reshapes the tensor to the specified new shape. A contiguous tensor is reshaped without copying its data,
+        other views are copied first.
 
         :param new_shape: Tuple representing the new shape.
         :return: New tensor with the specified shape.
         """
         if self.__compute_num_elements(new_shape) != self.__compute_num_elements(self.__shape):
             raise ValueError("Total number of elements must remain the same.")
-        return Tensor(self.__data, new_shape)
+        source = self.contiguous()
+        return Tensor.__view(source.__data, tuple(new_shape), self.__compute_strides(tuple(new_shape)),
+                             source.__offset)
 
     def transpose(self, axes: Tuple[int, ...] = None) -> Tensor:
         """
-        Transposes the tensor according to the specified axes.
+        Transposes the tensor according to the specified axes. The data is not copied, only the shape and the strides
+        are permuted.
 
         :param axes: Tuple representing the order of axes. If None, reverses the axes.
         :return: New tensor with transposed axes.
@@ -186,38 +291,8 @@ class Tensor:
         if sorted(axes) != list(range(len(self.__shape))):
             raise ValueError("Invalid transpose axes.")
         new_shape = tuple(self.__shape[axis] for axis in axes)
-        flattened_data = self.__transpose_flattened_data(axes, new_shape)
-        return Tensor(flattened_data, new_shape)
-
-    def __transpose_flattened_data(self, axes: Tuple[int, ...], new_shape: Tuple[int, ...]) -> List[float]:
-        """
-        Rearranges the flattened data for transposition.
-
-        :param axes: Tuple representing the order of axes.
-        :param new_shape: Tuple representing the new shape.
-        :return: Flattened list of transposed data.
-        """
-        new_strides = self.__compute_strides(new_shape)
-        flattened_data = []
-        for i in range(self.__compute_num_elements(new_shape)):
-            new_indices = self.__unflatten_index(i, new_strides)
-            original_indices = [new_indices[axes.index(dim)] for dim in range(len(self.__shape))]
-            flattened_data.append(self.getValue(tuple(original_indices)))
-        return flattened_data
-
-    def __unflatten_index(self, flat_index: int, strides: Tuple[int, ...]) -> List[int]:
-        """
-        Converts a flat index to multi-dimensional indices based on strides.
-
-        :param flat_index: The flat index to convert.
-        :param strides: Tuple representing the strides.
-        :return: List of multi-dimensional indices.
-        """
-        indices = []
-        for stride in strides:
-            indices.append(flat_index // stride)
-            flat_index %= stride
-        return indices
+        new_strides = tuple(self.__strides[axis] for axis in axes)
+        return Tensor.__view(self.__data, new_shape, new_strides, self.__offset)
 
     def __broadcast_shape(self, shape1: Tuple[int, ...], shape2: Tuple[int, ...]) -> Tuple[int, ...]:
         """
@@ -245,23 +320,69 @@ class Tensor:
 
     def broadcast_to(self, target_shape: Tuple[int, ...]) -> Tensor:
         """
-        Broadcasts the tensor to the specified target shape.
+        Broadcasts the tensor to the specified target shape. The data is not copied, the broadcast dimensions get
+        stride 0, so all their indices refer to the same items.
 
         :param target_shape: Tuple representing the target shape.
         :return: New tensor with the target shape.
         """
         expanded_shape = [1] * (len(target_shape) - len(self.__shape)) + list(self.__shape)
-        if not all(dim1 == dim2 or dim1 == 1 for dim1, dim2 in zip(expanded_shape, target_shape)):
+        expanded_strides = [0] * (len(target_shape) - len(self.__shape)) + list(self.__strides)
+        if len(expanded_shape) != len(target_shape) or \
+                not all(dim1 == dim2 or dim1 == 1 for dim1, dim2 in zip(expanded_shape, target_shape)):
             raise ValueError(f"Cannot broadcast shape {self.__shape} to {target_shape}")
-        new_data = []
-        target_strides = self.__compute_strides(target_shape)
-        for index in range(self.__compute_num_elements(target_shape)):
-            indices = self.__unflatten_index(index, target_strides)
-            original_indices = tuple(
-                idx if size > 1 else 0 for idx, size in zip(indices, expanded_shape)
-            )
-            new_data.append(self.getValue(original_indices))
-        return Tensor(new_data, target_shape)
+        new_strides = tuple(stride if dim1 == dim2 else 0
+                            for dim1, dim2, stride in zip(expanded_shape, target_shape, expanded_strides))
+        return Tensor.__view(self.__data, tuple(target_shape), new_strides, self.__offset)
+
+    def __inner_items(self, start: int, length: int, stride: int):
+        """
+        Returns the items of one innermost run of the tensor, repeating the item if the run is broadcast.
+
+        :param start: Position of the first item of the run in the data list.
+        :param length: Number of items in the run.
+        :param stride: Distance between consecutive items of the run in the data list.
+        :return: Iterable over the items of the run.
+        """
+        if stride == 0:
+            return itertools.repeat(self.__data[start], length)
+        return self.__data[start:start + length * stride:stride]
+
+    def elementwise(self, other: Tensor, operation: Callable[[float, float], float]) -> Tensor:
+        """
+        Applies a binary operation element-wise with broadcasting. Both operands are walked through their strides,
+        the broadcast dimensions having stride 0, so no broadcast copy of either operand is made; the only new list is
+        the result. Adjacent dimensions that are consecutive in both operands are merged, so that the operation is
+        mapped over runs as long as possible.
+
+        :param other: The other tensor.
+        :param operation: Binary function applied to the pairs of corresponding items.
+        :return: New tensor with the result of the operation.
+        """
+        broadcast_shape = self.__broadcast_shape(self.__shape, other.__shape)
+        tensor1 = self.broadcast_to(broadcast_shape)
+        tensor2 = other.broadcast_to(broadcast_shape)
+        dimensions = [(1, 0, 0)]
+        for dim, stride1, stride2 in zip(reversed(broadcast_shape), reversed(tensor1.__strides),
+                                         reversed(tensor2.__strides)):
+            inner_dim, inner_stride1, inner_stride2 = dimensions[-1]
+            if dim == 1:
+                continue
+            if inner_dim == 1:
+                dimensions[-1] = (dim, stride1, stride2)
+            elif stride1 == inner_stride1 * inner_dim and stride2 == inner_stride2 * inner_dim:
+                dimensions[-1] = (dim * inner_dim, inner_stride1, inner_stride2)
+            else:
+                dimensions.append((dim, stride1, stride2))
+        last, last_stride1, last_stride2 = dimensions[0]
+        starts = [(tensor1.__offset, tensor2.__offset)]
+        for dim, stride1, stride2 in reversed(dimensions[1:]):
+            starts = [(start1 + i * stride1, start2 + i * stride2) for start1, start2 in starts for i in range(dim)]
+        result_data = []
+        for start1, start2 in starts:
+            result_data.extend(map(operation, tensor1.__inner_items(start1, last, last_stride1),
+                                   tensor2.__inner_items(start2, last, last_stride2)))
+        return Tensor.__view(result_data, broadcast_shape, self.__compute_strides(broadcast_shape), 0)
 
     def add(self, other: Tensor) -> Tensor:
         """
@@ -270,14 +391,7 @@ class Tensor:
         :param other: The other tensor to add.
         :return: New tensor with the result of the addition.
         """
-        broadcast_shape = self.__broadcast_shape(self.__shape, other.__shape)
-        tensor1 = self.broadcast_to(broadcast_shape)
-        tensor2 = other.broadcast_to(broadcast_shape)
-        result_data = [
-            tensor1.__data[i] + tensor2.__data[i]
-            for i in range(self.__compute_num_elements(broadcast_shape))
-        ]
-        return Tensor(result_data, broadcast_shape)
+        return self.elementwise(other, operator.add)
 
     def subtract(self, other: Tensor) -> Tensor:
         """
@@ -286,14 +400,7 @@ class Tensor:
         :param other: The other tensor to subtract.
         :return: New tensor with the result of the subtraction.
         """
-        broadcast_shape = self.__broadcast_shape(self.__shape, other.__shape)
-        tensor1 = self.broadcast_to(broadcast_shape)
-        tensor2 = other.broadcast_to(broadcast_shape)
-        result_data = [
-            tensor1.__data[i] - tensor2.__data[i]
-            for i in range(self.__compute_num_elements(broadcast_shape))
-        ]
-        return Tensor(result_data, broadcast_shape)
+        return self.elementwise(other, operator.sub)
 
     def hadamardProduct(self, other: Tensor) -> Tensor:
         """
@@ -302,57 +409,136 @@ class Tensor:
         :param other: The other tensor to multiply.
         :return: New tensor with the result of the multiplication.
         """
-        broadcast_shape = self.__broadcast_shape(self.__shape, other.__shape)
-        tensor1 = self.broadcast_to(broadcast_shape)
-        tensor2 = other.broadcast_to(broadcast_shape)
-        result_data = [
-            tensor1.__data[i] * tensor2.__data[i]
-            for i in range(self.__compute_num_elements(broadcast_shape))
-        ]
-        return Tensor(result_data, broadcast_shape)
+        return self.elementwise(other, operator.mul)
+
+    def divide(self, other: Tensor) -> Tensor:
+        """
+        Divides one tensor by another element-wise with broadcasting.
+
+        :param other: The other tensor to divide by.
+        :return: New tensor with the result of the division.
+        """
+        return self.elementwise(other, operator.truediv)
+
+    def maximum(self, other: Tensor) -> Tensor:
+        """
+        Takes the element-wise maximum of two tensors with broadcasting.
+
+        :param other: The other tensor.
+        :return: New tensor with the larger of the corresponding items.
+        """
+        return self.elementwise(other, max)
 
-    def multiply(self, other: Tensor) -> Tensor:
+    def minimum(self, other: Tensor) -> Tensor:
+        """
+        Takes the element-wise minimum of two tensors with broadcasting.
+
+        :param other: The other tensor.
+        :return: New tensor with the smaller of the corresponding items.
+        """
+        return self.elementwise(other, min)
+
+    def power(self, other: Tensor) -> Tensor:
+        """
+        Raises the items of one tensor to the powers in another element-wise with broadcasting.
+
+        :param other: The tensor of exponents.
+        :return: New tensor with the result of the exponentiation.
+        """
+        return self.elementwise(other, operator.pow)
+
+    def __batch_offsets(self, batch_shape: Tuple[int, ...]) -> List[int]:
+        """
+        Computes the position of the first item of every matrix in the batch, in row-major order of the batch indices.
+
+        :param batch_shape: Tuple representing the batch shape, the leading dimensions of the tensor.
+        :return: List of data list positions, one for each matrix in the batch.
+        """
+        offsets = [self.__offset]
+        for dim, stride in zip(batch_shape, self.__strides):
+            offsets = [offset + i * stride for offset in offsets for i in range(dim)]
+        return offsets
+
+    def __matrix_rows(self, offset: int) -> List[List[float]]:
+        """
+        Slices the rows of the matrix starting at the given position, the last two dimensions of the tensor.
+
+        :param offset: Position of the first item of the matrix in the data list.
+        :return: List of rows of the matrix.
+        """
+        rows, cols = self.__shape[-2:]
+        row_stride, col_stride = self.__strides[-2:]
+        return [list(self.__inner_items(offset + i * row_stride, cols, col_stride)) for i in range(rows)]
+
+    def __matrix_columns(self, offset: int) -> List[List[float]]:
+        """
+        Slices the columns of the matrix starting at the given position, the last two dimensions of the tensor.
+
+        :param offset: Position of the first item of the matrix in the data list.
+        :return: List of columns of the matrix.
+        """
+        rows, cols = self.__shape[-2:]
+        row_stride, col_stride = self.__strides[-2:]
+        return [list(self.__inner_items(offset + j * col_stride, rows, row_stride)) for j in range(cols)]
+
+    def multiply(self, other: Tensor, workers: int = None) -> Tensor:
         """
         Performs matrix multiplication (batched if necessary).
 
-        For tensors of shape (..., M, K) and (..., K, N), returns (..., M, N).
+        For tensors of shape (..., M, K) and (..., K, N), returns (..., M, N). The batch dimensions are broadcast
+        through strides without copying the operands. For every matrix in the batch the rows of the left operand and
+        the columns of the right operand are sliced once, and each result item is the inner product of a row and a
+        column. Matrices shared by several batches, such as a broadcast weight matrix, are sliced only once. With the
+        numpy backend and no workers, int and float tensors are multiplied with numpy.matmul instead; integer items
+        stay integers, as in the Python kernel.
 
         :param other: Tensor with shape compatible for matrix multiplication.
+        :param workers: If greater than 1, the batches are multiplied by the Python kernel in a pool of that many
+            worker processes, whatever the backend.
         :return: Tensor resulting from matrix multiplication.
         """
         if self.__shape[-1] != other.__shape[-2]:
             raise ValueError(f"Shapes {self.__shape} and {other.__shape} are not aligned for multiplication.")
-        batch_shape = self.__shape[:-2]
         m, k1 = self.__shape[-2:]
         k2, n = other.__shape[-2:]
         if k1 != k2:
             raise ValueError("Inner dimensions must match for matrix multiplication.")
-        # Broadcasting batch shape if necessary
-        if batch_shape != other.__shape[:-2]:
-            broadcast_shape = self.__broadcast_shape(self.__shape[:-2], other.__shape[:-2])
-            self_broadcasted = self.broadcast_to(broadcast_shape + (m, k1))
-            other_broadcasted = other.broadcast_to(broadcast_shape + (k2, n))
+        size = self.__compute_num_elements(self.__shape) + self.__compute_num_elements(other.__shape)
+        if (workers is None or workers <= 1) and Backend.useNumpy(size):
+            numpy = Backend.getNumpy()
+            left = numpy.array(self.__materialize()).reshape(self.__shape)
+            right = numpy.array(other.__materialize()).reshape(other.__shape)
+            if left.dtype.kind in "if" and right.dtype.kind in "if":
+                product = numpy.matmul(left, right)
+                return Tensor(product.ravel().tolist(), tuple(product.shape))
+        broadcast_shape = self.__broadcast_shape(self.__shape[:-2], other.__shape[:-2])
+        self_broadcasted = self.broadcast_to(broadcast_shape + (m, k1))
+        other_broadcasted = other.broadcast_to(broadcast_shape + (k2, n))
+        rows_cache = {}
+        columns_cache = {}
+        batches = []
+        for self_offset, other_offset in zip(self_broadcasted.__batch_offsets(broadcast_shape),
+                                             other_broadcasted.__batch_offsets(broadcast_shape)):
+            if self_offset not in rows_cache:
+                rows_cache[self_offset] = self_broadcasted.__matrix_rows(self_offset)
+            if other_offset not in columns_cache:
+                columns_cache[other_offset] = other_broadcasted.__matrix_columns(other_offset)
+            batches.append((rows_cache[self_offset], columns_cache[other_offset]))
+        result_data = []
+        if workers is not None and workers > 1 and len(batches) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                for product in pool.map(_multiply_batch, batches, chunksize=max(1, len(batches) // workers)):
+                    result_data.extend(product)
         else:
-            broadcast_shape = batch_shape
-            self_broadcasted = self
-            other_broadcasted = other
+            for batch in batches:
+                result_data.extend(_multiply_batch(batch))
         result_shape = broadcast_shape + (m, n)
-        result_data = []
-        for i in range(self.__compute_num_elements(result_shape)):
-            indices = self.__unflatten_index(i, self.__compute_strides(result_shape))
-            batch_idx = tuple(indices[:-2])
-            row, col = indices[-2], indices[-1]
-            sum_result = 0
-            for k in range(k1):
-                a_idx = batch_idx + (row, k)
-                b_idx = batch_idx + (k, col)
-                sum_result += self_broadcasted.getValue(a_idx) * other_broadcasted.getValue(b_idx)
-            result_data.append(sum_result)
-        return Tensor(result_data, result_shape)
-    
+        return Tensor.__view(result_data, result_shape, self.__compute_strides(result_shape), 0)
+
     def partial(self, start_indices: Tuple[int, ...], end_indices: Tuple[int, ...]) -> Tensor:
         """
-        Extracts a sub-tensor from the given start indices to the end indices.
+        Extracts a sub-tensor from the given start indices to the end indices. The sub-tensor is a view sharing the
+        data of this tensor.
 
         :param start_indices: Tuple specifying the start indices for each dimension.
         :param end_indices: Tuple specifying the end indices (exclusive) for each dimension.
@@ -360,16 +546,166 @@ class Tensor:
         """
         if len(start_indices) != len(self.__shape) or len(end_indices) != len(self.__shape):
             raise ValueError("start_indices and end_indices must match the number of dimensions.")
+        for start, end, dim in zip(start_indices, end_indices, self.__shape):
+            if not (0 <= start <= end <= dim):
+                raise IndexError(f"Range {start_indices} - {end_indices} is out of bounds for shape {self.__shape}.")
         # Compute the new shape of the extracted sub-tensor
         new_shape = tuple(end - start for start, end in zip(start_indices, end_indices))
-        # Extract data from the original tensor
-        sub_data = []
-        new_strides = self.__compute_strides(new_shape)
-        for i in range(self.__compute_num_elements(new_shape)):
-            sub_indices = self.__unflatten_index(i, new_strides)
-            original_indices = tuple(start + offset for start, offset in zip(start_indices, sub_indices))
-            sub_data.append(self.getValue(original_indices))
-        return Tensor(sub_data, new_shape)
+        offset = self.__offset + sum(start * stride for start, stride in zip(start_indices, self.__strides))
+        return Tensor.__view(self.__data, new_shape, self.__strides, offset)
+
+    def __normalize_axis(self, axis: int) -> int:
+        """
+        Converts a possibly negative axis into an index of the shape.
+
+        :param axis: Axis to normalize, negative values count from the last dimension.
+        :return: Axis in the range 0 to the number of dimensions - 1.
+        """
+        if not (-len(self.__shape) <= axis < len(self.__shape)):
+            raise ValueError(f"Axis {axis} is out of bounds for shape {self.__shape}.")
+        return axis % len(self.__shape)
+
+    def __axis_offsets(self, axis: int) -> List[int]:
+        """
+        Computes the position of the first item of every run along the given axis, in row-major order of the indices of
+        the other dimensions.
+
+        :param axis: The axis of the runs.
+        :return: List of data list positions, one for each run.
+        """
+        offsets = [self.__offset]
+        for i, (dim, stride) in enumerate(zip(self.__shape, self.__strides)):
+            if i != axis:
+                offsets = [offset + j * stride for offset in offsets for j in range(dim)]
+        return offsets
+
+    def __reduce(self, axis: int, keepdims: bool, function: Callable[[List[float]], float]) -> Tensor:
+        """
+        Reduces the tensor along an axis, applying the given function to every run of items along that axis. Each run
+        is read with a single slice of the data list.
+
+        :param axis: The axis to reduce. If None, all items are reduced into one.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :param function: Function mapping a list of items to a single value.
+        :return: New tensor with the reduced values.
+        """
+        if axis is None:
+            new_shape = (1,) * len(self.__shape) if keepdims else ()
+            return Tensor.__view([function(self.__materialize())], new_shape, self.__compute_strides(new_shape), 0)
+        axis = self.__normalize_axis(axis)
+        length = self.__shape[axis]
+        stride = self.__strides[axis]
+        result_data = [function(list(self.__inner_items(offset, length, stride)))
+                       for offset in self.__axis_offsets(axis)]
+        if keepdims:
+            new_shape = self.__shape[:axis] + (1,) + self.__shape[axis + 1:]
+        else:
+            new_shape = self.__shape[:axis] + self.__shape[axis + 1:]
+        return Tensor.__view(result_data, new_shape, self.__compute_strides(new_shape), 0)
+
+    def sum(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Sums the items along the given axis.
+
+        :param axis: The axis to sum over. If None, all items are summed.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the sums.
+        """
+        return self.__reduce(axis, keepdims, sum)
+
+    def mean(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Averages the items along the given axis.
+
+        :param axis: The axis to average over. If None, all items are averaged.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the means.
+        """
+        return self.__reduce(axis, keepdims, lambda items: sum(items) / len(items))
+
+    def max(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Finds the maximum of the items along the given axis.
+
+        :param axis: The axis to search. If None, the maximum of all items is found.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the maximums.
+        """
+        return self.__reduce(axis, keepdims, max)
+
+    def min(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Finds the minimum of the items along the given axis.
+
+        :param axis: The axis to search. If None, the minimum of all items is found.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the minimums.
+        """
+        return self.__reduce(axis, keepdims, min)
+
+    def argmax(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Finds the index of the maximum item along the given axis. If the maximum occurs more than once, the first index
+        is returned.
+
+        :param axis: The axis to search. If None, the index is in the row-major order of all items.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the indices of the maximums.
+        """
+        return self.__reduce(axis, keepdims, lambda items: max(range(len(items)), key=items.__getitem__))
+
+    def var(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Computes the population variance of the items along the given axis.
+
+        :param axis: The axis to compute the variance over. If None, the variance of all items is computed.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the variances.
+        """
+        def variance(items: List[float]) -> float:
+            average = sum(items) / len(items)
+            return sum((x - average) * (x - average) for x in items) / len(items)
+        return self.__reduce(axis, keepdims, variance)
+
+    def logsumexp(self, axis: int = None, keepdims: bool = False) -> Tensor:
+        """
+        Computes log(sum(exp(x))) of the items along the given axis. The maximum of the items is subtracted before
+        exponentiation, so large items do not overflow.
+
+        :param axis: The axis to reduce. If None, all items are reduced.
+        :param keepdims: If true, the reduced axis is kept with size 1.
+        :return: New tensor with the results.
+        """
+        def log_sum_exp(items: List[float]) -> float:
+            maximum = max(items)
+            if math.isinf(maximum):
+                return maximum
+            return maximum + math.log(sum(math.exp(x - maximum) for x in items))
+        return self.__reduce(axis, keepdims, log_sum_exp)
+
+    def softmax(self, axis: int = -1) -> Tensor:
+        """
+        Applies the softmax function along the given axis, so that the items of every run along that axis are positive
+        and sum up to 1. The maximum of each run is subtracted before exponentiation for numerical stability.
+
+        :param axis: The axis to normalize over, the last axis by default.
+        :return: New tensor of the same shape with the softmax values.
+        """
+        axis = self.__normalize_axis(axis)
+        length = self.__shape[axis]
+        stride = self.__strides[axis]
+        result_strides = self.__compute_strides(self.__shape)
+        result_stride = result_strides[axis]
+        result_data = [0.0] * self.__compute_num_elements(self.__shape)
+        result = Tensor.__view(result_data, self.__shape, result_strides, 0)
+        for offset, result_offset in zip(self.__axis_offsets(axis), result.__axis_offsets(axis)):
+            items = list(self.__inner_items(offset, length, stride))
+            maximum = max(items)
+            exponents = [math.exp(x - maximum) for x in items]
+            total = sum(exponents)
+            result_data[result_offset:result_offset + length * result_stride:result_stride] = \
+                [x / total for x in exponents]
+        return result
 
     def format_tensor(self, data: List[float], shape: Tuple[int, ...]) -> Union[float, List]:
         if len(shape) == 1:
@@ -383,5 +719,5 @@ class Tensor:
 
         :return: String representing the tensor.
         """
-        formatted_data = self.format_tensor(self.__data, self.__shape)
+        formatted_data = self.format_tensor(self.__materialize(), self.__shape)
         return f"Tensor(shape={self.__shape}, data={formatted_data})"
@@ -1,39 +1,60 @@
 from __future__ import annotations
 import math
+import operator
 
+from Math.Backend import Backend
 from Math.VectorSizeMismatch import VectorSizeMismatch
 
 
 class Vector(object):
+    """
+    A real valued vector. Vector declares __slots__, so a Vector carries no per-instance dictionary and the size of
+    the vector is the length of its values list. Results are built in bulk with comprehensions instead of appending
+    one item at a time.
+    """
+    __slots__ = ('__values',)
 
-    __size: int
     __values: list[float]
 
     def constructor1(self):
         self.__values = []
-        self.__size = 0
 
-    def constructor2(self, values: list):
-        self.__values = values.copy()
-        self.__size = len(values)
+    def constructor2(self, values):
+        self.__values = list(values)
+
+    @staticmethod
+    def __fromList(values: list) -> Vector:
+        """
+        Creates a Vector that takes over the given list without copying it.
+        """
+        result = Vector.__new__(Vector)
+        result.__values = values
+        return result
+
+    def __checkOut(self, out: Vector):
+        """
+        Checks that the given output Vector has the same size as this vector.
+        """
+        if len(out.__values) != len(self.__values):
+            raise VectorSizeMismatch
 
     def __init__(self,
                  valuesOrSize=None,
                  initial=None):
         """
         A constructor of Vector class which takes a list values as an input. Then, initializes
-        values list and size variable with given input and its size.
+        values list with a copy of the given input.
 
         PARAMETERS
         ----------
         valuesOrSize
-            list input or size.
+            list or tuple input, or size.
         initial
             initial value for each element
         """
         if valuesOrSize is None:
             self.constructor1()
-        elif isinstance(valuesOrSize, list):
+        elif isinstance(valuesOrSize, (list, tuple)):
             self.constructor2(valuesOrSize)
         else:
             self.initAllSame(valuesOrSize, initial)
@@ -42,8 +63,8 @@ class Vector(object):
                     size: int,
                     x: float):
         """
-        Another constructor of Vector class which takes integer size and double x as inputs. Then, initializes size
-        variable with given size input and creates new values list and adds given input x to values list.
+        Another constructor of Vector class which takes integer size and double x as inputs. Then, creates new values
+        list of the given size, each item being the given input x.
 
         PARAMETERS
         ----------
@@ -52,10 +73,7 @@ class Vector(object):
         x : double
             item to add values list.
         """
-        self.__size = size
-        self.__values = []
-        for i in range(size):
-            self.__values.append(x)
+        self.__values = [x] * size
 
     def initAllZerosExceptOne(self,
                               size: int,
@@ -63,8 +81,8 @@ class Vector(object):
                               x: float):
         """
         Another constructor of Vector class which takes integer size, integer index and double x as inputs.
-        Then, initializes size variable with given size input and creates new values list and adds 0.0 to
-        values list. Then, sets the item of values list at given index as given input x.
+        Then, creates new values list of the given size filled with 0.0. Then, sets the item of values list at given
+        index as given input x.
 
         PARAMETERS
         ----------
@@ -75,31 +93,23 @@ class Vector(object):
         x : double
             item to add values list's given index.
         """
-        self.__size = size
-        self.__values = []
-        for i in range(size):
-            self.__values.append(0.0)
+        self.__values = [0.0] * size
         self.__values[index] = x
 
     def biased(self) -> Vector:
         """
-        The biased method creates a list result, add adds each item of values list into the result list.
-        Then, insert 1.0 to 0th position and return result list.
+        The biased method creates a new Vector whose 0th item is 1.0, followed by the items of values list.
 
         RETURNS
         -------
-        list
-            result list.
+        Vector
+            result Vector.
         """
-        result = Vector()
-        for value in self.__values:
-            result.add(value)
-        result.insert(0, 1.0)
-        return result
+        return Vector.__fromList([1.0] + self.__values)
 
     def add(self, x: float):
         """
-        The add method adds given input to the values {@link ArrayList} and increments the size variable by one.
+        The add method adds given input to the end of the values list.
 
         PARAMETERS
         ----------
@@ -107,13 +117,12 @@ class Vector(object):
             input to add values list.
         """
         self.__values.append(x)
-        self.__size = self.__size + 1
 
     def insert(self,
                pos: int,
                x: float):
         """
-        The insert method puts given input to the given index of values list and increments the size variable by one.
+        The insert method puts given input to the given index of values list.
 
         PARAMETERS
         ----------
@@ -123,12 +132,10 @@ class Vector(object):
             input to insert to given index of values list.
         """
         self.__values.insert(pos, x)
-        self.__size = self.__size + 1
 
     def remove(self, pos: int):
         """
-        The remove method deletes the item at given input position of values list and decrements the size variable by
-        one.
+        The remove method deletes the item at given input position of values list.
 
         PARAMETERS
         ----------
@@ -136,14 +143,12 @@ class Vector(object):
             index to remove from values list.
         """
         self.__values.pop(pos)
-        self.__size = self.__size - 1
 
     def clear(self):
         """
         The clear method sets all the elements of values list to 0.
         """
-        for i in range(len(self.__values)):
-            self.__values[i] = 0
+        self.__values[:] = [0.0] * len(self.__values)
 
     def sumOfElements(self) -> float:
         """
@@ -154,10 +159,7 @@ class Vector(object):
         float
             Sum of all elements in the vector.
         """
-        total = 0
-        for i in range(self.__size):
-            total += self.__values[i]
-        return total
+        return sum(self.__values)
 
     def maxIndex(self) -> int:
         """
@@ -170,47 +172,33 @@ class Vector(object):
         int
             final maximum item's index.
         """
-        index = 0
-        maxValue = self.__values[0]
-        for i in range(1, self.__size):
-            if self.__values[i] > maxValue:
-                maxValue = self.__values[i]
-                index = i
-        return index
+        return self.__values.index(max(self.__values))
 
     def sigmoid(self):
         """
         The sigmoid method loops through the values list and sets each ith item with sigmoid function, i.e
         1 / (1 + Math.exp(-values.get(i))), i ranges from 0 to size.
         """
-        for i in range(self.__size):
-            self.__values[i] = 1 / (1 + math.exp(-self.__values[i]))
+        self.__values[:] = [1 / (1 + math.exp(-x)) for x in self.__values]
 
     def tanh(self):
         """
         The tanh method loops through the values list and sets each ith item with tanh function.
         """
-        for i in range(self.__size):
-            self.__values[i] = math.tanh(self.__values[i])
+        self.__values[:] = map(math.tanh, self.__values)
 
     def relu(self):
         """
         The relu method loops through the values list and sets each ith item with relu function.
         """
-        for i in range(self.__size):
-            if self.__values[i] < 0:
-                self.__values[i] = 0.0
+        self.__values[:] = [0.0 if x < 0 else x for x in self.__values]
 
     def reluDerivative(self):
         """
         The reluDerivative method loops through the values list and sets each ith item with the derivative of the
         relu function.
         """
-        for i in range(self.__size):
-            if self.__values[i] > 0:
-                self.__values[i] = 1.0
-            else:
-                self.__values[i] = 0.0
+        self.__values[:] = [1.0 if x > 0 else 0.0 for x in self.__values]
 
     def skipVector(self,
                    mod: int,
@@ -232,42 +220,53 @@ class Vector(object):
         Vector
             result Vector.
         """
-        result = Vector()
-        i = value
-        while i < self.__size:
-            result.add(self.__values[i])
-            i += mod
-        return result
+        return Vector.__fromList(self.__values[value::mod])
 
-    def addVector(self, v: Vector):
+    def addVector(self,
+                  v: Vector,
+                  out: Vector = None):
         """
         The add method takes a Vector v as an input. It sums up the corresponding elements of both given vector's
-        values list and values list and puts result back to the values list.
+        values list and values list and puts result back to the values list. If an output Vector is given, the
+        result is written into it instead and this vector is left unchanged.
 
         PARAMETERS
         ----------
         v : Vector
             Vector to add.
+        out : Vector
+            Preallocated Vector of the same size to hold the result.
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
-        for i in range(self.__size):
-            self.__values[i] = self.__values[i] + v.__values[i]
+        if out is None:
+            out = self
+        else:
+            self.__checkOut(out)
+        out.__values[:] = map(operator.add, self.__values, v.__values)
 
-    def subtract(self, v: Vector):
+    def subtract(self,
+                 v: Vector,
+                 out: Vector = None):
         """
         The subtract method takes a Vector v as an input. It subtracts the corresponding elements of given vector's
-        values list from values list and puts result back to the values list.
+        values list from values list and puts result back to the values list. If an output Vector is given, the
+        result is written into it instead and this vector is left unchanged.
 
         PARAMETERS
         ----------
         v : Vector
             Vector to subtract from values list.
+        out : Vector
+            Preallocated Vector of the same size to hold the result.
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
-        for i in range(self.__size):
-            self.__values[i] = self.__values[i] - v.__values[i]
+        if out is None:
+            out = self
+        else:
+            self.__checkOut(out)
+        out.__values[:] = map(operator.sub, self.__values, v.__values)
 
     def difference(self, v: Vector) -> Vector:
         """
@@ -285,12 +284,9 @@ class Vector(object):
         Vector
             new Vector with result list.
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
-        result = Vector()
-        for i in range(self.__size):
-            result.add(self.__values[i] - v.__values[i])
-        return result
+        return Vector.__fromList([x - y for x, y in zip(self.__values, v.__values)])
 
     def dotProduct(self, v: Vector) -> float:
         """
@@ -308,12 +304,11 @@ class Vector(object):
         double
             result.
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
-        result = 0
-        for i in range(self.__size):
-            result += self.__values[i] * v.__values[i]
-        return result
+        if Backend.useNumpy():
+            return float(Backend.getNumpy().dot(self.__values, v.__values))
+        return sum(map(operator.mul, self.__values, v.__values))
 
     def dotProductWithSelf(self) -> float:
         """
@@ -325,33 +320,37 @@ class Vector(object):
         double
             result.
         """
-        result = 0
-        for i in range(self.__size):
-            result += self.__values[i] * self.__values[i]
-        return result
+        return sum(map(operator.mul, self.__values, self.__values))
 
-    def elementProduct(self, v: Vector) -> Vector:
+    def elementProduct(self,
+                       v: Vector,
+                       out: Vector = None) -> Vector:
         """
         The elementProduct method takes a Vector v as an input. It creates a new Vector result, then
-        multiplies the corresponding elements of given vector's values list with values list and adds
-        the multiplication to the result list.
+        multiplies the corresponding elements of given vector's values list with values list and puts
+        the multiplications to the result. If an output Vector is given, the result is written into it instead of
+        a new Vector.
 
         PARAMETERS
         ----------
         v : Vector
-            Vector to find dot product.
+            Vector to find element product.
+        out : Vector
+            Preallocated Vector of the same size to hold the result.
 
         RETURNS
         -------
         Vector
-            with result list.
+            Vector holding the result, out if it is given.
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
-        result = Vector()
-        for i in range(self.__size):
-            result.add(self.__values[i] * v.__values[i])
-        return result
+        values = [x * y for x, y in zip(self.__values, v.__values)]
+        if out is None:
+            return Vector.__fromList(values)
+        self.__checkOut(out)
+        out.__values[:] = values
+        return out
 
     def divide(self, value: float):
         """
@@ -362,8 +361,7 @@ class Vector(object):
         value : double
             is used to divide items of values list.
         """
-        for i in range(self.__size):
-            self.__values[i] = self.__values[i] / value
+        self.__values[:] = [x / value for x in self.__values]
 
     def multiply(self, value: float):
         """
@@ -374,39 +372,42 @@ class Vector(object):
         value : double
             is used to multiply items of values list.
         """
-        for i in range(self.__size):
-            self.__values[i] = self.__values[i] * value
+        self.__values[:] = [x * value for x in self.__values]
 
-    def product(self, value: float) -> Vector:
+    def product(self,
+                value: float,
+                out: Vector = None) -> Vector:
         """
-        The product method takes a double value as an input and creates a new result {@link Vector}, then multiplies
-        each item of values list with given value and adds to the result {@link Vector}.
+        The product method takes a double value as an input and creates a new result Vector, then multiplies
+        each item of values list with given value and puts to the result Vector. If an output Vector is given, the
+        result is written into it instead of a new Vector.
 
         PARAMETERS
         ----------
         value : double
             is used to multiply items of values list.
+        out : Vector
+            Preallocated Vector of the same size to hold the result.
 
         RETURNS
         -------
         Vector
-            Vector result.
+            Vector holding the result, out if it is given.
         """
-        result = Vector()
-        for i in range(self.__size):
-            result.add(self.__values[i] * value)
-        return result
+        values = [x * value for x in self.__values]
+        if out is None:
+            return Vector.__fromList(values)
+        self.__checkOut(out)
+        out.__values[:] = values
+        return out
 
     def l1Normalize(self):
         """
         The l1Normalize method is used to apply Least Absolute Errors, it accumulates items of values list and sets
         each item by dividing it by the summation value.
         """
-        total = 0
-        for i in range(self.__size):
-            total += self.__values[i]
-        for i in range(self.__size):
-            self.__values[i] = self.__values[i] / total
+        total = sum(self.__values)
+        self.__values[:] = [x / total for x in self.__values]
 
     def l2Norm(self) -> float:
         """
@@ -418,10 +419,7 @@ class Vector(object):
         float
             square root of this summation.
         """
-        total = 0
-        for i in range(self.__size):
-            total += self.__values[i] ** 2
-        return math.sqrt(total)
+        return math.sqrt(sum(map(operator.mul, self.__values, self.__values)))
 
     def cosineSimilarity(self, v: Vector) -> float:
         """
@@ -438,7 +436,7 @@ class Vector(object):
         float
             dotProduct(v) / l2Norm() / v.l2Norm()
         """
-        if self.__size != v.__size:
+        if len(self.__values) != len(v.__values):
             raise VectorSizeMismatch
         return self.dotProduct(v) / self.l2Norm() / v.l2Norm()
 
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+
+from Math.Backend import Backend
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+from Math.VectorSizeMismatch import VectorSizeMismatch
+
+
+class VectorBatch(object):
+    """
+    A batch of equal sized vectors kept in one row-major array('d') buffer, the i'th vector being the slice
+    values[i * vectorSize:(i + 1) * vectorSize]. The batch operations compute a result for every vector in a single
+    call, so the per vector cost is the arithmetic, not a Python method call. The l2 norms of the vectors are cached
+    until the batch is modified, so repeated cosine similarity queries cost one dot product per vector.
+    """
+    __vectorSize: int
+    __count: int
+    __values: array
+    __norms: list
+
+    def __init__(self,
+                 vectors: list = None,
+                 vectorSize: int = None):
+        """
+        Constructor of VectorBatch class which takes a list of Vectors of the same size. If the list is empty or not
+        given, the vector size must be given explicitly.
+
+        PARAMETERS
+        ----------
+        vectors : list
+            List of Vectors to put in the batch.
+        vectorSize : int
+            Size of the vectors in the batch, if None it is the size of the first vector.
+        """
+        if vectors is None:
+            vectors = []
+        if vectorSize is None:
+            vectorSize = vectors[0].size() if len(vectors) > 0 else 0
+        self.__vectorSize = vectorSize
+        self.__count = 0
+        self.__values = array('d')
+        self.__norms = None
+        for vector in vectors:
+            self.add(vector)
+
+    def __toNumpy(self):
+        """
+        Wraps values array into a count x vectorSize numpy array without copying it.
+
+        RETURNS
+        -------
+        numpy.ndarray
+            numpy view of values array.
+        """
+        return Backend.getNumpy().frombuffer(self.__values, dtype=float).reshape(self.__count, self.__vectorSize)
+
+    def __rows(self) -> list:
+        """
+        Returns the vectors of the batch as slices of values array.
+
+        RETURNS
+        -------
+        list
+            List of array('d') slices, one for each vector.
+        """
+        n = self.__vectorSize
+        return [self.__values[i * n:(i + 1) * n] for i in range(self.__count)]
+
+    @staticmethod
+    def __valuesOf(v: Vector) -> list:
+        """
+        Returns the items of the given Vector as a list.
+        """
+        return [v.getValue(i) for i in range(v.size())]
+
+    def add(self, v: Vector):
+        """
+        The add method appends the given Vector to the end of the batch. If the size of the vector is not the vector
+        size of the batch, it throws VectorSizeMismatch exception.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector to add.
+        """
+        if v.size() != self.__vectorSize:
+            raise VectorSizeMismatch
+        self.__values.extend(VectorBatch.__valuesOf(v))
+        self.__count = self.__count + 1
+        self.__norms = None
+
+    def size(self) -> int:
+        """
+        The size method returns the number of vectors in the batch.
+
+        RETURNS
+        -------
+        int
+            number of vectors.
+        """
+        return self.__count
+
+    def getVectorSize(self) -> int:
+        """
+        Getter for the size of the vectors in the batch.
+
+        RETURNS
+        -------
+        int
+            size of the vectors.
+        """
+        return self.__vectorSize
+
+    def getVector(self, index: int) -> Vector:
+        """
+        Returns a copy of the vector at given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            index of the vector.
+
+        RETURNS
+        -------
+        Vector
+            vector at given index.
+        """
+        if not 0 <= index < self.__count:
+            raise IndexError(f"Index {index} is out of bounds for a batch of {self.__count} vectors.")
+        n = self.__vectorSize
+        return Vector(self.__values[index * n:(index + 1) * n].tolist())
+
+    def getValue(self,
+                 index: int,
+                 position: int) -> float:
+        """
+        Getter for the item at given position of the vector at given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            index of the vector.
+        position : int
+            position of the item in the vector.
+
+        RETURNS
+        -------
+        float
+            item at given position of the vector at given index.
+        """
+        return self.__values[index * self.__vectorSize + position]
+
+    def __dotProducts(self, v: Vector) -> list:
+        """
+        Returns the dot products of the vectors with the given Vector as a list.
+        """
+        if v.size() != self.__vectorSize:
+            raise VectorSizeMismatch
+        query = VectorBatch.__valuesOf(v)
+        if Backend.useNumpy(len(self.__values)):
+            numpy = Backend.getNumpy()
+            return (self.__toNumpy() @ numpy.array(query, dtype=float)).tolist()
+        return [sum(map(operator.mul, row, query)) for row in self.__rows()]
+
+    def dotProducts(self, v: Vector) -> Vector:
+        """
+        The dotProducts method computes the dot product of every vector in the batch with the given Vector. If the
+        size of the given vector is not the vector size of the batch, it throws VectorSizeMismatch exception.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector to find dot products with.
+
+        RETURNS
+        -------
+        Vector
+            Vector whose i'th item is the dot product of the i'th vector with v.
+        """
+        return Vector(self.__dotProducts(v))
+
+    def __l2Norms(self) -> list:
+        """
+        Returns the cached l2 norms of the vectors, computing them if the batch was modified since the last call.
+
+        RETURNS
+        -------
+        list
+            List whose i'th item is the l2 norm of the i'th vector.
+        """
+        if self.__norms is None:
+            if Backend.useNumpy(len(self.__values)):
+                numpy = Backend.getNumpy()
+                values = self.__toNumpy()
+                self.__norms = numpy.sqrt(numpy.einsum('ij,ij->i', values, values)).tolist()
+            else:
+                self.__norms = [math.sqrt(sum(map(operator.mul, row, row))) for row in self.__rows()]
+        return self.__norms
+
+    def l2Norms(self) -> Vector:
+        """
+        The l2Norms method computes the l2 norm of every vector in the batch.
+
+        RETURNS
+        -------
+        Vector
+            Vector whose i'th item is the l2 norm of the i'th vector.
+        """
+        return Vector(self.__l2Norms())
+
+    def cosineSimilarities(self, v: Vector) -> Vector:
+        """
+        The cosineSimilarities method computes the cosine similarity of every vector in the batch with the given
+        Vector. If the size of the given vector is not the vector size of the batch, it throws VectorSizeMismatch
+        exception.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector to find cosine similarities with.
+
+        RETURNS
+        -------
+        Vector
+            Vector whose i'th item is the cosine similarity of the i'th vector with v.
+        """
+        dotProducts = self.__dotProducts(v)
+        norm = v.l2Norm()
+        return Vector([dotProduct / rowNorm / norm for dotProduct, rowNorm in zip(dotProducts, self.__l2Norms())])
+
+    def pairwiseCosineSimilarities(self) -> Matrix:
+        """
+        The pairwiseCosineSimilarities method computes the cosine similarity of every pair of vectors in the batch.
+        Since the similarity is symmetric, only the upper triangle is computed. As with Vector.cosineSimilarity, it
+        throws ZeroDivisionError if a vector of the batch has zero norm.
+
+        RETURNS
+        -------
+        Matrix
+            count x count Matrix whose (i, j)'th item is the cosine similarity of the i'th and j'th vectors.
+        """
+        count = self.__count
+        result = Matrix(count, count)
+        norms = self.__l2Norms()
+        if 0.0 in norms:
+            raise ZeroDivisionError("Cosine similarity of a zero vector is undefined.")
+        if Backend.useNumpy(len(self.__values)):
+            numpy = Backend.getNumpy()
+            normalized = self.__toNumpy() / numpy.array(norms, dtype=float)[:, None]
+            result.setValues((normalized @ normalized.T).ravel().tolist())
+            return result
+        rows = [row.tolist() for row in self.__rows()]
+        similarities = [0.0] * (count * count)
+        for i in range(count):
+            row = rows[i]
+            for j in range(i, count):
+                similarity = sum(map(operator.mul, row, rows[j])) / norms[i] / norms[j]
+                similarities[i * count + j] = similarity
+                similarities[j * count + i] = similarity
+        result.setValues(similarities)
+        return result
+
+    def sigmoid(self):
+        """
+        The sigmoid method sets every item of every vector in the batch with the sigmoid function, i.e
+        1 / (1 + Math.exp(-x)).
+        """
+        self.__values[:] = array('d', [1 / (1 + math.exp(-x)) for x in self.__values])
+        self.__norms = None
+
+    def tanh(self):
+        """
+        The tanh method sets every item of every vector in the batch with the tanh function.
+        """
+        self.__values[:] = array('d', list(map(math.tanh, self.__values)))
+        self.__norms = None
+
+    def relu(self):
+        """
+        The relu method sets every negative item of every vector in the batch to 0.
+        """
+        self.__values[:] = array('d', [0.0 if x < 0 else x for x in self.__values])
+        self.__norms = None
+
+    def toMatrix(self) -> Matrix:
+        """
+        Converts the batch to a count x vectorSize Matrix, the i'th row being the i'th vector.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix holding a copy of the batch.
+        """
+        result = Matrix(self.__count, self.__vectorSize)
+        result.setValues(self.__values)
+        return result
+
+    def __repr__(self):
+        return f"VectorBatch(count={self.__count}, vectorSize={self.__vectorSize})"
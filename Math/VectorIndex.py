@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import heapq
+import math
+import operator
+import random
+
+from Math.Backend import Backend
+from Math.Vector import Vector
+from Math.VectorSizeMismatch import VectorSizeMismatch
+
+
+class VectorIndex(object):
+    """
+    An index answering top k cosine similarity queries over a set of equal sized vectors. The vectors are normalized
+    once when they are added and their original l2 norms are cached, so the cosine similarity with a query is one dot
+    product. In exact mode every vector is scored, block by block, and the best k are kept in a bounded heap instead
+    of sorting all scores. In approximate mode the vectors are also hashed with random hyperplanes (locality sensitive
+    hashing), and only the vectors sharing a bucket with the query in at least one hash table are scored.
+    """
+    EXACT = "exact"
+    APPROXIMATE = "approximate"
+    BLOCK_SIZE = 1024
+
+    __vectorSize: int
+    __mode: str
+    __keys: list
+    __vectors: list
+    __norms: list
+    __hyperplanes: list
+    __tables: list
+    __matrix: object
+
+    def __init__(self,
+                 vectorSize: int,
+                 mode: str = EXACT,
+                 numberOfTables: int = 8,
+                 numberOfBits: int = 12,
+                 seed: int = 1):
+        """
+        Constructor of VectorIndex class which creates an empty index for vectors of the given size.
+
+        PARAMETERS
+        ----------
+        vectorSize : int
+            Size of the vectors in the index.
+        mode : str
+            VectorIndex.EXACT or VectorIndex.APPROXIMATE.
+        numberOfTables : int
+            Number of hash tables in approximate mode. More tables find more of the true neighbours.
+        numberOfBits : int
+            Number of hyperplanes per hash table in approximate mode. More bits give smaller buckets.
+        seed : int
+            Seed of the random hyperplanes.
+        """
+        if mode not in (VectorIndex.EXACT, VectorIndex.APPROXIMATE):
+            raise ValueError(f"Unknown mode {mode}, expected one of exact or approximate.")
+        self.__vectorSize = vectorSize
+        self.__mode = mode
+        self.__keys = []
+        self.__vectors = []
+        self.__norms = []
+        self.__hyperplanes = []
+        self.__tables = []
+        self.__matrix = None
+        if mode == VectorIndex.APPROXIMATE:
+            generator = random.Random(seed)
+            for _ in range(numberOfTables):
+                self.__hyperplanes.append([[generator.gauss(0.0, 1.0) for _ in range(vectorSize)]
+                                           for _ in range(numberOfBits)])
+                self.__tables.append({})
+
+    def __valuesOf(self, v: Vector) -> list:
+        """
+        Returns the items of the given Vector as a list, checking its size against the vector size of the index.
+        """
+        if v.size() != self.__vectorSize:
+            raise VectorSizeMismatch
+        return [v.getValue(i) for i in range(self.__vectorSize)]
+
+    @staticmethod
+    def __normalize(values: list) -> tuple:
+        """
+        Returns the l2 norm of the given values and the values divided by it. A zero vector stays a zero vector.
+        """
+        norm = math.sqrt(sum(map(operator.mul, values, values)))
+        if norm == 0.0:
+            return norm, values
+        return norm, [x / norm for x in values]
+
+    @staticmethod
+    def __signature(hyperplanes: list, values: list) -> int:
+        """
+        Returns the bucket of the given values in a hash table, the bits of the bucket being the sides of the
+        hyperplanes the values lie on.
+        """
+        signature = 0
+        for hyperplane in hyperplanes:
+            signature = (signature << 1) | (sum(map(operator.mul, hyperplane, values)) >= 0.0)
+        return signature
+
+    def add(self,
+            v: Vector,
+            key=None):
+        """
+        The add method adds the given Vector to the index under the given key. If the key is None, the position of
+        the vector in the index is used as its key.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Vector to add.
+        key
+            Key returned by topK for this vector.
+        """
+        norm, normalized = VectorIndex.__normalize(self.__valuesOf(v))
+        index = len(self.__vectors)
+        self.__keys.append(index if key is None else key)
+        self.__vectors.append(normalized)
+        self.__norms.append(norm)
+        self.__matrix = None
+        for hyperplanes, table in zip(self.__hyperplanes, self.__tables):
+            table.setdefault(VectorIndex.__signature(hyperplanes, normalized), []).append(index)
+
+    def addAll(self,
+               vectors: list,
+               keys: list = None):
+        """
+        The addAll method adds the given Vectors to the index, the i'th vector under the i'th key.
+
+        PARAMETERS
+        ----------
+        vectors : list
+            List of Vectors to add.
+        keys : list
+            List of keys, if None the positions of the vectors are used as keys.
+        """
+        for i in range(len(vectors)):
+            self.add(vectors[i], None if keys is None else keys[i])
+
+    def size(self) -> int:
+        """
+        The size method returns the number of vectors in the index.
+
+        RETURNS
+        -------
+        int
+            number of vectors.
+        """
+        return len(self.__vectors)
+
+    def getNorm(self, index: int) -> float:
+        """
+        Getter for the cached l2 norm of the vector at given position.
+
+        PARAMETERS
+        ----------
+        index : int
+            position of the vector in the index.
+
+        RETURNS
+        -------
+        float
+            l2 norm of the vector.
+        """
+        return self.__norms[index]
+
+    def __candidates(self, query: list) -> list:
+        """
+        Returns the positions of the vectors sharing a bucket with the query in at least one hash table. If there are
+        no such vectors, every vector is a candidate.
+        """
+        candidates = set()
+        for hyperplanes, table in zip(self.__hyperplanes, self.__tables):
+            candidates.update(table.get(VectorIndex.__signature(hyperplanes, query), ()))
+        if len(candidates) == 0:
+            return list(range(len(self.__vectors)))
+        return sorted(candidates)
+
+    def __exactTopK(self,
+                    query: list,
+                    k: int) -> list:
+        """
+        Scores every vector against the query, BLOCK_SIZE vectors at a time, keeping the best k (score, position)
+        pairs in a min heap.
+        """
+        if Backend.useNumpy(len(self.__vectors) * len(query)):
+            numpy = Backend.getNumpy()
+            if self.__matrix is None:
+                self.__matrix = numpy.array(self.__vectors, dtype=float)
+            scores = self.__matrix @ numpy.array(query, dtype=float)
+            best = numpy.argpartition(-scores, k - 1)[:k] if k < len(scores) else numpy.arange(len(scores))
+            return [(float(scores[i]), int(i)) for i in best]
+        heap = []
+        vectors = self.__vectors
+        for start in range(0, len(vectors), VectorIndex.BLOCK_SIZE):
+            scores = [sum(map(operator.mul, row, query)) for row in vectors[start:start + VectorIndex.BLOCK_SIZE]]
+            for i, score in enumerate(scores, start):
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, -i))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, -i))
+        return [(score, -i) for score, i in heap]
+
+    def topK(self,
+             v: Vector,
+             k: int) -> list:
+        """
+        The topK method finds the k vectors in the index most similar to the given Vector by cosine similarity. In
+        approximate mode, only the vectors hashed to the same bucket as the query in some hash table are considered,
+        so some of the true neighbours may be missed.
+
+        PARAMETERS
+        ----------
+        v : Vector
+            Query vector.
+        k : int
+            Number of neighbours to return.
+
+        RETURNS
+        -------
+        list
+            List of at most k (key, cosine similarity) tuples, most similar first.
+        """
+        _, query = VectorIndex.__normalize(self.__valuesOf(v))
+        if k <= 0 or len(self.__vectors) == 0:
+            return []
+        if self.__mode == VectorIndex.APPROXIMATE:
+            scores = [(sum(map(operator.mul, self.__vectors[i], query)), i) for i in self.__candidates(query)]
+            best = heapq.nlargest(k, scores, key=lambda pair: (pair[0], -pair[1]))
+        else:
+            best = self.__exactTopK(query, k)
+        best.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [(self.__keys[i], score) for score, i in best]
+
+    def __repr__(self):
+        return f"VectorIndex(size={len(self.__vectors)}, vectorSize={self.__vectorSize}, mode={self.__mode})"
@@ -0,0 +1,498 @@
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from Math.Backend import Backend
+from Math.DiscreteDistribution import DiscreteDistribution
+from Math.Distribution import Distribution
+from Math.Matrix import Matrix
+from Math.SparseMatrix import SparseMatrix
+from Math.Tensor import Tensor
+from Math.Vector import Vector
+from Math.VectorBatch import VectorBatch
+from Math.VectorIndex import VectorIndex
+
+
+class Benchmark(object):
+    """
+    A named operation timed over a sweep of sizes. The setup function takes a size, prepares the inputs and returns a
+    function without arguments that runs the operation once.
+    """
+    name: str
+    sizes: List[int]
+    setup: Callable[[int], Callable[[], object]]
+
+    def __init__(self, name: str, sizes: List[int], setup: Callable[[int], Callable[[], object]]):
+        self.name = name
+        self.sizes = sizes
+        self.setup = setup
+
+
+def randomVector(size: int, seed: int) -> Vector:
+    generator = random.Random(seed)
+    return Vector([generator.uniform(-1.0, 1.0) for _ in range(size)])
+
+
+def randomMatrix(row: int, col: int, seed: int) -> Matrix:
+    return Matrix(row, col, -1.0, 1.0, seed)
+
+
+def symmetricMatrix(size: int, seed: int) -> Matrix:
+    """
+    Returns a symmetric, strictly diagonally dominant, hence positive definite, size x size matrix.
+    """
+    generator = random.Random(seed)
+    result = Matrix(size, size)
+    for i in range(size):
+        result.setValue(i, i, size)
+        for j in range(i + 1, size):
+            value = generator.uniform(-1.0, 1.0) / size
+            result.setValue(i, j, value)
+            result.setValue(j, i, value)
+    return result
+
+
+def covarianceMatrix(size: int, seed: int) -> Matrix:
+    """
+    Returns a size x size covariance like matrix: a rank 10 part with decaying weights plus a small diagonal, so the
+    leading eigenvalues are well separated, as in PCA.
+    """
+    generator = random.Random(seed)
+    factors = [[generator.gauss(0.0, 1.0) / (1 + c) for c in range(10)] for _ in range(size)]
+    result = Matrix(size, size)
+    for i in range(size):
+        for j in range(i, size):
+            value = sum(x * y for x, y in zip(factors[i], factors[j])) + (0.01 if i == j else 0.0)
+            result.setValue(i, j, value)
+            result.setValue(j, i, value)
+    return result
+
+
+def randomTensor(shape: tuple, seed: int) -> Tensor:
+    generator = random.Random(seed)
+    count = 1
+    for dim in shape:
+        count *= dim
+    return Tensor([generator.uniform(-1.0, 1.0) for _ in range(count)], shape)
+
+
+def tokens(size: int) -> List[str]:
+    generator = random.Random(size)
+    return [str(int(generator.paretovariate(1.2))) for _ in range(size)]
+
+
+def countTokens(items: List[str]) -> DiscreteDistribution:
+    distribution = DiscreteDistribution()
+    for item in items:
+        distribution.addItem(item)
+    return distribution
+
+
+def vectorBenchmarks() -> List[Benchmark]:
+    sizes = [100, 1000, 10000]
+
+    def binary(operation: Callable[[Vector, Vector], object]) -> Callable[[int], Callable[[], object]]:
+        def setup(size: int) -> Callable[[], object]:
+            v = randomVector(size, 1)
+            w = randomVector(size, 2)
+            return lambda: operation(v, w)
+        return setup
+
+    def unary(operation: Callable[[Vector], object]) -> Callable[[int], Callable[[], object]]:
+        def setup(size: int) -> Callable[[], object]:
+            v = randomVector(size, 1)
+            return lambda: operation(v)
+        return setup
+
+    def batchCosineSimilarities(size: int) -> Callable[[], object]:
+        batch = VectorBatch([randomVector(100, seed) for seed in range(size)])
+        query = randomVector(100, size)
+        return lambda: batch.cosineSimilarities(query)
+
+    def indexTopK(mode: str) -> Callable[[int], Callable[[], object]]:
+        def setup(size: int) -> Callable[[], object]:
+            index = VectorIndex(100, mode)
+            index.addAll([randomVector(100, seed) for seed in range(size)])
+            query = randomVector(100, size)
+            return lambda: index.topK(query, 10)
+        return setup
+
+    return [Benchmark("Vector.addVector", sizes, binary(lambda v, w: v.addVector(w))),
+            Benchmark("Vector.difference", sizes, binary(lambda v, w: v.difference(w))),
+            Benchmark("Vector.dotProduct", sizes, binary(lambda v, w: v.dotProduct(w))),
+            Benchmark("Vector.elementProduct", sizes, binary(lambda v, w: v.elementProduct(w))),
+            Benchmark("Vector.cosineSimilarity", sizes, binary(lambda v, w: v.cosineSimilarity(w))),
+            Benchmark("Vector.l2Norm", sizes, unary(lambda v: v.l2Norm())),
+            Benchmark("Vector.product", sizes, unary(lambda v: v.product(0.5))),
+            Benchmark("Vector.biased", sizes, unary(lambda v: v.biased())),
+            Benchmark("Vector.tanh", sizes, unary(lambda v: v.tanh())),
+            Benchmark("VectorBatch.cosineSimilarities", [100, 1000], batchCosineSimilarities),
+            Benchmark("VectorIndex.topK (exact)", [1000, 10000], indexTopK(VectorIndex.EXACT)),
+            Benchmark("VectorIndex.topK (approximate)", [1000, 10000], indexTopK(VectorIndex.APPROXIMATE))]
+
+
+def matrixBenchmarks() -> List[Benchmark]:
+    def multiply(size: int) -> Callable[[], object]:
+        a = randomMatrix(size, size, 1)
+        b = randomMatrix(size, size, 2)
+        return lambda: a.multiply(b)
+
+    def multiplyWithVector(size: int) -> Callable[[], object]:
+        a = randomMatrix(size, size, 1)
+        v = randomVector(size, 2)
+        return lambda: a.multiplyWithVectorFromRight(v)
+
+    def transpose(size: int) -> Callable[[], object]:
+        a = randomMatrix(size, size, 1)
+        return lambda: a.transpose()
+
+    def inverse(size: int) -> Callable[[], object]:
+        a = symmetricMatrix(size, 1)
+        return lambda: a.clone().inverse()
+
+    def determinant(size: int) -> Callable[[], object]:
+        a = symmetricMatrix(size, 1)
+        return lambda: a.determinant()
+
+    def luSolve(size: int) -> Callable[[], object]:
+        lu = symmetricMatrix(size, 1).lu()
+        b = randomVector(size, 2)
+        return lambda: lu.solve(b)
+
+    def characteristics(size: int) -> Callable[[], object]:
+        a = symmetricMatrix(size, 1)
+        return lambda: a.characteristics()
+
+    def householder(size: int) -> Callable[[], object]:
+        a = symmetricMatrix(size, 1)
+        return lambda: a.characteristics(Matrix.HOUSEHOLDER)
+
+    def topEigenvectors(size: int) -> Callable[[], object]:
+        a = covarianceMatrix(size, 1)
+        return lambda: a.topEigenvectors(5)
+
+    def randomizedSvd(size: int) -> Callable[[], object]:
+        a = randomMatrix(size * 10, size, 1)
+        return lambda: a.randomizedSvd(10)
+
+    def leastSquares(size: int) -> Callable[[], object]:
+        a = randomMatrix(size * 10, size, 1)
+        b = randomVector(size * 10, 2)
+        return lambda: a.leastSquares(b)
+
+    def normalEquations(size: int) -> Callable[[], object]:
+        a = randomMatrix(size * 10, size, 1)
+        b = randomVector(size * 10, 2)
+
+        def run() -> object:
+            gram = a.transpose().multiply(a)
+            gram.inverse()
+            return gram.multiplyWithVectorFromRight(a.multiplyWithVectorFromLeft(b))
+        return run
+
+    def cholesky(size: int) -> Callable[[], object]:
+        a = symmetricMatrix(size, 1)
+        return lambda: a.choleskyDecomposition()
+
+    def choleskyUpdate(size: int) -> Callable[[], object]:
+        cholesky = symmetricMatrix(size, 1).cholesky()
+        v = randomVector(size, 2)
+
+        def run() -> object:
+            cholesky.update(v)
+            cholesky.downdate(v)
+            return cholesky
+        return run
+
+    def choleskySolve(size: int) -> Callable[[], object]:
+        cholesky = symmetricMatrix(size, 1).cholesky()
+        b = randomVector(size, 2)
+        return lambda: cholesky.solve(b)
+
+    def sparseMultiplyWithVector(size: int) -> Callable[[], object]:
+        generator = random.Random(1)
+        triplets = [(generator.randrange(size), generator.randrange(size * 100), 1.0) for _ in range(size * 10)]
+        sparse = SparseMatrix(size, size * 100, triplets)
+        v = randomVector(size * 100, 2)
+        return lambda: sparse.multiplyWithVectorFromRight(v)
+
+    return [Benchmark("Matrix.multiply", [16, 64, 128], multiply),
+            Benchmark("Matrix.multiplyWithVectorFromRight", [16, 64, 256], multiplyWithVector),
+            Benchmark("Matrix.transpose", [16, 64, 256], transpose),
+            Benchmark("Matrix.inverse", [16, 32, 64], inverse),
+            Benchmark("Matrix.determinant", [16, 32, 64], determinant),
+            Benchmark("Matrix.lu.solve", [16, 64, 256], luSolve),
+            Benchmark("Matrix.characteristics", [8, 16, 32], characteristics),
+            Benchmark("Matrix.characteristics (householder)", [8, 16, 32, 128], householder),
+            Benchmark("Matrix.topEigenvectors (k=5)", [32, 128, 512], topEigenvectors),
+            Benchmark("Matrix.randomizedSvd (k=10, 10n x n)", [32, 64, 128], randomizedSvd),
+            Benchmark("Matrix.leastSquares (10n x n)", [16, 32, 64], leastSquares),
+            Benchmark("Matrix.leastSquares (normal equations)", [16, 32, 64], normalEquations),
+            Benchmark("Matrix.choleskyDecomposition", [16, 32, 64], cholesky),
+            Benchmark("CholeskyDecomposition.update+downdate", [16, 32, 64], choleskyUpdate),
+            Benchmark("CholeskyDecomposition.solve", [16, 64, 256], choleskySolve),
+            Benchmark("SparseMatrix.multiplyWithVectorFromRight", [100, 1000], sparseMultiplyWithVector)]
+
+
+def tensorBenchmarks() -> List[Benchmark]:
+    def broadcastAdd(size: int) -> Callable[[], object]:
+        batch = randomTensor((size, size), 1)
+        bias = randomTensor((1, size), 2)
+        return lambda: batch.add(bias)
+
+    def transpose(size: int) -> Callable[[], object]:
+        a = randomTensor((size, size), 1)
+        return lambda: a.transpose().contiguous()
+
+    def multiply(size: int) -> Callable[[], object]:
+        a = randomTensor((8, size, size), 1)
+        b = randomTensor((8, size, size), 2)
+        return lambda: a.multiply(b)
+
+    def softmax(size: int) -> Callable[[], object]:
+        a = randomTensor((size, size), 1)
+        return lambda: a.softmax()
+
+    return [Benchmark("Tensor.add (broadcast)", [16, 64, 256], broadcastAdd),
+            Benchmark("Tensor.transpose.contiguous", [16, 64, 256], transpose),
+            Benchmark("Tensor.multiply (batched)", [8, 16, 32], multiply),
+            Benchmark("Tensor.softmax", [16, 64, 256], softmax)]
+
+
+def distributionBenchmarks() -> List[Benchmark]:
+    def addItem(size: int) -> Callable[[], object]:
+        items = tokens(size)
+        return lambda: countTokens(items)
+
+    def addItems(size: int) -> Callable[[], object]:
+        items = tokens(size)
+        return lambda: DiscreteDistribution(items)
+
+    def getMaxItem(size: int) -> Callable[[], object]:
+        distribution = countTokens(tokens(size))
+        return lambda: distribution.getMaxItem()
+
+    def getItem(size: int) -> Callable[[], object]:
+        distribution = countTokens(tokens(size))
+        return lambda: distribution.getItem(len(distribution) // 2)
+
+    def streamingMax(tracked: bool) -> Callable[[int], Callable[[], object]]:
+        def setup(size: int) -> Callable[[], object]:
+            items = tokens(size)
+
+            def run() -> object:
+                distribution = DiscreteDistribution()
+                if tracked:
+                    distribution.enableMaximumTracking()
+                for item in items:
+                    distribution.addItem(item)
+                    distribution.getMaxItem()
+                return distribution
+            return run
+        return setup
+
+    def uncached(function: Callable[[], object]) -> Callable[[], object]:
+        def run() -> object:
+            Distribution.clearCache()
+            return function()
+        return run
+
+    def zInverse(size: int) -> Callable[[], object]:
+        return uncached(lambda: Distribution.zInverse(1.0 - 1.0 / size))
+
+    def chiSquareInverse(size: int) -> Callable[[], object]:
+        return uncached(lambda: Distribution.chiSquareInverse(0.05, size))
+
+    def chiSquareInverseCached(size: int) -> Callable[[], object]:
+        return lambda: Distribution.chiSquareInverse(0.05, size)
+
+    def fDistributionInverse(size: int) -> Callable[[], object]:
+        return uncached(lambda: Distribution.fDistributionInverse(0.05, size, size))
+
+    def tDistributionInverse(size: int) -> Callable[[], object]:
+        return uncached(lambda: Distribution.tDistributionInverse(0.05, size))
+
+    def chiSquares(size: int) -> Callable[[], object]:
+        generator = random.Random(size)
+        statistics = [generator.uniform(0.0, 20.0) for _ in range(size)]
+        return lambda: Distribution.chiSquares(statistics, 3)
+
+    return [Benchmark("DiscreteDistribution.addItem", [1000, 10000, 100000], addItem),
+            Benchmark("DiscreteDistribution.addItems", [1000, 10000, 100000], addItems),
+            Benchmark("DiscreteDistribution.getMaxItem", [1000, 10000, 100000], getMaxItem),
+            Benchmark("DiscreteDistribution.getItem", [1000, 10000, 100000], getItem),
+            Benchmark("DiscreteDistribution.addItem+max", [1000, 10000], streamingMax(False)),
+            Benchmark("DiscreteDistribution.addItem+max (tracked)", [1000, 10000], streamingMax(True)),
+            Benchmark("Distribution.zInverse", [10, 100, 1000], zInverse),
+            Benchmark("Distribution.chiSquareInverse", [1, 10, 100], chiSquareInverse),
+            Benchmark("Distribution.chiSquareInverse (cached)", [1, 10, 100], chiSquareInverseCached),
+            Benchmark("Distribution.fDistributionInverse", [1, 10, 100], fDistributionInverse),
+            Benchmark("Distribution.tDistributionInverse", [1, 10, 100], tDistributionInverse),
+            Benchmark("Distribution.chiSquares", [1000, 10000, 100000], chiSquares)]
+
+
+def crossoverBenchmarks() -> List[Benchmark]:
+    """
+    Runs the same small operations with the python and the numpy backend, whatever --backend selects, to show the
+    sizes from which delegating to numpy pays off; Backend.AUTO_MINIMUM_SIZE and Distribution.NUMPY_MINIMUM_SIZE are
+    chosen from these.
+    """
+    def pinned(backend: str, setup: Callable[[int], Callable[[], object]]) -> Callable[[int], Callable[[], object]]:
+        def pinnedSetup(size: int) -> Callable[[], object]:
+            function = setup(size)
+
+            def run() -> object:
+                previous = Backend.getBackend()
+                Backend.setBackend(backend)
+                try:
+                    return function()
+                finally:
+                    Backend.setBackend(previous)
+            return run
+        return pinnedSetup
+
+    def dotProduct(size: int) -> Callable[[], object]:
+        v = randomVector(size, 1)
+        w = randomVector(size, 2)
+        return lambda: v.dotProduct(w)
+
+    def multiplyWithVector(size: int) -> Callable[[], object]:
+        a = randomMatrix(size, size, 1)
+        v = randomVector(size, 2)
+        return lambda: a.multiplyWithVectorFromRight(v)
+
+    def chiSquares(size: int) -> Callable[[], object]:
+        values = [i / 4.0 for i in range(size)]
+        return lambda: Distribution.chiSquares(values, 5)
+
+    if not Backend.isNumpyAvailable():
+        return []
+    benchmarks = []
+    for backend in (Backend.PYTHON, Backend.NUMPY):
+        benchmarks.append(Benchmark(f"Vector.dotProduct ({backend})", [10, 100, 1000, 10000],
+                                    pinned(backend, dotProduct)))
+        benchmarks.append(Benchmark(f"Matrix.multiplyWithVectorFromRight ({backend})", [4, 6, 8, 16],
+                                    pinned(backend, multiplyWithVector)))
+        benchmarks.append(Benchmark(f"Distribution.chiSquares ({backend})", [16, 64, 256, 1024],
+                                    pinned(backend, chiSquares)))
+    return benchmarks
+
+
+def allBenchmarks() -> List[Benchmark]:
+    return (vectorBenchmarks() + matrixBenchmarks() + tensorBenchmarks() + distributionBenchmarks() +
+            crossoverBenchmarks())
+
+
+def measure(function: Callable[[], object], minTime: float) -> dict:
+    """
+    Runs the function repeatedly, doubling the number of repetitions until they take at least minTime seconds, then
+    runs it once more under tracemalloc to find the peak memory allocated during one call.
+    """
+    function()
+    repetitions = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= minTime or repetitions >= 1 << 20:
+            break
+        repetitions *= 2
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"opsPerSecond": repetitions / elapsed,
+            "secondsPerOp": elapsed / repetitions,
+            "peakMemoryBytes": peak}
+
+
+def run(benchmarks: List[Benchmark], quick: bool, minTime: float) -> List[dict]:
+    results = []
+    print(f"{'benchmark':<44} {'size':>7} {'ops/sec':>12} {'time/op':>12} {'peak memory':>12}")
+    for benchmark in benchmarks:
+        sizes = benchmark.sizes[:1] if quick else benchmark.sizes
+        for size in sizes:
+            result = {"name": benchmark.name, "size": size}
+            result.update(measure(benchmark.setup(size), minTime))
+            results.append(result)
+            print(f"{benchmark.name:<44} {size:>7} {result['opsPerSecond']:>12.2f} "
+                  f"{formatTime(result['secondsPerOp']):>12} {formatBytes(result['peakMemoryBytes']):>12}")
+    return results
+
+
+def formatTime(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def formatBytes(count: int) -> str:
+    for unit, scale in (("MB", 1 << 20), ("KB", 1 << 10)):
+        if count >= scale:
+            return f"{count / scale:.1f} {unit}"
+    return f"{count} B"
+
+
+def compare(baseline: dict, current: dict):
+    """
+    Prints the speedup of every benchmark present in both result sets, the ratio of the current ops/sec to the
+    baseline ops/sec.
+    """
+    old = {(result["name"], result["size"]): result for result in baseline["results"]}
+    print(f"{'benchmark':<44} {'size':>7} {'baseline':>12} {'current':>12} {'speedup':>9}")
+    for result in current["results"]:
+        key = (result["name"], result["size"])
+        if key in old:
+            speedup = result["opsPerSecond"] / old[key]["opsPerSecond"]
+            print(f"{result['name']:<44} {result['size']:>7} {old[key]['opsPerSecond']:>12.2f} "
+                  f"{result['opsPerSecond']:>12.2f} {speedup:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the public operations of the Math package over a sweep of "
+                                                 "sizes, reporting ops/sec and peak memory.")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name matches this regex")
+    parser.add_argument("--quick", action="store_true", help="only run the smallest size of every benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds spent timing each case")
+    parser.add_argument("--backend", default=Backend.PYTHON, help="python, numpy or auto")
+    parser.add_argument("--json", default=None, help="write the results to this JSON file")
+    parser.add_argument("--compare", nargs="+", default=None, metavar="JSON",
+                        help="compare against a baseline JSON file; with two files, compare them without running")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args()
+    benchmarks = allBenchmarks()
+    if args.filter is not None:
+        pattern = re.compile(args.filter)
+        benchmarks = [benchmark for benchmark in benchmarks if pattern.search(benchmark.name)]
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"{benchmark.name:<44} {benchmark.sizes}")
+        return
+    if args.compare is not None and len(args.compare) == 2:
+        with open(args.compare[0]) as baseline, open(args.compare[1]) as current:
+            compare(json.load(baseline), json.load(current))
+        return
+    Backend.setBackend(args.backend)
+    current = {"python": sys.version.split()[0],
+               "platform": platform.platform(),
+               "backend": args.backend,
+               "results": run(benchmarks, args.quick, args.min_time)}
+    if args.json is not None:
+        with open(args.json, "w") as file:
+            json.dump(current, file, indent=2)
+    if args.compare is not None:
+        with open(args.compare[0]) as baseline:
+            print()
+            compare(json.load(baseline), current)
+
+
+if __name__ == '__main__':
+    main()
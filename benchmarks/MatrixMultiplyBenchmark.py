@@ -0,0 +1,53 @@
+import argparse
+import time
+
+from Math.Backend import Backend
+from Math.Matrix import Matrix
+
+
+def naiveMultiply(a: list, b: list) -> list:
+    """
+    Reference i-j-k multiplication over list of lists, the layout and loop order Matrix.multiply used before the
+    hoisted row and column slices.
+    """
+    n = len(a)
+    p = len(b)
+    q = len(b[0])
+    result = [[0.0] * q for _ in range(n)]
+    for i in range(n):
+        for j in range(q):
+            total = 0.0
+            for k in range(p):
+                total += a[i][k] * b[k][j]
+            result[i][j] = total
+    return result
+
+
+def toLists(m: Matrix) -> list:
+    return [[m.getValue(i, j) for j in range(m.getColumn())] for i in range(m.getRow())]
+
+
+def timeIt(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares Matrix.multiply with the naive i-j-k loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 512])
+    args = parser.parse_args()
+    Backend.setBackend(Backend.PYTHON)
+    print(f"{'size':>6} {'naive (s)':>12} {'hoisted (s)':>12} {'speedup':>8}")
+    for size in args.sizes:
+        a = Matrix(size, size, -1.0, 1.0, 1)
+        b = Matrix(size, size, -1.0, 1.0, 2)
+        aLists = toLists(a)
+        bLists = toLists(b)
+        naive = timeIt(lambda: naiveMultiply(aLists, bLists))
+        hoisted = timeIt(lambda: a.multiply(b))
+        print(f"{size:>6} {naive:>12.3f} {hoisted:>12.3f} {naive / hoisted:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
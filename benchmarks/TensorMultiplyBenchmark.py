@@ -0,0 +1,57 @@
+import argparse
+import random
+import time
+
+from Math.Backend import Backend
+from Math.Tensor import Tensor
+
+
+def naiveMultiply(a: Tensor, b: Tensor) -> list:
+    """
+    Reference batched multiplication for operands with equal batch shapes, computing every result item from
+    validated getValue calls as Tensor.multiply did before the batched kernel.
+    """
+    shape = a.getShape()
+    batches = 1
+    for dim in shape[:-2]:
+        batches *= dim
+    m, k = shape[-2:]
+    n = b.getShape()[-1]
+    a = a.reshape((batches, m, k))
+    b = b.reshape((batches, k, n))
+    result = []
+    for batch in range(batches):
+        for row in range(m):
+            for col in range(n):
+                total = 0
+                for i in range(k):
+                    total += a.getValue((batch, row, i)) * b.getValue((batch, i, col))
+                result.append(total)
+    return result
+
+
+def timeIt(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the batched Tensor.multiply with per item getValue loops.")
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    Backend.setBackend(Backend.PYTHON)
+    random.seed(1)
+    shape = (args.batch, args.size, args.size)
+    count = args.batch * args.size * args.size
+    a = Tensor([random.uniform(-1.0, 1.0) for _ in range(count)], shape)
+    b = Tensor([random.uniform(-1.0, 1.0) for _ in range(count)], shape)
+    naive = timeIt(lambda: naiveMultiply(a, b))
+    batched = timeIt(lambda: a.multiply(b, args.workers))
+    print(f"{str(shape):>16} naive {naive:.3f} s, batched {batched:.3f} s, speedup {naive / batched:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
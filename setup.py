@@ -8,6 +8,7 @@ setup(
     name='nlptoolkit_math',
     version='1.0.21',
     packages=['Math'],
+    extras_require={'numpy': ['numpy']},
     url='https://github.com/StarlangSoftware/Math-Py',
     license='',
     author='olcaytaner',
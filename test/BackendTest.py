@@ -0,0 +1,87 @@
+import math
+import unittest
+
+from Math.Backend import Backend
+from Math.Matrix import Matrix
+from Math.Tensor import Tensor
+from Math.Vector import Vector
+
+
+class BackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = Backend.getBackend()
+        self.a = Matrix(30, 20)
+        for i in range(30):
+            for j in range(20):
+                self.a.setValue(i, j, math.sin(i * 20 + j))
+        self.b = Matrix(20, 40)
+        for i in range(20):
+            for j in range(40):
+                self.b.setValue(i, j, math.cos(i * 40 + j))
+        self.v = Vector([i / 10.0 for i in range(20)])
+        self.w = Vector([i / 20.0 for i in range(30)])
+
+    def tearDown(self):
+        Backend.setBackend(self.backend)
+
+    def test_SetBackend(self):
+        Backend.setBackend("Python")
+        self.assertEqual(Backend.PYTHON, Backend.getBackend())
+        self.assertFalse(Backend.useNumpy())
+        Backend.setBackend(Backend.NUMPY)
+        self.assertEqual(Backend.isNumpyAvailable(), Backend.useNumpy())
+        self.assertRaises(ValueError, Backend.setBackend, "fortran")
+
+    @unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+    def test_AutoMinimumSize(self):
+        Backend.setBackend(Backend.AUTO)
+        self.assertFalse(Backend.useNumpy())
+        self.assertFalse(Backend.useNumpy(Backend.AUTO_MINIMUM_SIZE - 1))
+        self.assertTrue(Backend.useNumpy(Backend.AUTO_MINIMUM_SIZE))
+        self.assertFalse(Backend.useNumpy(100, 256))
+        Backend.setBackend(Backend.NUMPY)
+        self.assertTrue(Backend.useNumpy(1))
+
+    @unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+    def test_MatrixMultiply(self):
+        Backend.setBackend(Backend.PYTHON)
+        expected = self.a.multiply(self.b)
+        Backend.setBackend(Backend.NUMPY)
+        result = self.a.multiply(self.b)
+        for i in range(30):
+            for j in range(40):
+                self.assertAlmostEqual(expected.getValue(i, j), result.getValue(i, j), 10)
+
+    @unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+    def test_MatrixMultiplyWithVector(self):
+        Backend.setBackend(Backend.PYTHON)
+        expectedRight = self.a.multiplyWithVectorFromRight(self.v)
+        expectedLeft = self.a.multiplyWithVectorFromLeft(self.w)
+        Backend.setBackend(Backend.NUMPY)
+        right = self.a.multiplyWithVectorFromRight(self.v)
+        left = self.a.multiplyWithVectorFromLeft(self.w)
+        for i in range(30):
+            self.assertAlmostEqual(expectedRight.getValue(i), right.getValue(i), 10)
+        for i in range(20):
+            self.assertAlmostEqual(expectedLeft.getValue(i), left.getValue(i), 10)
+
+    @unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+    def test_VectorDotProduct(self):
+        Backend.setBackend(Backend.PYTHON)
+        expected = self.v.dotProduct(self.v)
+        Backend.setBackend(Backend.NUMPY)
+        self.assertAlmostEqual(expected, self.v.dotProduct(self.v), 10)
+
+    @unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+    def test_TensorMultiply(self):
+        a = Tensor([[[1.0, 2.0], [3.0, 4.0]], [[9.0, 10.0], [11.0, 12.0]]])
+        b = Tensor([[[5.0, 6.0], [7.0, 8.0]], [[13.0, 14.0], [15.0, 16.0]]])
+        Backend.setBackend(Backend.NUMPY)
+        result = a.multiply(b)
+        self.assertEqual((2, 2, 2), result.getShape())
+        self.assertEqual([19.0, 22.0, 43.0, 50.0, 267.0, 286.0, 323.0, 346.0], result.getData())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import math
+import unittest
+
+from Math.Matrix import Matrix
+from Math.MatrixNotPositiveDefinite import MatrixNotPositiveDefinite
+from Math.MatrixNotSymmetric import MatrixNotSymmetric
+from Math.Vector import Vector
+
+
+class CholeskyDecompositionTest(unittest.TestCase):
+
+    def setUp(self):
+        factor = Matrix(30, 30, -1, 1, 6)
+        self.spd = factor.multiply(factor.transpose())
+        for i in range(30):
+            self.spd.addValue(i, i, 1.0)
+            for j in range(i):
+                self.spd.setValue(i, j, self.spd.getValue(j, i))
+        self.v = Vector([math.sin(i) for i in range(30)])
+
+    def assertFactorizes(self, matrix: Matrix, lower: Matrix):
+        product = lower.multiply(lower.transpose())
+        for i in range(matrix.getRow()):
+            for j in range(matrix.getRow()):
+                self.assertAlmostEqual(matrix.getValue(i, j), product.getValue(i, j), 8)
+
+    def test_Factor(self):
+        lower = self.spd.cholesky().getLower()
+        for i in range(30):
+            self.assertGreater(lower.getValue(i, i), 0.0)
+            for j in range(i + 1, 30):
+                self.assertEqual(0.0, lower.getValue(i, j))
+        self.assertFactorizes(self.spd, lower)
+        self.assertFactorizes(self.spd, self.spd.choleskyDecomposition())
+        indefinite = Matrix(2, 2)
+        indefinite.setValue(0, 1, 1.0)
+        indefinite.setValue(1, 0, 1.0)
+        self.assertRaises(MatrixNotPositiveDefinite, indefinite.cholesky)
+        self.assertRaises(MatrixNotSymmetric, Matrix(3, 3, 0, 1, 1).choleskyDecomposition)
+
+    def test_Solve(self):
+        cholesky = self.spd.cholesky()
+        b = Vector([i / 10.0 for i in range(30)])
+        result = self.spd.multiplyWithVectorFromRight(cholesky.solve(b))
+        for i in range(30):
+            self.assertAlmostEqual(b.getValue(i), result.getValue(i), 8)
+        b = Matrix(30, 3, -1, 1, 2)
+        result = self.spd.multiply(cholesky.solveMany(b))
+        for i in range(30):
+            for j in range(3):
+                self.assertAlmostEqual(b.getValue(i, j), result.getValue(i, j), 8)
+
+    def test_LogDeterminant(self):
+        self.assertAlmostEqual(math.log(self.spd.lu().determinant()), self.spd.cholesky().logDeterminant(), 8)
+        self.assertEqual(0.0, Matrix(5).cholesky().logDeterminant())
+
+    def test_UpdateDowndate(self):
+        cholesky = self.spd.cholesky()
+        cholesky.update(self.v)
+        updated = self.spd.clone()
+        updated.add(Matrix(self.v, self.v))
+        self.assertFactorizes(updated, cholesky.getLower())
+        self.assertAlmostEqual(updated.cholesky().logDeterminant(), cholesky.logDeterminant(), 8)
+        cholesky.downdate(self.v)
+        self.assertFactorizes(self.spd, cholesky.getLower())
+        lower = cholesky.getLower()
+        large = Vector([10.0 * self.v.getValue(i) for i in range(30)])
+        self.assertRaises(MatrixNotPositiveDefinite, cholesky.downdate, large)
+        unchanged = cholesky.getLower()
+        for i in range(30):
+            for j in range(30):
+                self.assertEqual(lower.getValue(i, j), unchanged.getValue(i, j))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from random import randrange
+from random import randrange, Random
 
 from Math.DiscreteDistribution import DiscreteDistribution
 
@@ -38,6 +38,31 @@ class DiscreteDistributionTest(unittest.TestCase):
             discreteDistribution.addItem(randrange(1000000).__str__())
         self.assertAlmostEqual(len(discreteDistribution) / 1000000.0, 0.63212, 3)
 
+    def test_AddItems(self):
+        items = [str(i * i % 37) for i in range(500)]
+        discreteDistribution = DiscreteDistribution()
+        for item in items:
+            discreteDistribution.addItem(item)
+        bulk = DiscreteDistribution()
+        bulk.addItems(iter(items))
+        self.assertEqual(list(discreteDistribution.items()), list(bulk.items()))
+        self.assertEqual(discreteDistribution.getSum(), bulk.getSum())
+        constructed = DiscreteDistribution(items)
+        self.assertEqual(list(discreteDistribution.items()), list(constructed.items()))
+        self.assertEqual(500, constructed.getSum())
+        copy = constructed.copy()
+        self.assertEqual(list(constructed.items()), list(copy.items()))
+        self.assertEqual(500, copy.getSum())
+
+    def test_AddCounts(self):
+        self.smallDistribution.getIndex("item1")
+        self.smallDistribution.enableMaximumTracking()
+        self.smallDistribution.addCounts({"item3": 4, "item4": 2})
+        self.assertEqual(5, self.smallDistribution.getCount("item3"))
+        self.assertEqual(3, self.smallDistribution.getIndex("item4"))
+        self.assertEqual(12, self.smallDistribution.getSum())
+        self.assertEqual("item3", self.smallDistribution.getMaxItem())
+
     def test_RemoveItem(self):
         self.smallDistribution.removeItem("item1")
         self.smallDistribution.removeItem("item2")
@@ -98,6 +123,28 @@ class DiscreteDistributionTest(unittest.TestCase):
         self.assertEqual(1, self.smallDistribution.getIndex("item2"))
         self.assertEqual(2, self.smallDistribution.getIndex("item3"))
 
+    def test_IndexAfterUpdates(self):
+        self.assertEqual("item2", self.smallDistribution.getItem(1))
+        self.smallDistribution.addItem("item4")
+        self.assertEqual(3, self.smallDistribution.getIndex("item4"))
+        self.smallDistribution.removeItem("item3")
+        self.assertEqual(2, self.smallDistribution.getIndex("item4"))
+        self.smallDistribution.removeItem("item2")
+        self.smallDistribution.removeItem("item2")
+        self.assertEqual("item4", self.smallDistribution.getItem(1))
+        self.assertEqual(1, self.smallDistribution.getIndex("item4"))
+        self.assertRaises(ValueError, self.smallDistribution.getIndex, "item2")
+        discreteDistribution = DiscreteDistribution()
+        discreteDistribution.addItem("item1")
+        discreteDistribution.addItem("item5")
+        self.smallDistribution.addDistribution(discreteDistribution)
+        self.assertEqual(["item1", "item4", "item5"], [self.smallDistribution.getItem(i) for i in range(3)])
+        self.assertEqual(2, self.smallDistribution.getIndex("item5"))
+        self.assertEqual(4, self.smallDistribution.getValue(0))
+        self.smallDistribution.removeDistribution(discreteDistribution)
+        self.assertEqual(["item1", "item4"], [self.smallDistribution.getItem(i) for i in range(2)])
+        self.assertEqual(3, self.smallDistribution.getValue(0))
+
     def test_ContainsItem(self):
         self.assertTrue(self.smallDistribution.containsItem("item1"))
         self.assertFalse(self.smallDistribution.containsItem("item4"))
@@ -120,6 +167,41 @@ class DiscreteDistributionTest(unittest.TestCase):
     def test_GetMaxItem1(self):
         self.assertEqual("item1", self.smallDistribution.getMaxItem())
 
+    def test_MaximumTracking(self):
+        tracked = DiscreteDistribution()
+        tracked.enableMaximumTracking()
+        scanned = DiscreteDistribution()
+        generator = Random(3)
+        for i in range(3000):
+            item = str(generator.randrange(40))
+            if generator.random() < 0.3:
+                tracked.removeItem(item)
+                scanned.removeItem(item)
+            else:
+                tracked.addItem(item)
+                scanned.addItem(item)
+            self.assertEqual(scanned.getMaxItem(), tracked.getMaxItem())
+            if i % 100 == 0:
+                self.assertEqual(scanned.topK(5), tracked.topK(5))
+        other = DiscreteDistribution()
+        for item in ["x", "y", "y"] + [scanned.getMaxItem()] * 100:
+            other.addItem(item)
+        tracked.addDistribution(other)
+        scanned.addDistribution(other)
+        self.assertEqual(scanned.topK(len(scanned)), tracked.topK(len(tracked)))
+        tracked.removeDistribution(other)
+        scanned.removeDistribution(other)
+        self.assertEqual(scanned.topK(len(scanned)), tracked.topK(len(tracked)))
+        tracked.clear()
+        self.assertEqual("", tracked.getMaxItem())
+        self.assertEqual([], tracked.topK(3))
+
+    def test_TopK(self):
+        self.assertEqual([("item1", 3), ("item2", 2)], self.smallDistribution.topK(2))
+        self.smallDistribution.addItem("item3")
+        self.assertEqual([("item1", 3), ("item2", 2), ("item3", 2)], self.smallDistribution.topK(5))
+        self.assertEqual([], self.smallDistribution.topK(0))
+
     def test_GetMaxItem2(self):
         include = ["item2", "item3"]
         self.assertEqual("item2", self.smallDistribution.getMaxItemIncludeTheseOnly(include))
@@ -1,6 +1,9 @@
 import unittest
+from array import array
 
+from Math.Backend import Backend
 from Math.Distribution import Distribution
+from Math.Vector import Vector
 
 
 class DistributionTest(unittest.TestCase):
@@ -106,6 +109,126 @@ class DistributionTest(unittest.TestCase):
         self.assertAlmostEqual(3.646, Distribution.tDistributionInverse(0.001, 17), 3)
         self.assertAlmostEqual(3.373, Distribution.tDistributionInverse(0.0005, 120), 3)
 
+    def test_InverseIterations(self):
+        for p in (0.001, 0.05, 0.5, 0.8, 0.999):
+            z = Distribution.zInverse(p, 1e-12)
+            self.assertAlmostEqual(p, Distribution.zNormal(z), 12)
+            self.assertLessEqual(Distribution.getIterationCount(), 5)
+            for freedom in (1, 2, 5, 30, 500):
+                x = Distribution.chiSquareInverse(p, freedom, 1e-12)
+                self.assertAlmostEqual(p, Distribution.chiSquare(x, freedom), 12)
+                self.assertLessEqual(Distribution.getIterationCount(), 10)
+            for freedom1, freedom2 in ((2, 3), (5, 26), (12, 12), (30, 4)):
+                x = Distribution.fDistributionInverse(p, freedom1, freedom2, 1e-12)
+                self.assertAlmostEqual(p, Distribution.fDistribution(x, freedom1, freedom2), 12)
+                self.assertLessEqual(Distribution.getIterationCount(), 10)
+        Distribution.zInverse(0.0)
+        self.assertEqual(0, Distribution.getIterationCount())
+
+    def test_InverseCache(self):
+        Distribution.clearCache()
+        first = Distribution.chiSquareInverse(0.05, 7)
+        self.assertEqual(first, Distribution.chiSquareInverse(0.05, 7))
+        self.assertEqual(0, Distribution.getIterationCount())
+        Distribution.tDistributionInverse(0.05, 7)
+        Distribution.tDistributionInverse(0.05, 7)
+        statistics = Distribution.getCacheStatistics()
+        self.assertEqual(2, statistics["hits"])
+        self.assertEqual(2, statistics["misses"])
+        self.assertEqual(2, statistics["size"])
+        Distribution.chiSquareInverse(0.05, 7, 0.1)
+        self.assertEqual(3, Distribution.getCacheStatistics()["misses"])
+        Distribution.clearCache()
+        self.assertEqual(0, Distribution.getCacheStatistics()["size"])
+
+    def test_CriticalValueTables(self):
+        Distribution.clearCache()
+        Distribution.enableCriticalValueTables()
+        try:
+            self.assertAlmostEqual(3.841, Distribution.chiSquareInverse(0.05, 1), 3)
+            self.assertAlmostEqual(124.342, Distribution.chiSquareInverse(0.05, 100), 3)
+            self.assertAlmostEqual(2.228, Distribution.tDistributionInverse(0.025, 10), 3)
+            self.assertAlmostEqual(1.962, Distribution.tDistributionInverse(0.025, 1000), 3)
+            self.assertAlmostEqual(15.987, Distribution.chiSquareInverse(0.1, 10), 3)
+            statistics = Distribution.getCacheStatistics()
+            self.assertEqual(5, statistics["tableHits"])
+            self.assertEqual(3, statistics["tables"])
+            self.assertEqual(0, statistics["misses"])
+            Distribution.chiSquareInverse(0.05, 1001)
+            Distribution.chiSquareInverse(0.2, 10)
+            self.assertEqual(2, Distribution.getCacheStatistics()["misses"])
+            self.assertEqual(Distribution.chiSquareInverse(0.05, 10), Distribution.chiSquareInverse(0.05, 10.0))
+            self.assertEqual(Distribution.tDistributionInverse(0.025, 10),
+                             Distribution.tDistributionInverse(0.025, 10.0))
+            self.assertEqual(2, Distribution.getCacheStatistics()["misses"])
+            Distribution.chiSquareInverse(0.05, 10.5)
+            self.assertEqual(3, Distribution.getCacheStatistics()["misses"])
+        finally:
+            Distribution.enableCriticalValueTables(False)
+            Distribution.clearCache()
+
+    def test_ZNormals(self):
+        values = [i / 10.0 for i in range(-80, 81)]
+        result = Distribution.zNormals(values)
+        for value, item in zip(values, result):
+            self.assertAlmostEqual(Distribution.zNormal(value), item, 12)
+        result = Distribution.zNormals(Vector(values))
+        self.assertIsInstance(result, Vector)
+        self.assertAlmostEqual(Distribution.zNormal(0.5), result.getValue(85), 12)
+        self.assertEqual([], Distribution.zNormals([]))
+
+    def test_GammaLns(self):
+        values = [i / 4.0 for i in range(1, 200)]
+        for value, item in zip(values, Distribution.gammaLns(array('d', values))):
+            self.assertAlmostEqual(Distribution.gammaLn(value), item, 10)
+
+    def test_ChiSquares(self):
+        values = [i / 2.0 for i in range(-2, 600)]
+        for freedom in (1, 2, 3, 10, 101):
+            for value, item in zip(values, Distribution.chiSquares(values, freedom)):
+                self.assertAlmostEqual(Distribution.chiSquare(value, freedom), item, 12)
+        freedoms = [1 + i % 7 for i in range(len(values))]
+        for value, freedom, item in zip(values, freedoms, Distribution.chiSquares(values, freedoms)):
+            self.assertAlmostEqual(Distribution.chiSquare(value, freedom), item, 12)
+        self.assertRaises(ValueError, Distribution.chiSquares, values, [1, 2])
+
+    def test_ChiSquaresFreedoms(self):
+        values = [0.5, 1.0, 3.0, 12.0]
+        backend = Backend.getBackend()
+        try:
+            for selected in (Backend.PYTHON, Backend.NUMPY):
+                Backend.setBackend(selected)
+                self.assertEqual(Distribution.chiSquares(values, 10), Distribution.chiSquares(values, 10.0))
+                for value, item in zip(values, Distribution.chiSquares(values, [2.5] * 4)):
+                    self.assertAlmostEqual(Distribution.chiSquare(value, 2.5), item, 12)
+                for value, item in zip(values, Distribution.chiSquares(values, 2.5)):
+                    self.assertAlmostEqual(Distribution.chiSquare(value, 2.5), item, 12)
+                if Backend.isNumpyAvailable():
+                    freedom = Backend.getNumpy().int64(10)
+                    self.assertEqual(Distribution.chiSquares(values, 10), Distribution.chiSquares(values, freedom))
+        finally:
+            Backend.setBackend(backend)
+
+    def test_FDistributions(self):
+        values = [i / 8.0 for i in range(0, 400)]
+        for freedom1, freedom2 in ((1, 1), (1, 2), (2, 1), (2, 2), (5, 26), (8, 13), (12, 12)):
+            for value, item in zip(values, Distribution.fDistributions(values, freedom1, freedom2)):
+                self.assertAlmostEqual(Distribution.fDistribution(value, freedom1, freedom2), item, 12)
+        freedoms = [1 + i % 5 for i in range(len(values))]
+        for value, freedom, item in zip(values, freedoms, Distribution.fDistributions(values, freedoms, 7)):
+            self.assertAlmostEqual(Distribution.fDistribution(value, freedom, 7), item, 12)
+        self.assertEqual(Distribution.fDistributions(values, 5, 26), Distribution.fDistributions(values, 5.0, 26.0))
+        self.assertRaises(ValueError, Distribution.fDistributions, values, 2.5, 7)
+        self.assertRaises(ValueError, Distribution.fDistributions, values, 5, [7.5] * len(values))
+
+    def test_TDistributions(self):
+        values = [i / 8.0 for i in range(-100, 100)]
+        for freedom in (1, 10, 20):
+            result = Distribution.tDistributions(Vector(values), freedom)
+            for i in range(len(values)):
+                self.assertAlmostEqual(Distribution.tDistribution(values[i], freedom), result.getValue(i), 12)
+        self.assertRaises(ValueError, Distribution.tDistributions, values, 10.5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from Math.DeterminantZero import DeterminantZero
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+
+
+class LUDecompositionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.small = Matrix(3, 3)
+        values = [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]]
+        for i in range(3):
+            for j in range(3):
+                self.small.setValue(i, j, values[i][j])
+        self.random = Matrix(50, 50, -1, 1, 1)
+        self.ones = Matrix(3, 3)
+        for i in range(3):
+            for j in range(3):
+                self.ones.setValue(i, j, 1.0)
+
+    def test_Factors(self):
+        lu = self.random.lu()
+        product = lu.getLower().multiply(lu.getUpper())
+        pivot = lu.getPivot()
+        for i in range(50):
+            for j in range(50):
+                self.assertAlmostEqual(self.random.getValue(pivot[i], j), product.getValue(i, j), 10)
+
+    def test_Determinant(self):
+        self.assertAlmostEqual(-5.0, self.small.lu().determinant(), 10)
+        self.assertEqual(1.0, Matrix(100).lu().determinant())
+        self.assertEqual(0.0, self.ones.lu().determinant())
+        self.assertTrue(self.ones.lu().isSingular())
+        self.assertAlmostEqual(1.0, self.random.lu().determinant() / self.random.determinant(), 10)
+
+    def test_Solve(self):
+        lu = self.random.lu()
+        b = Vector([i / 10.0 for i in range(50)])
+        x = lu.solve(b)
+        result = self.random.multiplyWithVectorFromRight(x)
+        for i in range(50):
+            self.assertAlmostEqual(b.getValue(i), result.getValue(i), 10)
+        x = self.small.lu().solve(Vector([3.0, 2.0, 4.0]))
+        self.assertAlmostEqual(1.0, x.getValue(0), 10)
+        self.assertAlmostEqual(1.0, x.getValue(1), 10)
+        self.assertAlmostEqual(1.0, x.getValue(2), 10)
+
+    def test_SolveMany(self):
+        lu = self.random.lu()
+        b = Matrix(50, 4, -1, 1, 2)
+        x = lu.solveMany(b)
+        result = self.random.multiply(x)
+        for i in range(50):
+            for j in range(4):
+                self.assertAlmostEqual(b.getValue(i, j), result.getValue(i, j), 10)
+
+    def test_Inverse(self):
+        inverse = self.random.lu().inverse()
+        product = self.random.multiply(inverse)
+        for i in range(50):
+            for j in range(50):
+                self.assertAlmostEqual(1.0 if i == j else 0.0, product.getValue(i, j), 10)
+        copy = self.random.clone()
+        copy.inverse()
+        self.assertAlmostEqual(copy.sumOfElements(), inverse.sumOfElements(), 8)
+
+    def test_Singular(self):
+        lu = self.ones.lu()
+        self.assertRaises(DeterminantZero, lu.solve, Vector(3, 1.0))
+        self.assertRaises(DeterminantZero, lu.inverse)
+
+
+if __name__ == '__main__':
+    unittest.main()
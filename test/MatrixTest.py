@@ -1,7 +1,11 @@
 import unittest
-from random import randrange
+from random import randrange, Random
 
+from Math.Backend import Backend
+from Math.EigenvalueNotConverged import EigenvalueNotConverged
 from Math.Matrix import Matrix
+from Math.MatrixDimensionMismatch import MatrixDimensionMismatch
+from Math.MatrixNotSymmetric import MatrixNotSymmetric
 from Math.Vector import Vector
 
 
@@ -118,6 +122,19 @@ class MatrixTest(unittest.TestCase):
         result = self.identity.multiply(self.random)
         self.assertEqual(self.originalSum, result.sumOfElements())
 
+    def test_MultiplyRectangular(self):
+        a = Matrix(23, 17, -1, 1, 3)
+        b = Matrix(17, 31, -1, 1, 4)
+        expected = a.multiply(b)
+        self.assertEqual(23, expected.getRow())
+        self.assertEqual(31, expected.getColumn())
+        for i in range(23):
+            for j in range(31):
+                total = 0.0
+                for k in range(17):
+                    total += a.getValue(i, k) * b.getValue(k, j)
+                self.assertAlmostEqual(total, expected.getValue(i, j), 10)
+
     def test_ElementProduct(self):
         result = self.small.elementProduct(self.small)
         self.assertEqual(9, result.sumOfElements())
@@ -137,6 +154,26 @@ class MatrixTest(unittest.TestCase):
         self.assertEqual(1000, self.large.trace())
         self.assertEqual(100, self.identity.trace())
 
+    def test_RowAndColumnVector(self):
+        row = self.random.getRowVector(3)
+        column = self.random.getColumnVector(5)
+        self.assertEqual(100, row.size())
+        self.assertEqual(100, len(column))
+        for i in range(100):
+            self.assertEqual(self.random.getValue(3, i), row.getValue(i))
+            self.assertEqual(self.random.getValue(i, 5), column[i])
+        partial = self.random.partial(2, 4, 5, 9)
+        self.assertEqual(3, partial.getRow())
+        self.assertEqual(5, partial.getColumn())
+        self.assertEqual(self.random.getValue(3, 7), partial.getValue(1, 2))
+
+    def test_SetValues(self):
+        matrix = Matrix(2, 3)
+        matrix.setValues([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(3.0, matrix.getValue(0, 2))
+        self.assertEqual(4.0, matrix.getValue(1, 0))
+        self.assertRaises(MatrixDimensionMismatch, matrix.setValues, [1.0, 2.0])
+
     def test_Transpose(self):
         self.assertEqual(9, self.small.transpose().sumOfElements())
         self.assertEqual(1000000, self.large.transpose().sumOfElements())
@@ -169,6 +206,123 @@ class MatrixTest(unittest.TestCase):
         vectors = self.medium.characteristics()
         self.assertEqual(46, len(vectors))
 
+    def test_CharacteristicsHouseholder(self):
+        generator = Random(5)
+        symmetric = Matrix(40, 40)
+        for i in range(40):
+            for j in range(i, 40):
+                value = generator.uniform(-1.0, 1.0)
+                symmetric.setValue(i, j, value)
+                symmetric.setValue(j, i, value)
+        jacobi = symmetric.characteristics(Matrix.JACOBI)
+        householder = symmetric.characteristics(Matrix.HOUSEHOLDER)
+        self.assertEqual(len(jacobi), len(householder))
+        for expected, vector in zip(jacobi, householder):
+            self.assertAlmostEqual(expected.getEigenvalue(), vector.getEigenvalue(), 10)
+            self.assertAlmostEqual(1.0, vector.l2Norm(), 10)
+            product = symmetric.multiplyWithVectorFromRight(vector)
+            for i in range(40):
+                self.assertAlmostEqual(vector.getEigenvalue() * vector.getValue(i), product.getValue(i), 10)
+        self.assertEqual(100, len(self.identity.characteristics(Matrix.HOUSEHOLDER)))
+        self.assertEqual(2, len(Matrix(2).characteristics(Matrix.HOUSEHOLDER)))
+        self.assertRaises(ValueError, self.small.characteristics, "power")
+
+    def test_CharacteristicsNotConverged(self):
+        generator = Random(5)
+        symmetric = Matrix(20, 20)
+        for i in range(20):
+            for j in range(i, 20):
+                value = generator.uniform(-1.0, 1.0)
+                symmetric.setValue(i, j, value)
+                symmetric.setValue(j, i, value)
+        backend = Backend.getBackend()
+        Backend.setBackend(Backend.PYTHON)
+        Matrix.QL_MAX_ITERATIONS = 1
+        try:
+            self.assertRaises(EigenvalueNotConverged, symmetric.characteristics, Matrix.HOUSEHOLDER)
+        finally:
+            Matrix.QL_MAX_ITERATIONS = 60
+            Backend.setBackend(backend)
+
+    def test_TopEigenvectors(self):
+        generator = Random(7)
+        symmetric = Matrix(60, 60)
+        for i in range(60):
+            for j in range(i, 60):
+                value = generator.uniform(-1.0, 1.0)
+                symmetric.setValue(i, j, value)
+                symmetric.setValue(j, i, value)
+        expected = symmetric.characteristics(Matrix.HOUSEHOLDER)
+        result = symmetric.topEigenvectors(5)
+        self.assertEqual(5, len(result))
+        for i in range(5):
+            self.assertAlmostEqual(expected[i].getEigenvalue(), result[i].getEigenvalue(), 8)
+            self.assertAlmostEqual(1.0, abs(expected[i].dotProduct(result[i])), 6)
+        identity = Matrix(10).topEigenvectors(3)
+        self.assertEqual([1.0, 1.0, 1.0], [round(vector.getEigenvalue(), 10) for vector in identity])
+        self.assertEqual(2, len(symmetric.topEigenvectors(2, maxIterations=3)))
+        self.assertEqual([], symmetric.topEigenvectors(0))
+        self.assertRaises(MatrixNotSymmetric, Matrix(3, 3, 0.0, 1.0, 1).topEigenvectors, 2)
+
+    def test_TopEigenvectorsRepeated(self):
+        generator = Random(3)
+        u = [generator.uniform(-1.0, 1.0) for _ in range(40)]
+        scale = 2.0 / sum(x * x for x in u)
+        diagonal = [5.0 if i < 3 else 1.0 for i in range(40)]
+        reflection = [[(1.0 if i == k else 0.0) - scale * u[i] * u[k] for k in range(40)] for i in range(40)]
+        rotated = Matrix(40, 40)
+        for i in range(40):
+            for j in range(i, 40):
+                value = sum(reflection[i][k] * diagonal[k] * reflection[j][k] for k in range(40))
+                rotated.setValue(i, j, value)
+                rotated.setValue(j, i, value)
+        backend = Backend.getBackend()
+        try:
+            for selected in (Backend.PYTHON, Backend.NUMPY):
+                Backend.setBackend(selected)
+                result = rotated.topEigenvectors(2)
+                self.assertEqual([5.0, 5.0], [round(vector.getEigenvalue(), 8) for vector in result])
+                result = rotated.topEigenvectors(4)
+                self.assertEqual([5.0, 5.0, 5.0, 1.0], [round(vector.getEigenvalue(), 8) for vector in result])
+                for vector in result:
+                    product = rotated.multiplyWithVectorFromRight(vector)
+                    for i in range(40):
+                        self.assertAlmostEqual(vector.getEigenvalue() * vector.getValue(i), product.getValue(i), 8)
+        finally:
+            Backend.setBackend(backend)
+
+    def test_RandomizedSvd(self):
+        generator = Random(11)
+        left = Matrix(50, 3)
+        right = Matrix(3, 12)
+        for i in range(3):
+            for j in range(50):
+                left.setValue(j, i, generator.gauss(0.0, 1.0))
+            for j in range(12):
+                right.setValue(i, j, generator.gauss(0.0, 1.0) * 2 ** -i)
+        lowRank = left.multiply(right)
+        u, singularValues, vt = lowRank.randomizedSvd(3)
+        self.assertEqual(50, u.getRow())
+        self.assertEqual(3, u.getColumn())
+        self.assertEqual(3, singularValues.size())
+        self.assertEqual(12, vt.getColumn())
+        expected = Matrix.topEigenvectorsOf(lowRank.transpose().multiply(lowRank), 3)
+        for i in range(3):
+            self.assertAlmostEqual(expected[i].getEigenvalue() ** 0.5, singularValues.getValue(i), 8)
+            for j in range(50):
+                u.setValue(j, i, u.getValue(j, i) * singularValues.getValue(i))
+        product = u.multiply(vt)
+        for i in range(50):
+            for j in range(12):
+                self.assertAlmostEqual(lowRank.getValue(i, j), product.getValue(i, j), 8)
+        identity = vt.multiply(vt.transpose())
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(1.0 if i == j else 0.0, identity.getValue(i, j), 10)
+        u, singularValues, vt = lowRank.randomizedSvd(20)
+        self.assertEqual(12, singularValues.size())
+        self.assertAlmostEqual(0.0, singularValues.getValue(11), 8)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from Math.Matrix import Matrix
+from Math.MatrixRankDeficient import MatrixRankDeficient
+from Math.MatrixRowMismatch import MatrixRowMismatch
+from Math.Vector import Vector
+
+
+class QRDecompositionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tall = Matrix(40, 5, -1, 1, 3)
+        self.square = Matrix(20, 20, -1, 1, 4)
+        self.dependent = Matrix(6, 3)
+        for i in range(6):
+            self.dependent.setValue(i, 0, i)
+            self.dependent.setValue(i, 1, 1.0)
+            self.dependent.setValue(i, 2, 2.0 * i + 3.0)
+
+    def test_Factors(self):
+        qr = self.tall.qr()
+        q = qr.getQ()
+        r = qr.getR()
+        product = q.multiply(r)
+        for i in range(40):
+            for j in range(5):
+                self.assertAlmostEqual(self.tall.getValue(i, j), product.getValue(i, j), 10)
+        identity = q.transpose().multiply(q)
+        for i in range(5):
+            for j in range(5):
+                self.assertAlmostEqual(1.0 if i == j else 0.0, identity.getValue(i, j), 10)
+            for j in range(i):
+                self.assertEqual(0.0, r.getValue(i, j))
+        self.assertTrue(qr.isFullRank())
+
+    def test_LeastSquares(self):
+        expected = Vector([1.0, -2.0, 0.5, 3.0, 0.0])
+        b = self.tall.multiplyWithVectorFromRight(expected)
+        x = self.tall.leastSquares(b)
+        for i in range(5):
+            self.assertAlmostEqual(expected.getValue(i), x.getValue(i), 10)
+        self.assertAlmostEqual(0.0, self.tall.qr().residualNorm(b), 10)
+        noisy = Vector([b.getValue(i) + (0.1 if i % 2 == 0 else -0.1) for i in range(40)])
+        x = self.tall.leastSquares(noisy)
+        residual = noisy.difference(self.tall.multiplyWithVectorFromRight(x))
+        normal = self.tall.multiplyWithVectorFromLeft(residual)
+        for i in range(5):
+            self.assertAlmostEqual(0.0, normal.getValue(i), 10)
+        self.assertAlmostEqual(residual.l2Norm(), self.tall.qr().residualNorm(noisy), 10)
+        self.assertRaises(MatrixRowMismatch, self.tall.leastSquares, Vector(3, 1.0))
+
+    def test_Square(self):
+        b = Vector([i / 10.0 for i in range(20)])
+        x = self.square.leastSquares(b)
+        result = self.square.multiplyWithVectorFromRight(x)
+        for i in range(20):
+            self.assertAlmostEqual(b.getValue(i), result.getValue(i), 10)
+
+    def test_SolveMany(self):
+        b = Matrix(40, 3, -1, 1, 5)
+        qr = self.tall.qr()
+        x = self.tall.leastSquares(b)
+        self.assertEqual(5, x.getRow())
+        self.assertEqual(3, x.getColumn())
+        for j in range(3):
+            column = qr.solve(Vector([b.getValue(i, j) for i in range(40)]))
+            for i in range(5):
+                self.assertAlmostEqual(column.getValue(i), x.getValue(i, j), 10)
+
+    def test_RankDeficient(self):
+        qr = self.dependent.qr()
+        self.assertFalse(qr.isFullRank())
+        self.assertRaises(MatrixRankDeficient, qr.solve, Vector(6, 1.0))
+        self.assertRaises(MatrixRankDeficient, Matrix(2, 3).qr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from Math.DiscreteDistribution import DiscreteDistribution
+from Math.ShardedCounter import ShardedCounter
+
+
+class ShardedCounterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [str(i * i % 101 % 17) + ("a" if i % 5 == 0 else "") for i in range(2000)]
+        self.expected = DiscreteDistribution(self.items)
+
+    def assertSameDistribution(self, expected: DiscreteDistribution, result: DiscreteDistribution):
+        self.assertEqual(list(expected.items()), list(result.items()))
+        self.assertEqual(expected.getSum(), result.getSum())
+
+    def test_CountItems(self):
+        for numberOfProcesses in (1, 2):
+            counter = ShardedCounter(numberOfProcesses, 150)
+            self.assertSameDistribution(self.expected, counter.countItems(iter(self.items)))
+            timings = counter.getShardTimings()
+            self.assertEqual(list(range(14)), [shard for shard, _, _ in timings])
+            self.assertEqual(2000, sum(count for _, count, _ in timings))
+            self.assertTrue(all(seconds >= 0.0 for _, _, seconds in timings))
+
+    def test_CountFiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fileNames = []
+            for i in range(5):
+                fileName = os.path.join(directory, "shard" + str(i) + ".txt")
+                with open(fileName, "w", encoding="utf8") as outputFile:
+                    for j in range(i * 400, (i + 1) * 400, 8):
+                        outputFile.write(" ".join(self.items[j:j + 8]) + "\n")
+                fileNames.append(fileName)
+            counter = ShardedCounter(2)
+            self.assertSameDistribution(self.expected, counter.countFiles(fileNames))
+            self.assertEqual([400] * 5, [count for _, count, _ in counter.getShardTimings()])
+
+    def test_Empty(self):
+        counter = ShardedCounter(2)
+        self.assertEqual(0, len(counter.countItems([])))
+        self.assertEqual([], counter.getShardTimings())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from Math.DiscreteDistribution import DiscreteDistribution
+from Math.Matrix import Matrix
+from Math.MatrixColumnMismatch import MatrixColumnMismatch
+from Math.MatrixNotSquare import MatrixNotSquare
+from Math.MatrixRowColumnMismatch import MatrixRowColumnMismatch
+from Math.SparseMatrix import SparseMatrix
+from Math.Vector import Vector
+
+
+class SparseMatrixTest(unittest.TestCase):
+
+    def setUp(self):
+        self.triplets = [(0, 0, 1.0), (0, 3, 2.0), (1, 1, 3.0), (2, 0, 4.0), (2, 2, 5.0), (2, 3, 6.0), (0, 3, 1.0)]
+        self.sparse = SparseMatrix(4, 5, self.triplets)
+        self.dense = self.sparse.toMatrix()
+        self.other = Matrix(5, 3, -1, 1, 1)
+        self.large = SparseMatrix(1000, 100000, [(i, (i * 7919) % 100000, 1.0) for i in range(1000)])
+
+    def test_Construction(self):
+        self.assertEqual(6, self.sparse.numberOfNonZeros())
+        self.assertEqual(3.0, self.sparse.getValue(0, 3))
+        self.assertEqual(0.0, self.sparse.getValue(1, 0))
+        self.assertEqual(0.0, self.sparse.getValue(3, 4))
+        self.assertEqual(22.0, self.dense.sumOfElements())
+        self.assertEqual(0, SparseMatrix(3, 3, [(1, 1, 2.0), (1, 1, -2.0)]).numberOfNonZeros())
+        self.assertRaises(IndexError, SparseMatrix, 2, 2, [(2, 0, 1.0)])
+        self.assertEqual(1000, self.large.numberOfNonZeros())
+
+    def test_FromDiscreteDistributions(self):
+        first = DiscreteDistribution()
+        first.addItem("a")
+        first.addItem("b")
+        first.addItem("a")
+        second = DiscreteDistribution()
+        second.addItem("c")
+        sparse = SparseMatrix.fromDiscreteDistributions([first, second], {"a": 0, "b": 1, "c": 2})
+        self.assertEqual(2, sparse.getRow())
+        self.assertEqual(3, sparse.getColumn())
+        self.assertEqual(2, sparse.getValue(0, 0))
+        self.assertEqual(1, sparse.getValue(0, 1))
+        self.assertEqual(1, sparse.getValue(1, 2))
+        self.assertEqual(3, sparse.numberOfNonZeros())
+
+    def test_MultiplyWithVector(self):
+        v = Vector([1.0, 2.0, 3.0, 4.0, 5.0])
+        expected = self.dense.multiplyWithVectorFromRight(v)
+        result = self.sparse.multiplyWithVectorFromRight(v)
+        for i in range(4):
+            self.assertAlmostEqual(expected.getValue(i), result.getValue(i), 10)
+        w = Vector([1.0, -1.0, 2.0, 0.5])
+        expected = self.dense.multiplyWithVectorFromLeft(w)
+        result = self.sparse.multiplyWithVectorFromLeft(w)
+        for i in range(5):
+            self.assertAlmostEqual(expected.getValue(i), result.getValue(i), 10)
+        self.assertRaises(MatrixColumnMismatch, self.sparse.multiplyWithVectorFromRight, w)
+
+    def test_MultiplyDense(self):
+        expected = self.dense.multiply(self.other)
+        result = self.sparse.multiply(self.other)
+        for i in range(4):
+            for j in range(3):
+                self.assertAlmostEqual(expected.getValue(i, j), result.getValue(i, j), 10)
+        self.assertRaises(MatrixRowColumnMismatch, self.sparse.multiply, self.dense)
+
+    def test_MultiplySparse(self):
+        transpose = self.sparse.transpose()
+        expected = self.dense.multiply(self.dense.transpose())
+        result = self.sparse.multiply(transpose)
+        self.assertIsInstance(result, SparseMatrix)
+        for i in range(4):
+            for j in range(4):
+                self.assertAlmostEqual(expected.getValue(i, j), result.getValue(i, j), 10)
+        self.assertEqual(1000, self.large.multiply(self.large.transpose()).numberOfNonZeros())
+
+    def test_Transpose(self):
+        transpose = self.sparse.transpose()
+        self.assertEqual(5, transpose.getRow())
+        self.assertEqual(4, transpose.getColumn())
+        for i in range(4):
+            for j in range(5):
+                self.assertEqual(self.sparse.getValue(i, j), transpose.getValue(j, i))
+
+    def test_Sums(self):
+        self.assertEqual(3.0, self.sparse.rowSum(1))
+        self.assertEqual(0.0, self.sparse.rowSum(3))
+        sums = self.sparse.sumOfRows()
+        expected = self.dense.sumOfRows()
+        for j in range(5):
+            self.assertEqual(expected.getValue(j), sums.getValue(j))
+        self.assertEqual(1000, self.large.sumOfRows().sumOfElements())
+
+    def test_TopEigenvectors(self):
+        triplets = []
+        for i in range(30):
+            triplets.append((i, i, 2.0 + i % 7))
+            triplets.append((i, (i + 1) % 30, 1.0))
+            triplets.append(((i + 1) % 30, i, 1.0))
+        sparse = SparseMatrix(30, 30, triplets)
+        expected = sparse.toMatrix().characteristics(Matrix.HOUSEHOLDER)
+        result = sparse.topEigenvectors(4)
+        self.assertEqual(4, len(result))
+        for i in range(4):
+            self.assertAlmostEqual(expected[i].getEigenvalue(), result[i].getEigenvalue(), 8)
+        self.assertRaises(MatrixNotSquare, self.sparse.topEigenvectors, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
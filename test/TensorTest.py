@@ -1,8 +1,17 @@
+import math
 import unittest
+from Math.Backend import Backend
 from Math.Tensor import Tensor
 
 class TensorTest(unittest.TestCase):
 
+    def setUp(self):
+        self.backend = Backend.getBackend()
+        Backend.setBackend(Backend.PYTHON)
+
+    def tearDown(self):
+        Backend.setBackend(self.backend)
+
     def test_inferred_shape(self):
         a = Tensor([[1.0, 2.0], [3.0, 4.0]])
         self.assertEqual((2, 2), a.getShape())
@@ -74,6 +83,45 @@ class TensorTest(unittest.TestCase):
         sum = a.multiply(b)
         self.assertEqual([19.0, 22.0, 43.0, 50.0, 267.0, 286.0, 323.0, 346.0], sum.getData())
 
+    def test_multiply_broadcast_batch(self):
+        a = Tensor([float(i) for i in range(24)], (2, 3, 4))
+        b = Tensor([float(i % 5) for i in range(8)], (4, 2))
+        result = a.multiply(b)
+        self.assertEqual((2, 3, 2), result.getShape())
+        for batch in range(2):
+            expected = a.get((batch,)).multiply(b)
+            self.assertEqual(expected.getData(), result.get((batch,)).getData())
+        self.assertEqual(sum(a.getValue((1, 2, k)) * b.getValue((k, 1)) for k in range(4)),
+                         result.getValue((1, 2, 1)))
+
+    def test_multiply_views(self):
+        a = Tensor([[1.0, 2.0], [3.0, 4.0]])
+        b = Tensor([[5.0, 6.0], [7.0, 8.0]])
+        self.assertEqual([26.0, 30.0, 38.0, 44.0], a.transpose().multiply(b).getData())
+        self.assertEqual([17.0, 23.0, 39.0, 53.0], a.multiply(b.transpose()).getData())
+
+    def test_multiply_workers(self):
+        a = Tensor([float(i % 7) for i in range(48)], (4, 3, 4))
+        b = Tensor([float(i % 3) for i in range(32)], (4, 4, 2))
+        self.assertEqual(a.multiply(b).getData(), a.multiply(b, workers=2).getData())
+
+    def test_multiply_backends(self):
+        integers = Tensor([[1, 2], [3, 4]])
+        floats = Tensor([[1.0, 2.0], [3.0, 4.0]])
+        a = Tensor([float(i % 7) for i in range(48)], (4, 3, 4))
+        b = Tensor([float(i % 3) for i in range(32)], (4, 4, 2))
+        expected = a.multiply(b).getData()
+        for backend in (Backend.AUTO, Backend.NUMPY):
+            Backend.setBackend(backend)
+            result = integers.multiply(integers).getData()
+            self.assertEqual([7, 10, 15, 22], result)
+            self.assertTrue(all(isinstance(item, int) for item in result))
+            result = floats.multiply(floats).getData()
+            self.assertEqual([7.0, 10.0, 15.0, 22.0], result)
+            self.assertTrue(all(isinstance(item, float) for item in result))
+            self.assertEqual(expected, a.multiply(b).getData())
+            self.assertEqual(expected, a.multiply(b, workers=2).getData())
+
     def test_partial_valid(self):
         data = [
             [1.0, 2.0, 3.0],
@@ -84,5 +132,119 @@ class TensorTest(unittest.TestCase):
         partial = tensor.partial((0, 1), (2, 3))
         self.assertEqual(partial.getData(), [2.0, 3.0, 5.0, 6.0])
 
+    def test_views_share_data(self):
+        a = Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        b = a.transpose()
+        self.assertEqual((1, 3), b.getStrides())
+        self.assertFalse(b.isContiguous())
+        b.setValue((2, 1), 60.0)
+        self.assertEqual(60.0, a.getValue((1, 2)))
+        row = a.get((1,))
+        self.assertEqual((3,), row.getShape())
+        self.assertEqual([4.0, 5.0, 60.0], row.getData())
+        self.assertEqual([2.0, 3.0], a.partial((0, 1), (1, 3)).getData())
+
+    def test_contiguous(self):
+        a = Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assertIs(a, a.contiguous())
+        b = a.transpose().contiguous()
+        self.assertTrue(b.isContiguous())
+        self.assertEqual([1.0, 4.0, 2.0, 5.0, 3.0, 6.0], b.getData())
+        b.setValue((0, 0), 10.0)
+        self.assertEqual(1.0, a.getValue((0, 0)))
+
+    def test_reshape_view(self):
+        a = Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        b = a.reshape((3, 2))
+        self.assertIs(a.getData(), b.getData())
+        c = a.transpose().reshape((6,))
+        self.assertEqual([1.0, 4.0, 2.0, 5.0, 3.0, 6.0], c.getData())
+        self.assertRaises(ValueError, a.reshape, (4, 2))
+
+    def test_broadcast_view(self):
+        a = Tensor([1.0, 2.0, 3.0])
+        b = a.broadcast_to((2, 3))
+        self.assertEqual((0, 1), b.getStrides())
+        self.assertEqual([1.0, 2.0, 3.0, 1.0, 2.0, 3.0], b.getData())
+        c = Tensor([1.0, 2.0], (2, 1)).broadcast_to((2, 3))
+        self.assertEqual([1.0, 1.0, 1.0, 2.0, 2.0, 2.0], c.getData())
+        self.assertRaises(ValueError, a.broadcast_to, (3, 2))
+
+    def test_partial_of_transpose(self):
+        a = Tensor([[[1.0, 2.0], [3.0, 4.0]], [[5.0, 6.0], [7.0, 8.0]]])
+        b = a.transpose((2, 0, 1)).partial((1, 0, 0), (2, 2, 2))
+        self.assertEqual((1, 2, 2), b.getShape())
+        self.assertEqual([2.0, 4.0, 6.0, 8.0], b.getData())
+        self.assertRaises(IndexError, a.partial, (0, 0, 0), (3, 1, 1))
+
+    def test_elementwise_operations(self):
+        a = Tensor([[1.0, 4.0], [9.0, 2.0]])
+        b = Tensor([2.0, 3.0])
+        self.assertEqual([0.5, 4.0 / 3.0, 4.5, 2.0 / 3.0], a.divide(b).getData())
+        self.assertEqual([2.0, 4.0, 9.0, 3.0], a.maximum(b).getData())
+        self.assertEqual([1.0, 3.0, 2.0, 2.0], a.minimum(b).getData())
+        self.assertEqual([1.0, 64.0, 81.0, 8.0], a.power(b).getData())
+        self.assertEqual([3.0, 7.0, 11.0, 5.0], a.elementwise(b, lambda x, y: x + y).getData())
+
+    def test_elementwise_bias(self):
+        batch = Tensor([float(i) for i in range(12)], (4, 3))
+        bias = Tensor([10.0, 20.0, 30.0], (1, 3))
+        result = batch.add(bias)
+        self.assertEqual((4, 3), result.getShape())
+        self.assertEqual([10.0, 21.0, 32.0, 13.0, 24.0, 35.0, 16.0, 27.0, 38.0, 19.0, 30.0, 41.0], result.getData())
+
+    def test_elementwise_views(self):
+        a = Tensor([float(i) for i in range(24)], (2, 3, 4))
+        b = Tensor([float(i) for i in range(12)], (4, 3)).transpose()
+        result = a.subtract(b)
+        self.assertEqual((2, 3, 4), result.getShape())
+        for i in range(2):
+            for j in range(3):
+                for k in range(4):
+                    self.assertEqual(a.getValue((i, j, k)) - b.getValue((j, k)), result.getValue((i, j, k)))
+        c = Tensor([1.0, 2.0], (2, 1, 1))
+        result = a.partial((0, 1, 0), (2, 3, 4)).hadamardProduct(c)
+        self.assertEqual((2, 2, 4), result.getShape())
+        self.assertEqual(2 * a.getValue((1, 2, 3)), result.getValue((1, 1, 3)))
+        self.assertRaises(ValueError, a.add, Tensor([1.0, 2.0]))
+
+    def test_sum_mean(self):
+        a = Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assertEqual([5.0, 7.0, 9.0], a.sum(0).getData())
+        self.assertEqual([6.0, 15.0], a.sum(1).getData())
+        self.assertEqual((2, 1), a.sum(-1, keepdims=True).getShape())
+        self.assertEqual(21.0, a.sum().getValue(()))
+        self.assertEqual([2.5, 3.5, 4.5], a.mean(0).getData())
+        self.assertEqual([2.0, 5.0], a.transpose().mean(0).getData())
+        self.assertRaises(ValueError, a.sum, 2)
+
+    def test_max_min_argmax(self):
+        a = Tensor([[[1.0, 9.0], [3.0, 4.0]], [[8.0, 2.0], [7.0, 7.0]]])
+        self.assertEqual([8.0, 9.0, 7.0, 7.0], a.max(0).getData())
+        self.assertEqual([1.0, 3.0, 2.0, 7.0], a.min(2).getData())
+        self.assertEqual([1, 1, 0, 0], a.argmax(2).getData())
+        self.assertEqual([1, 0, 0, 1], a.argmax(1).getData())
+        self.assertEqual(1, a.argmax().getValue(()))
+
+    def test_var(self):
+        a = Tensor([[1.0, 2.0], [3.0, 6.0]])
+        self.assertEqual([1.0, 4.0], a.var(0).getData())
+        self.assertEqual([0.25, 2.25], a.var(1).getData())
+        self.assertAlmostEqual(3.5, a.var().getValue(()), 10)
+
+    def test_logsumexp_softmax(self):
+        a = Tensor([[1.0, 2.0, 3.0], [1000.0, 1000.0, 1000.0]])
+        result = a.logsumexp(1)
+        self.assertAlmostEqual(math.log(math.exp(1) + math.exp(2) + math.exp(3)), result.getValue((0,)), 10)
+        self.assertAlmostEqual(1000.0 + math.log(3.0), result.getValue((1,)), 10)
+        softmax = a.softmax()
+        self.assertEqual((2, 3), softmax.getShape())
+        for i in range(3):
+            self.assertAlmostEqual(1.0 / 3.0, softmax.getValue((1, i)), 10)
+        self.assertAlmostEqual(1.0, sum(softmax.get((0,)).getData()), 10)
+        columns = a.softmax(0)
+        self.assertAlmostEqual(1.0, columns.getValue((1, 2)), 10)
+        self.assertAlmostEqual(0.0, columns.getValue((0, 2)), 10)
+
 if __name__ == "__main__":
     unittest.main()
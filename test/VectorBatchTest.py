@@ -0,0 +1,88 @@
+import math
+import unittest
+
+from Math.Backend import Backend
+from Math.Vector import Vector
+from Math.VectorBatch import VectorBatch
+from Math.VectorSizeMismatch import VectorSizeMismatch
+
+
+class VectorBatchTest(unittest.TestCase):
+    backend = Backend.PYTHON
+
+    def setUp(self):
+        self.previousBackend = Backend.getBackend()
+        Backend.setBackend(self.backend)
+        self.vectors = [Vector([math.sin(i * 10 + j) for j in range(10)]) for i in range(20)]
+        self.batch = VectorBatch(self.vectors)
+        self.query = Vector([math.cos(j) for j in range(10)])
+
+    def tearDown(self):
+        Backend.setBackend(self.previousBackend)
+
+    def test_Construction(self):
+        self.assertEqual(20, self.batch.size())
+        self.assertEqual(10, self.batch.getVectorSize())
+        self.assertEqual(self.vectors[3].getValue(4), self.batch.getValue(3, 4))
+        self.assertEqual(self.vectors[5].getValue(9), self.batch.getVector(5).getValue(9))
+        self.assertRaises(VectorSizeMismatch, self.batch.add, Vector(3, 0.0))
+        self.assertRaises(IndexError, self.batch.getVector, 20)
+        empty = VectorBatch(vectorSize=4)
+        empty.add(Vector(4, 1.0))
+        self.assertEqual(1, empty.size())
+
+    def test_DotProducts(self):
+        result = self.batch.dotProducts(self.query)
+        self.assertEqual(20, result.size())
+        for i in range(20):
+            self.assertAlmostEqual(self.vectors[i].dotProduct(self.query), result.getValue(i), 10)
+        self.assertRaises(VectorSizeMismatch, self.batch.dotProducts, Vector(3, 0.0))
+
+    def test_L2Norms(self):
+        result = self.batch.l2Norms()
+        for i in range(20):
+            self.assertAlmostEqual(self.vectors[i].l2Norm(), result.getValue(i), 10)
+
+    def test_CosineSimilarities(self):
+        result = self.batch.cosineSimilarities(self.query)
+        for i in range(20):
+            self.assertAlmostEqual(self.vectors[i].cosineSimilarity(self.query), result.getValue(i), 10)
+
+    def test_PairwiseCosineSimilarities(self):
+        result = self.batch.pairwiseCosineSimilarities()
+        self.assertEqual(20, result.getRow())
+        self.assertTrue(result.isSymmetric())
+        for i in range(20):
+            self.assertAlmostEqual(1.0, result.getValue(i, i), 10)
+            for j in range(20):
+                self.assertAlmostEqual(self.vectors[i].cosineSimilarity(self.vectors[j]), result.getValue(i, j), 10)
+
+    def test_Activations(self):
+        for activation in ("sigmoid", "tanh", "relu"):
+            batch = VectorBatch(self.vectors)
+            getattr(batch, activation)()
+            for i in range(20):
+                expected = Vector([self.vectors[i].getValue(j) for j in range(10)])
+                getattr(expected, activation)()
+                for j in range(10):
+                    self.assertAlmostEqual(expected.getValue(j), batch.getValue(i, j), 10)
+
+    def test_ToMatrix(self):
+        matrix = self.batch.toMatrix()
+        self.assertEqual(20, matrix.getRow())
+        self.assertEqual(10, matrix.getColumn())
+        self.assertEqual(self.vectors[7].getValue(2), matrix.getValue(7, 2))
+        self.assertEqual(self.vectors[19].getValue(9), matrix.getValue(19, 9))
+
+    def test_PairwiseCosineSimilaritiesZeroNorm(self):
+        batch = VectorBatch(self.vectors[:3] + [Vector(10, 0.0)])
+        self.assertRaises(ZeroDivisionError, batch.pairwiseCosineSimilarities)
+
+
+@unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+class VectorBatchNumpyTest(VectorBatchTest):
+    backend = Backend.NUMPY
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import math
+import unittest
+
+from Math.Backend import Backend
+from Math.Vector import Vector
+from Math.VectorIndex import VectorIndex
+from Math.VectorSizeMismatch import VectorSizeMismatch
+
+
+class VectorIndexTest(unittest.TestCase):
+    backend = Backend.PYTHON
+
+    def setUp(self):
+        self.previousBackend = Backend.getBackend()
+        Backend.setBackend(self.backend)
+        self.vectors = [Vector([math.sin(i * 16 + j) * (1 + i % 3) for j in range(16)]) for i in range(300)]
+        self.keys = ["word" + str(i) for i in range(300)]
+        self.query = Vector([math.cos(j) for j in range(16)])
+
+    def tearDown(self):
+        Backend.setBackend(self.previousBackend)
+
+    def bruteForce(self, query: Vector, k: int) -> list:
+        similarities = [(self.keys[i], self.vectors[i].cosineSimilarity(query)) for i in range(300)]
+        similarities.sort(key=lambda pair: -pair[1])
+        return similarities[:k]
+
+    def test_Exact(self):
+        index = VectorIndex(16)
+        index.addAll(self.vectors, self.keys)
+        self.assertEqual(300, index.size())
+        self.assertAlmostEqual(self.vectors[5].l2Norm(), index.getNorm(5), 10)
+        result = index.topK(self.query, 10)
+        expected = self.bruteForce(self.query, 10)
+        self.assertEqual([key for key, _ in expected], [key for key, _ in result])
+        for (_, expectedSimilarity), (_, similarity) in zip(expected, result):
+            self.assertAlmostEqual(expectedSimilarity, similarity, 10)
+
+    def test_ExactBlocks(self):
+        blockSize = VectorIndex.BLOCK_SIZE
+        VectorIndex.BLOCK_SIZE = 7
+        try:
+            index = VectorIndex(16)
+            index.addAll(self.vectors)
+            self.assertEqual([i for i, _ in index.topK(self.query, 25)],
+                             [int(key[4:]) for key, _ in self.bruteForce(self.query, 25)])
+        finally:
+            VectorIndex.BLOCK_SIZE = blockSize
+
+    def test_EdgeCases(self):
+        index = VectorIndex(16)
+        self.assertEqual([], index.topK(self.query, 3))
+        index.addAll(self.vectors[:2])
+        self.assertEqual(2, len(index.topK(self.query, 5)))
+        self.assertEqual([], index.topK(self.query, 0))
+        self.assertRaises(VectorSizeMismatch, index.topK, Vector(3, 1.0), 2)
+        self.assertRaises(ValueError, VectorIndex, 16, "fuzzy")
+
+    def test_Approximate(self):
+        index = VectorIndex(16, VectorIndex.APPROXIMATE, 8, 6)
+        index.addAll(self.vectors, self.keys)
+        for i in (0, 17, 123, 299):
+            key, similarity = index.topK(self.vectors[i], 1)[0]
+            self.assertAlmostEqual(1.0, similarity, 10)
+        expected = set(key for key, _ in self.bruteForce(self.query, 10))
+        found = set(key for key, _ in index.topK(self.query, 10))
+        self.assertGreaterEqual(len(expected & found), 5)
+
+
+@unittest.skipUnless(Backend.isNumpyAvailable(), "numpy is not installed")
+class VectorIndexNumpyTest(VectorIndexTest):
+    backend = Backend.NUMPY
+
+
+if __name__ == '__main__':
+    unittest.main()
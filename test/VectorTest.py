@@ -2,6 +2,7 @@ import unittest
 import math
 
 from Math.Vector import Vector
+from Math.VectorSizeMismatch import VectorSizeMismatch
 
 
 class VectorTest(unittest.TestCase):
@@ -169,6 +170,27 @@ class VectorTest(unittest.TestCase):
         similarity = self.largeVector1.cosineSimilarity(self.largeVector2)
         self.assertAlmostEqual(0.5007497, similarity, 6)
 
+    def test_Slots(self):
+        self.assertFalse(hasattr(self.smallVector1, "__dict__"))
+        self.assertEqual("[2, 3, 4, 5, 6]", repr(self.smallVector1))
+
+    def test_AddVectorOut(self):
+        out = Vector(5, 0.0)
+        self.smallVector1.addVector(self.smallVector2, out=out)
+        self.assertEqual(50, out.sumOfElements())
+        self.assertEqual(20, self.smallVector1.sumOfElements())
+        self.smallVector1.subtract(self.smallVector2, out=out)
+        self.assertEqual(-10, out.sumOfElements())
+        self.assertEqual(20, self.smallVector1.sumOfElements())
+
+    def test_ProductOut(self):
+        out = Vector(5, 0.0)
+        self.assertIs(out, self.smallVector1.elementProduct(self.smallVector2, out=out))
+        self.assertEqual(110, out.sumOfElements())
+        self.assertIs(out, self.smallVector1.product(7.0, out=out))
+        self.assertEqual(140, out.sumOfElements())
+        self.assertRaises(VectorSizeMismatch, self.smallVector1.product, 7.0, Vector(4, 0.0))
+
 
 if __name__ == '__main__':
     unittest.main()